@@ -0,0 +1,65 @@
+"""
+Throughput benchmark for the board encoders.
+
+Plays a few random games to collect positions and reports how many positions per second each encoder
+handles, both one state at a time (encode) and in one call (encode_batch).
+
+    poetry run python benchmarks/bench_encoders.py --board-size 19 --num-games 4
+"""
+
+import argparse
+import random
+import time
+
+from dlgo.agent.random_bot import RandomBot
+from dlgo.encoders.base import get_encoder_by_name
+from dlgo.gamestate import GameState
+
+ENCODERS = ["oneplane", "sevenplane", "elevenplane", "alphago"]
+
+
+def collect_positions(board_size, num_games, max_moves):
+    bot = RandomBot()
+    positions = []
+    for _ in range(num_games):
+        game = GameState.new_game(board_size)
+        num_moves = 0
+        while not game.is_over() and num_moves < max_moves:
+            positions.append(game)
+            game = game.apply_move(bot.select_move(game))
+            num_moves += 1
+    return positions
+
+
+def measure(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--board-size", "-b", type=int, default=19)
+    parser.add_argument("--num-games", "-n", type=int, default=2)
+    parser.add_argument("--max-moves", "-m", type=int, default=200)
+    parser.add_argument("--repeat", "-r", type=int, default=3)
+    parser.add_argument("--encoders", nargs="+", default=ENCODERS)
+    args = parser.parse_args()
+
+    random.seed(1234)
+    positions = collect_positions(args.board_size, args.num_games, args.max_moves)
+    print(f"{len(positions)} positions on a {args.board_size}x{args.board_size} board")
+    print(f"{'encoder':<12} {'planes':>6} {'encode pos/s':>14} {'batch pos/s':>14}")
+
+    for name in args.encoders:
+        encoder = get_encoder_by_name(name, args.board_size)
+        single = measure(lambda: [encoder.encode(state) for state in positions], args.repeat)
+        batch = measure(lambda: encoder.encode_batch(positions), args.repeat)
+        print(f"{name:<12} {encoder.shape()[0]:>6} {len(positions) / single:>14.0f} {len(positions) / batch:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
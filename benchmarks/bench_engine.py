@@ -0,0 +1,265 @@
+"""
+Benchmark suite for the core engine operations, with stored baselines.
+
+Times placing stones, capturing a large group, GameState.apply_move, legal_moves, is_valid_move,
+evaluate_territory, OnePlaneEncoder.encode, random playouts and MCTSAgent.select_move on every board size, and
+reports the time per operation (the best of --repeat runs). Every run is seeded, so it does the same work each time.
+
+    poetry run python benchmarks/bench_engine.py --sizes 9 13 19
+    poetry run python benchmarks/bench_engine.py --save-baseline benchmarks/baselines/engine.json
+    poetry run python benchmarks/bench_engine.py --compare benchmarks/baselines/engine.json --threshold 0.25
+
+With --compare, the run exits with status 1 if any benchmark is more than --threshold (a fraction) slower than its
+baseline. Timings only compare on the same machine, so save a baseline on the machine that runs the comparison.
+"""
+
+import argparse
+import copy
+import json
+import platform
+import random
+import sys
+import time
+
+from dlgo.agent.mcts_agent import MCTSAgent
+from dlgo.agent.random_bot import RandomBot
+from dlgo.board import Board
+from dlgo.encoders.oneplane import OnePlaneEncoder
+from dlgo.gamestate import GameState
+from dlgo.gotypes import Player, Point
+from dlgo.move import Move
+from dlgo.scoring import evaluate_territory
+
+SEED = 1234
+
+
+def play_random_game(board_size, max_moves=None):
+    """Play a random game and return its states, from the empty board to the last position, and moves."""
+    bot = RandomBot()
+    game = GameState.new_game(board_size)
+    states, moves = [game], []
+    while not game.is_over() and (max_moves is None or len(moves) < max_moves):
+        move = bot.select_move(game)
+        game = game.apply_move(move)
+        states.append(game)
+        moves.append(move)
+    return states, moves
+
+
+def bench_place_stone(board_size, args):
+    states, moves = play_random_game(board_size)
+    stones = [(state.next_player, move.point) for state, move in zip(states, moves) if move.is_play]
+
+    def run():
+        # Replays the game's stones, captures included, on a bare Board.
+        board = Board(board_size, board_size)
+        for player, point in stones:
+            board.place_stone(player, point)
+
+    return run, len(stones)
+
+
+def capture_position(board_size):
+    """A board where black's next stone at (board_size - 1, 1) captures a white block of board_size - 2 full rows."""
+    board = Board(board_size, board_size)
+    for row in range(1, board_size - 1):
+        for col in range(1, board_size + 1):
+            board.place_stone(Player.white, Point(row, col))
+    for col in range(2, board_size + 1):
+        board.place_stone(Player.black, Point(board_size - 1, col))
+    return board
+
+
+def bench_capture_large_group(board_size, args):
+    position = capture_position(board_size)
+    count = 20
+    boards = []
+
+    def run():
+        for board in boards:
+            board.place_stone(Player.black, Point(board_size - 1, 1))
+
+    def setup():
+        # Copying the board is not part of the timing.
+        boards[:] = [copy.deepcopy(position) for _ in range(count)]
+
+    return run, count, setup
+
+
+def bench_apply_move(board_size, args):
+    _, moves = play_random_game(board_size)
+
+    def run():
+        game = GameState.new_game(board_size)
+        for move in moves:
+            game = game.apply_move(move)
+
+    return run, len(moves)
+
+
+def sample_positions(board_size, count=20):
+    states, _ = play_random_game(board_size)
+    step = max(1, len(states) // count)
+    return states[::step][:count]
+
+
+def bench_legal_moves(board_size, args):
+    positions = sample_positions(board_size)
+
+    def run():
+        for game in positions:
+            game.legal_moves()
+
+    return run, len(positions)
+
+
+def bench_is_valid_move(board_size, args):
+    positions = sample_positions(board_size, count=5)
+    moves = [Move.play(Point(row, col)) for row in range(1, board_size + 1) for col in range(1, board_size + 1)]
+
+    def run():
+        for game in positions:
+            for move in moves:
+                game.is_valid_move(move)
+
+    return run, len(positions) * len(moves)
+
+
+def bench_evaluate_territory(board_size, args):
+    boards = [play_random_game(board_size)[0][-1].board for _ in range(3)]
+
+    def run():
+        for board in boards:
+            evaluate_territory(board)
+
+    return run, len(boards)
+
+
+def bench_oneplane_encode(board_size, args):
+    positions = sample_positions(board_size, count=50)
+    encoder = OnePlaneEncoder((board_size, board_size))
+
+    def run():
+        for game in positions:
+            encoder.encode(game)
+
+    return run, len(positions)
+
+
+def bench_random_playout(board_size, args):
+    def run():
+        for _ in range(args.playouts):
+            play_random_game(board_size)
+
+    return run, args.playouts
+
+
+def bench_mcts_select_move(board_size, args):
+    agent = MCTSAgent(num_rounds=args.mcts_rounds, temperature=1.5)
+    game = GameState.new_game(board_size)
+
+    def run():
+        agent.select_move(game)
+
+    return run, 1
+
+
+BENCHMARKS = {
+    "place_stone": bench_place_stone,
+    "capture_large_group": bench_capture_large_group,
+    "apply_move": bench_apply_move,
+    "legal_moves": bench_legal_moves,
+    "is_valid_move": bench_is_valid_move,
+    "evaluate_territory": bench_evaluate_territory,
+    "oneplane_encode": bench_oneplane_encode,
+    "random_playout": bench_random_playout,
+    "mcts_select_move": bench_mcts_select_move,
+}
+
+
+def measure(name, board_size, args):
+    """Return the best time per operation, in seconds, over args.repeat seeded runs."""
+    random.seed(SEED)
+    run, count, *setup = BENCHMARKS[name](board_size, args)
+    best = float("inf")
+    for _ in range(args.repeat):
+        if setup:
+            setup[0]()
+        random.seed(SEED)
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best / count
+
+
+def format_time(seconds):
+    for unit, scale in [("s", 1), ("ms", 1e-3), ("us", 1e-6)]:
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def compare(results, baseline, threshold):
+    """Return the (key, seconds, baseline seconds) of the results more than threshold slower than their baseline."""
+    return [
+        (key, seconds, baseline[key]) for key, seconds in results.items() if key in baseline and seconds > baseline[key] * (1 + threshold)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the core engine operations and compare them with a baseline")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[9, 13, 19])
+    parser.add_argument("--benchmarks", nargs="+", choices=list(BENCHMARKS), default=list(BENCHMARKS))
+    parser.add_argument("--repeat", "-r", type=int, default=3)
+    parser.add_argument("--playouts", type=int, default=2, help="Random games per random_playout run")
+    parser.add_argument("--mcts-rounds", type=int, default=10, help="Rounds of the MCTSAgent search")
+    parser.add_argument("--save-baseline", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="Compare the results with this baseline file")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown against the baseline")
+    args = parser.parse_args()
+
+    settings = {"repeat": args.repeat, "playouts": args.playouts, "mcts_rounds": args.mcts_rounds}
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            saved = json.load(f)
+        baseline = saved["results"]
+        if saved.get("settings") != settings:
+            print(f"Warning: the baseline was measured with {saved.get('settings')}, this run uses {settings}")
+
+    results = {}
+    print(f"{'benchmark':<20} {'size':>5} {'time/op':>10} {'baseline':>10} {'change':>8}")
+    for name in args.benchmarks:
+        for board_size in args.sizes:
+            key = f"{name}/{board_size}"
+            results[key] = seconds = measure(name, board_size, args)
+            line = f"{name:<20} {board_size:>5} {format_time(seconds):>10}"
+            if key in baseline:
+                line += f" {format_time(baseline[key]):>10} {seconds / baseline[key] - 1:>+8.1%}"
+            print(line, flush=True)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "processor": platform.processor(),
+                    "settings": settings,
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+        print(f"Saved the results to {args.save_baseline}")
+
+    regressions = compare(results, baseline, args.threshold)
+    for key, seconds, before in regressions:
+        print(f"REGRESSION {key}: {format_time(seconds)} against {format_time(before)} ({seconds / before - 1:+.1%})")
+    if args.compare:
+        print(f"{len(regressions)} of {len(results)} benchmarks are more than {args.threshold:.0%} slower than the baseline")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""
+Benchmark for replaying stored games.
+
+Plays a few random games, then replays their move lists with GameState.apply_move and with the trusted single-board
+replay of dlgo.replay, and reports the time per move of each.
+
+    poetry run python benchmarks/bench_replay.py --board-size 19 --num-games 4
+"""
+
+import argparse
+import random
+import time
+
+from dlgo.agent.random_bot import RandomBot
+from dlgo.gamestate import GameState
+from dlgo.replay import alternate, replay_moves
+
+
+def play_games(board_size, num_games, max_moves):
+    bot = RandomBot()
+    games = []
+    for _ in range(num_games):
+        game = GameState.new_game(board_size)
+        moves = []
+        while not game.is_over() and len(moves) < max_moves:
+            move = bot.select_move(game)
+            moves.append(move)
+            game = game.apply_move(move)
+        games.append(moves)
+    return games
+
+
+def apply_moves(board_size, moves):
+    game = GameState.new_game(board_size)
+    for move in moves:
+        game = game.apply_move(move)
+
+
+def replay(board_size, moves):
+    for _ in replay_moves(alternate(moves), board_size):
+        pass
+
+
+def measure(fn, games, board_size, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for moves in games:
+            fn(board_size, moves)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--board-size", "-b", type=int, default=19)
+    parser.add_argument("--num-games", "-n", type=int, default=4)
+    parser.add_argument("--max-moves", "-m", type=int, default=300)
+    parser.add_argument("--repeat", "-r", type=int, default=3)
+    args = parser.parse_args()
+
+    random.seed(1234)
+    games = play_games(args.board_size, args.num_games, args.max_moves)
+    num_moves = sum(len(moves) for moves in games)
+    print(f"{num_moves} moves in {len(games)} games on a {args.board_size}x{args.board_size} board")
+
+    for name, fn in [("apply_move", apply_moves), ("replay_moves", replay)]:
+        elapsed = measure(fn, games, args.board_size, args.repeat)
+        print(f"{name:<14} {elapsed / num_moves * 1e6:>8.1f} us/move")
+
+
+if __name__ == "__main__":
+    main()
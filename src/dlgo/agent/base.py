@@ -17,3 +17,7 @@ class Agent:
 
     def select_move(self, game_state):
         raise NotImplementedError()
+
+    def set_time_budget(self, seconds):
+        """Limit the time the next select_move calls may spend, or lift the limit with None. Agents that don't search ignore it."""
+        pass
@@ -33,3 +33,66 @@ def is_point_an_eye(board: Board, point: Point, color):
     if off_board_corners > 0:
         return off_board_corners + friendly_corners == 4
     return friendly_corners >= 3
+
+
+def is_same_position(game_state, other):
+    """
+    True if two game states show the same position to the same player after the same move, e.g. a node of an
+    earlier search tree and the current state of the game.
+    """
+    return (
+        game_state.next_player == other.next_player
+        and game_state.last_move == other.last_move
+        and game_state.board.zobrist_hash() == other.board.zobrist_hash()
+    )
+
+
+class TreeSearchMixin:
+    """
+    What the tree search agents (MCTSAgent, PUCTAgent) share besides the search itself: the time budget, the reuse
+    of the last search's tree, and the SearchStats (see dlgo.agent.search_stats) of every search, kept as last_stats
+    and handed to the listeners added with add_stats_listener.
+
+    Agents call init_tree_search from __init__, implement node_children, and call keep_tree and record_stats at the
+    end of every search.
+    """
+
+    def init_tree_search(self, reuse_tree):
+        self.reuse_tree = reuse_tree
+        self.time_budget = None
+        self._root = None
+        # The SearchStats of the last search, also handed to every listener (see add_stats_listener).
+        self.last_stats = None
+        self.stats_listeners = []
+
+    def set_time_budget(self, seconds):
+        self.time_budget = seconds
+
+    def node_children(self, node):
+        """The child nodes of a search tree node."""
+        raise NotImplementedError()
+
+    def add_stats_listener(self, listener):
+        """Hand the SearchStats of every search to listener.record, e.g. a SearchMetrics or a SearchLog."""
+        self.stats_listeners.append(listener)
+
+    def record_stats(self, stats):
+        self.last_stats = stats
+        for listener in self.stats_listeners:
+            listener.record(stats)
+
+    def keep_tree(self, root):
+        """Keep root for the next search if reuse_tree is set."""
+        self._root = root if self.reuse_tree else None
+
+    def reused_root(self, game_state):
+        """Find game_state within two moves of the last search's root and detach it as the root of a new search."""
+        old_root, self._root = self._root, None
+        frontier = [] if old_root is None else [old_root]
+        for _ in range(3):
+            for node in frontier:
+                if is_same_position(node.game_state, game_state):
+                    node.parent = None
+                    return node
+            frontier = [child for node in frontier for child in self.node_children(node)]
+        return None
@@ -0,0 +1,44 @@
+"""
+This file is based on code from the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+Original code repository: https://github.com/maxpumperla/deep_learning_and_the_game_of_go
+
+The code may have been modified and adapted for educational purposes.
+"""
+
+from dlgo.agent.base import Agent
+from dlgo.move import Move
+from dlgo.utils import point_from_coords
+
+
+def parse_move(text, board):
+    """Parse a move typed by a player: coordinates like D4, "pass" or "resign". Returns None if it is not one."""
+    text = text.strip().upper()
+    if text == "PASS":
+        return Move.pass_turn()
+    if text == "RESIGN":
+        return Move.resign()
+    try:
+        point = point_from_coords(text)
+    except (ValueError, IndexError):
+        return None
+    if not (1 <= point.row <= board.num_rows and 1 <= point.col <= board.num_cols):
+        return None
+    return Move.play(point)
+
+
+class HumanAgent(Agent):
+    """Asks for moves on the console, repeating the question until a legal move is given."""
+
+    def __init__(self, input_fn=input, output_fn=print):
+        Agent.__init__(self)
+        self.input_fn = input_fn
+        self.output_fn = output_fn
+
+    def select_move(self, game_state):
+        while True:
+            text = self.input_fn("-- ")
+            move = parse_move(text, game_state.board)
+            if move is not None and game_state.is_valid_move(move):
+                return move
+            self.output_fn(f"Illegal move {text.strip()!r}, enter a point like D4, pass or resign")
@@ -7,11 +7,14 @@ The code may have been modified and adapted for educational purposes.
 """
 
 import math
+import time
 from typing import List
 
 from dlgo.agent import base
+from dlgo.agent.helpers import TreeSearchMixin
 from dlgo.agent.mcts_node import MCTSNode
 from dlgo.agent.random_bot import RandomBot
+from dlgo.agent.search_stats import SearchStats, count_nodes
 from dlgo.gamestate import GameState
 from dlgo.gotypes import Player
 
@@ -25,11 +28,26 @@ def uct_score(parent_rollouts, child_rollouts, win_pct, temperature):
     return win_pct + temperature * exploration
 
 
-class MCTSAgent(base.Agent):
-    def __init__(self, num_rounds: int = 1000, temperature: float = 0.8):
+class MCTSAgent(TreeSearchMixin, base.Agent):
+    """
+    Monte Carlo tree search with random rollouts.
+
+    Each search runs num_rounds rounds, or fewer if a time budget is set (see set_time_budget). With reuse_tree, the
+    tree of the last search is kept, and a following search from a position it contains (the same position, or one
+    or two moves later) continues from that subtree instead of starting over.
+
+    Every search records its rounds, tree size, depth and the time spent per phase in a SearchStats (see
+    dlgo.agent.search_stats), kept as last_stats and handed to the listeners added with add_stats_listener.
+    """
+
+    def __init__(self, num_rounds: int = 1000, temperature: float = 0.8, reuse_tree: bool = False):
         base.Agent.__init__(self)
         self.num_rounds = num_rounds
         self.temperature = temperature
+        self.init_tree_search(reuse_tree)
+
+    def node_children(self, node: MCTSNode) -> List[MCTSNode]:
+        return node.children
 
     def pick_best_move(self, children: List[MCTSNode], next_player: Player):
         # Pick a move after having done num_rounds
@@ -44,27 +62,60 @@ class MCTSAgent(base.Agent):
         return best_move
 
     def select_move(self, game_state: GameState):
-        root = MCTSNode(game_state)
+        root = self.search(game_state)
+        return self.pick_best_move(root.children, game_state.next_player)
+
+    def search(self, game_state: GameState) -> MCTSNode:
+        """Run num_rounds rounds of MCTS from game_state and return the root of the search tree."""
+        start = time.perf_counter()
+        stats = SearchStats(type(self).__name__, ("select", "expand", "rollout", "backup"))
+        root = self.reused_root(game_state)
+        if root is None:
+            root = MCTSNode(game_state)
+        else:
+            stats.reused_nodes = count_nodes(root, self.node_children)
+        deadline = None if self.time_budget is None else start + self.time_budget
+        phase_seconds = stats.phase_seconds
 
         # MCTS Search
         for i in range(self.num_rounds):
+            round_start = time.perf_counter()
+            if deadline is not None and i > 0 and round_start >= deadline:
+                break
             node = root
+            depth = 0
 
             # Traverse the tree until a leaf is found
             while (not node.can_add_child()) and (not node.is_terminal()):
                 node = self.select_child(node.children, node.game_state.next_player, self.temperature)
+                depth += 1
+            selected = time.perf_counter()
 
             # After a leaf has been found, add a new node.
             if node.can_add_child():
                 node = node.add_random_child()
+                depth += 1
+                stats.nodes_added += 1
+            expanded = time.perf_counter()
 
             winner = self.simulate_random_game(node.game_state)
+            simulated = time.perf_counter()
             # Propagate the result upwards
             while node is not None:
                 node.record_win(winner)
                 node = node.parent  # type: ignore
 
-        return self.pick_best_move(root.children, game_state.next_player)
+            phase_seconds["select"] += selected - round_start
+            phase_seconds["expand"] += expanded - selected
+            phase_seconds["rollout"] += simulated - expanded
+            phase_seconds["backup"] += time.perf_counter() - simulated
+            stats.add_round(depth)
+
+        stats.evaluations = stats.rounds
+        self.keep_tree(root)
+        stats.seconds = time.perf_counter() - start
+        self.record_stats(stats)
+        return root
 
     def select_child(self, children: List[MCTSNode], next_player: Player, temperature: float):
         total_rollouts = sum(child.num_rollouts for child in children)
@@ -0,0 +1,135 @@
+"""
+This file is based on code from the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+Original code repository: https://github.com/maxpumperla/deep_learning_and_the_game_of_go
+
+The code may have been modified and adapted for educational purposes.
+"""
+
+import numpy as np
+import torch
+
+from dlgo.agent.base import Agent
+from dlgo.encoders.base import get_encoder_by_name
+from dlgo.encoders.features import BoardFeatures
+from dlgo.move import Move
+from dlgo.nn.batching import model_evaluator
+from dlgo.nn.models import create_model
+
+
+def candidate_mask(game_state):
+    """
+    Flat (num_points,) boolean mask of the points the player to move can sensibly play: legal moves (including the
+    ko rule) that do not fill one of their own eyes.
+    """
+    candidates = BoardFeatures(game_state).candidates
+    # Features are (rows, cols) arrays and encoders number points row by row, like a C-order ravel.
+    return (candidates.legal & candidates.sensible).ravel()
+
+
+class DeepLearningAgent(Agent):
+    """
+    Plays the move a trained PyTorch policy model likes best.
+
+    The model takes a float32 batch of positions encoded by encoder and returns one score (logit) per board point.
+    For policy-value models such as PolicyValueNet, which return (policy, value), the policy is used and its pass
+    logit ignored.
+    Illegal moves and moves that fill our own eyes are masked out; the agent passes when nothing is left. With
+    temperature 0 the best move is played, otherwise moves are sampled from softmax(scores / temperature).
+
+    select_moves evaluates many positions, e.g. one per concurrently running game, in a single forward pass. To
+    share forward passes between agents playing in different threads or processes, pass an InferenceQueue or an
+    InferenceClient (see dlgo.nn.batching) as evaluate.
+
+    With a collector set (see dlgo.rl.experience.ExperienceCollector), every move chosen from the model's scores is
+    recorded for reinforcement learning.
+    """
+
+    def __init__(self, model, encoder, device=None, temperature=0.0, evaluate=None):
+        Agent.__init__(self)
+        self.model = model
+        self.encoder = encoder
+        self.temperature = temperature
+        # Maps an encoded numpy batch to the model's numpy scores.
+        self.evaluate = model_evaluator(model, device) if evaluate is None else evaluate
+        self.collector = None
+
+    def set_collector(self, collector):
+        self.collector = collector
+
+    def predict(self, game_states):
+        """Return the model's (N, num_points) scores for a batch of positions as a numpy array."""
+        scores = self.evaluate(self.encoder.encode_batch(game_states))
+        if isinstance(scores, tuple):
+            scores = scores[0]
+        return scores[:, : self.encoder.num_points()]
+
+    def select_move(self, game_state):
+        return self.select_moves([game_state])[0]
+
+    def select_moves(self, game_states):
+        """Choose a move for every game state with one batched forward pass."""
+        game_states = list(game_states)
+        if not game_states:
+            return []
+        return [self.choose_move(game_state, scores) for game_state, scores in zip(game_states, self.predict(game_states))]
+
+    def choose_move(self, game_state, scores):
+        """Turn the model's scores for one position into a move."""
+        mask = candidate_mask(game_state)
+        if not mask.any():
+            return Move.pass_turn()
+        scores = np.where(mask, scores, -np.inf)
+        if self.temperature > 0:
+            logits = scores / self.temperature
+            probs = np.exp(logits - logits.max())
+            index = np.random.choice(len(probs), p=probs / probs.sum())
+        else:
+            index = int(np.argmax(scores))
+        if self.collector is not None:
+            self.collector.record_decision(game_state, index)
+        return Move.play(self.encoder.decode_point_index(index))
+
+    def serialize(self, path):
+        """Save the model (which must be one of dlgo.nn.models.MODELS) and the encoder settings to path."""
+        save_model(path, self.model, self.encoder)
+
+
+def save_model(path, model, encoder):
+    """Save a model from dlgo.nn.models.MODELS with its configuration and the settings of its encoder."""
+    torch.save(
+        {
+            "model": type(model).__name__,
+            "config": model.config,
+            "state_dict": model.state_dict(),
+            "encoder": encoder.name(),
+            "encoder_options": encoder.options(),
+            "board_size": [encoder.board_width, encoder.board_height],
+        },
+        path,
+    )
+
+
+def load_model(path):
+    """Restore the model and encoder saved with save_model, e.g. by DeepLearningAgent.serialize."""
+    data = torch.load(path, map_location="cpu", weights_only=True)
+    model = create_model(data["model"], **data["config"])
+    model.load_state_dict(data["state_dict"])
+    # Files saved before the options were stored used the encoders' defaults.
+    encoder = get_encoder_by_name(data["encoder"], tuple(data["board_size"]), **data.get("encoder_options", {}))
+    return model, encoder
+
+
+def load_prediction_agent(path, device=None, temperature=0.0, evaluate=None):
+    """Restore an agent saved with DeepLearningAgent.serialize."""
+    model, encoder = load_model(path)
+    return DeepLearningAgent(model, encoder, device, temperature, evaluate)
+
+
+def load_evaluator(path, device=None):
+    """
+    Build the evaluate function of a saved agent's model, e.g. as functools.partial(load_evaluator, path) for an
+    InferenceServer that loads the model in its own process.
+    """
+    model, _ = load_model(path)
+    return model_evaluator(model, device)
@@ -0,0 +1,244 @@
+"""
+This file is based on code from the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+Original code repository: https://github.com/maxpumperla/deep_learning_and_the_game_of_go
+
+The code may have been modified and adapted for educational purposes.
+"""
+
+import math
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from dlgo.agent import base
+from dlgo.agent.helpers import TreeSearchMixin
+from dlgo.agent.predict import candidate_mask, load_model, save_model
+from dlgo.agent.puct_node import PUCTNode
+from dlgo.agent.search_stats import SearchStats, count_nodes
+from dlgo.gamestate import GameState
+from dlgo.move import Move
+from dlgo.nn.batching import model_evaluator
+from dlgo.nn.cache import evaluate_with_cache
+
+# A path from the root to a leaf: the (node, move) pairs chosen on the way down.
+Path = List[Tuple[PUCTNode, Move]]
+
+
+def puct_score(parent_visits, child_visits, expected_value, prior, c_puct):
+    """AlphaGo Zero's selection score: the move's value plus an exploration bonus that follows the prior."""
+    return expected_value + c_puct * prior * math.sqrt(parent_visits) / (1 + child_visits)
+
+
+class PUCTAgent(TreeSearchMixin, base.Agent):
+    """
+    Tree search guided by a policy/value network, as in AlphaGo Zero.
+
+    The model (e.g. dlgo.nn.models.PolicyValueNet) takes a batch of positions encoded by encoder and returns
+    (policy, value): one logit per board point plus one for passing, and the expected outcome for the player to move
+    in [-1, 1]. Moves are selected with puct_score, where the policy gives each move's prior; a new leaf is valued by
+    the network instead of by playing out random games as MCTSAgent does.
+
+    Each round of the search visits one leaf. Leaves are collected in batches of batch_size and evaluated with one
+    network call; while a batch is being collected, every move on the way to a pending leaf carries a virtual loss,
+    which steers the next descents to other parts of the tree. Pass an InferenceQueue or InferenceClient (see
+    dlgo.nn.batching) as evaluate to share network calls between agents searching in parallel, and an
+    EvaluationCache (see dlgo.nn.cache) as cache to reuse the evaluations of positions met in earlier searches.
+
+    Like DeepLearningAgent, the search does not consider moves that fill the player's own eyes, and it never resigns.
+    With temperature 0 the most visited move is played, otherwise moves are sampled in proportion to
+    visit_count ** (1 / temperature).
+
+    A search stops early when its time budget runs out (see set_time_budget). With reuse_tree, the tree of the last
+    search is kept, and a following search from a position it contains (the same position, or one or two moves
+    later) continues from that subtree.
+
+    Like MCTSAgent, every search records a SearchStats (see dlgo.agent.search_stats), kept as last_stats and handed to
+    the listeners added with add_stats_listener.
+    """
+
+    def __init__(
+        self,
+        model,
+        encoder,
+        num_rounds=400,
+        c_puct=2.0,
+        batch_size=16,
+        virtual_loss=1,
+        device=None,
+        temperature=0.0,
+        evaluate=None,
+        cache=None,
+        reuse_tree=False,
+    ):
+        base.Agent.__init__(self)
+        self.model = model
+        self.encoder = encoder
+        self.num_rounds = num_rounds
+        self.c_puct = c_puct
+        self.batch_size = batch_size
+        self.virtual_loss = virtual_loss
+        self.temperature = temperature
+        # Maps an encoded numpy batch to the model's numpy (policy, value).
+        self.evaluate = model_evaluator(model, device) if evaluate is None else evaluate
+        # An optional dlgo.nn.cache.EvaluationCache, kept across searches.
+        self.cache = cache
+        self.init_tree_search(reuse_tree)
+
+    def node_children(self, node: PUCTNode) -> List[PUCTNode]:
+        return list(node.children.values())
+
+    def select_move(self, game_state: GameState):
+        root = self.search(game_state)
+        return self.pick_move(root)
+
+    def pick_move(self, root: PUCTNode) -> Move:
+        moves = root.moves()
+        if not moves:
+            # The game is already over, so there is nothing to search.
+            return Move.pass_turn()
+        visits = np.array([root.visit_count(move) for move in moves], dtype=np.float64)
+        if self.temperature > 0 and visits.sum() > 0:
+            weights = visits ** (1.0 / self.temperature)
+            return moves[np.random.choice(len(moves), p=weights / weights.sum())]
+        return moves[int(np.argmax(visits))]
+
+    def search(self, game_state: GameState) -> PUCTNode:
+        """Run num_rounds rounds of PUCT search from game_state and return the root of the search tree."""
+        start = time.perf_counter()
+        stats = SearchStats(type(self).__name__, ("select", "expand", "backup"))
+        root = self.reused_root(game_state)
+        if root is None:
+            root = self.create_nodes([game_state])[0]
+            stats.evaluations += 0 if root.is_terminal() else 1
+        else:
+            stats.reused_nodes = count_nodes(root, self.node_children)
+        if not root.is_terminal():
+            deadline = None if self.time_budget is None else start + self.time_budget
+            while stats.rounds < self.num_rounds:
+                selecting = time.perf_counter()
+                if deadline is not None and stats.rounds > 0 and selecting >= deadline:
+                    break
+                paths = [self.select_leaf(root) for _ in range(min(self.batch_size, self.num_rounds - stats.rounds))]
+                stats.phase_seconds["select"] += time.perf_counter() - selecting
+                self.expand(paths, stats)
+                for path in paths:
+                    stats.add_round(len(path))
+            self.keep_tree(root)
+        stats.seconds = time.perf_counter() - start
+        self.record_stats(stats)
+        return root
+
+    def select_branch(self, node: PUCTNode) -> Move:
+        parent_visits = node.total_visit_count
+
+        def score(move):
+            return puct_score(parent_visits, node.visit_count(move), node.expected_value(move), node.prior(move), self.c_puct)
+
+        return max(node.moves(), key=score)
+
+    def select_leaf(self, root: PUCTNode) -> Path:
+        """Descend from root to a move without a node yet (or to a finished game), adding virtual losses on the way."""
+        node = root
+        path = []
+        while True:
+            move = self.select_branch(node)
+            node.add_virtual_loss(move, self.virtual_loss)
+            path.append((node, move))
+            if not node.has_child(move):
+                return path
+            node = node.get_child(move)
+            if node.is_terminal():
+                return path
+
+    def expand(self, paths: List[Path], stats: Optional[SearchStats] = None):
+        """
+        Create the nodes at the end of paths with one batched evaluation, then back their values up the tree. The
+        new nodes and the time spent go into stats, if given.
+        """
+        expanding = time.perf_counter()
+        new_leaves = {}
+        for path in paths:
+            node, move = path[-1]
+            # Several paths of a batch can end in the same leaf, which is created once.
+            if not node.has_child(move):
+                new_leaves[(id(node), move)] = (node, move)
+        states = [node.game_state.apply_move(move) for node, move in new_leaves.values()]
+        for (node, move), child in zip(new_leaves.values(), self.create_nodes(states)):
+            child.parent = node
+            child.last_move = move
+            node.add_child(move, child)
+        backing_up = time.perf_counter()
+
+        for path in paths:
+            node, move = path[-1]
+            # Values are stored for the player to move in the child, which is the opponent of the player choosing.
+            value = -node.get_child(move).value
+            for node, move in reversed(path):
+                node.revert_virtual_loss(move, self.virtual_loss)
+                node.record_visit(move, value)
+                value = -value
+
+        if stats is not None:
+            stats.nodes_added += len(states)
+            stats.evaluations += sum(1 for state in states if not state.is_over())
+            stats.phase_seconds["expand"] += backing_up - expanding
+            stats.phase_seconds["backup"] += time.perf_counter() - backing_up
+
+    def create_nodes(self, game_states: List[GameState]) -> List[PUCTNode]:
+        """Create the search nodes for game_states, evaluating all unfinished games with one network call."""
+        nodes = [None] * len(game_states)
+        pending = []
+        for i, game_state in enumerate(game_states):
+            if game_state.is_over():
+                value = 1.0 if game_state.winner() == game_state.next_player else -1.0
+                nodes[i] = PUCTNode(game_state, value, {})
+            else:
+                pending.append(i)
+        if pending:
+            policy, values = self.evaluate_positions([game_states[i] for i in pending])
+            for i, logits, value in zip(pending, policy, values):
+                nodes[i] = PUCTNode(game_states[i], float(value), self.priors(game_states[i], logits))
+        return nodes
+
+    def evaluate_positions(self, game_states: List[GameState]):
+        """Return the network's (policy, values) for game_states, through the cache if there is one."""
+        if self.cache is None:
+            return self.evaluate(self.encoder.encode_batch(game_states))
+        return evaluate_with_cache(self.cache, self.encoder, self.evaluate, game_states)
+
+    def priors(self, game_state: GameState, logits):
+        """Turn the policy logits for one position into prior probabilities of the moves worth searching."""
+        # The last logit is for passing, which is always allowed.
+        mask = np.append(candidate_mask(game_state), True)
+        indices = np.flatnonzero(mask)
+        logits = logits[indices]
+        probs = np.exp(logits - logits.max())
+        probs /= probs.sum()
+        num_points = self.encoder.num_points()
+        return {self.decode_move(index, num_points): float(prob) for index, prob in zip(indices, probs)}
+
+    def decode_move(self, index, num_points):
+        if index == num_points:
+            return Move.pass_turn()
+        return Move.play(self.encoder.decode_point_index(int(index)))
+
+    def visit_counts(self, root: PUCTNode):
+        """Visit counts of the root's moves as a (num_points + 1,) array, in the layout of the policy output."""
+        num_points = self.encoder.num_points()
+        counts = np.zeros(num_points + 1, dtype=np.int64)
+        for move in root.moves():
+            index = num_points if move.is_pass else self.encoder.encode_point(move.point)
+            counts[index] = root.visit_count(move)
+        return counts
+
+    def serialize(self, path):
+        """Save the model and the encoder settings to path; restore them with load_puct_agent."""
+        save_model(path, self.model, self.encoder)
+
+
+def load_puct_agent(path, **kwargs):
+    """Restore an agent saved with PUCTAgent.serialize; kwargs set the search parameters (see PUCTAgent)."""
+    model, encoder = load_model(path)
+    return PUCTAgent(model, encoder, **kwargs)
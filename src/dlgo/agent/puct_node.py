@@ -0,0 +1,99 @@
+"""
+This file is based on code from the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+Original code repository: https://github.com/maxpumperla/deep_learning_and_the_game_of_go
+
+The code may have been modified and adapted for educational purposes.
+"""
+
+from typing import Dict, List, Optional
+
+from dlgo.gamestate import GameState
+from dlgo.move import Move
+
+
+class Branch(object):
+    """Statistics of one move from a node: its prior probability, how often it was visited and the summed values."""
+
+    __slots__ = ("prior", "visit_count", "total_value")
+
+    def __init__(self, prior: float):
+        self.prior = prior
+        self.visit_count = 0
+        self.total_value = 0.0
+
+
+class PUCTNode(object):
+    """
+    A position in a PUCT search tree (see dlgo.agent.puct_agent).
+
+    value is the network's estimate of the position for game_state.next_player, and priors maps every move that is
+    searched from here to its prior probability. The branch statistics of a move are kept in the parent node, from
+    the point of view of the player choosing the move; children are only created when a move is first visited.
+    """
+
+    def __init__(
+        self,
+        game_state: GameState,
+        value: float,
+        priors: Dict[Move, float],
+        parent: Optional["PUCTNode"] = None,
+        last_move: Optional[Move] = None,
+    ):
+        self.game_state = game_state
+        self.value = value
+        self.parent = parent
+        self.last_move = last_move
+        # The node's own evaluation counts as its first visit.
+        self.total_visit_count = 1
+        self.branches = {move: Branch(prior) for move, prior in priors.items()}
+        self.children: Dict[Move, "PUCTNode"] = {}
+
+    def moves(self) -> List[Move]:
+        return list(self.branches)
+
+    def add_child(self, move: Move, child_node: "PUCTNode"):
+        self.children[move] = child_node
+
+    def has_child(self, move: Move) -> bool:
+        return move in self.children
+
+    def get_child(self, move: Move) -> "PUCTNode":
+        return self.children[move]
+
+    def is_terminal(self) -> bool:
+        return self.game_state.is_over()
+
+    def expected_value(self, move: Move) -> float:
+        branch = self.branches[move]
+        if branch.visit_count == 0:
+            return 0.0
+        return branch.total_value / branch.visit_count
+
+    def prior(self, move: Move) -> float:
+        return self.branches[move].prior
+
+    def visit_count(self, move: Move) -> int:
+        if move in self.branches:
+            return self.branches[move].visit_count
+        return 0
+
+    def record_visit(self, move: Move, value: float):
+        """Add the value of a search through move, for the player choosing it."""
+        self.total_visit_count += 1
+        self.branches[move].visit_count += 1
+        self.branches[move].total_value += value
+
+    def add_virtual_loss(self, move: Move, amount: float):
+        """
+        Count amount pending lost visits through move, so that the other searches of a batch spread out over other
+        branches while the leaf below move waits for its evaluation.
+        """
+        self.total_visit_count += amount
+        self.branches[move].visit_count += amount
+        self.branches[move].total_value -= amount
+
+    def revert_virtual_loss(self, move: Move, amount: float):
+        self.total_visit_count -= amount
+        self.branches[move].visit_count -= amount
+        self.branches[move].total_value += amount
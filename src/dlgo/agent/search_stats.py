@@ -0,0 +1,195 @@
+"""
+This file is based on code from the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+Original code repository: https://github.com/maxpumperla/deep_learning_and_the_game_of_go
+
+The code may have been modified and adapted for educational purposes.
+"""
+
+import json
+import os
+import threading
+import time
+
+
+class SearchStats:
+    """
+    What one tree search (one select_move call of MCTSAgent or PUCTAgent) did and where its time went.
+
+    evaluations counts the leaves valued: random games played out by MCTSAgent, network evaluations by PUCTAgent.
+    phase_seconds splits the search time by phase: "select", "expand", "rollout" and "backup" for MCTSAgent;
+    "select", "expand" (including the network evaluation) and "backup" for PUCTAgent.
+    """
+
+    def __init__(self, agent, phases):
+        self.agent = agent
+        self.timestamp = time.time()
+        self.rounds = 0
+        self.evaluations = 0
+        self.nodes_added = 0
+        # Nodes of the previous search's tree the search continued from (see reuse_tree), 0 for a new tree.
+        self.reused_nodes = 0
+        self.max_depth = 0
+        self.total_depth = 0
+        self.seconds = 0.0
+        self.phase_seconds = dict.fromkeys(phases, 0.0)
+
+    @property
+    def tree_size(self):
+        return max(self.reused_nodes, 1) + self.nodes_added
+
+    @property
+    def mean_depth(self):
+        return self.total_depth / self.rounds if self.rounds else 0.0
+
+    @property
+    def rounds_per_second(self):
+        return self.rounds / self.seconds if self.seconds > 0 else 0.0
+
+    def add_round(self, depth):
+        self.rounds += 1
+        self.total_depth += depth
+        self.max_depth = max(self.max_depth, depth)
+
+    def to_dict(self):
+        return {
+            "agent": self.agent,
+            "timestamp": self.timestamp,
+            "rounds": self.rounds,
+            "evaluations": self.evaluations,
+            "nodes_added": self.nodes_added,
+            "reused_nodes": self.reused_nodes,
+            "tree_size": self.tree_size,
+            "max_depth": self.max_depth,
+            "mean_depth": self.mean_depth,
+            "seconds": self.seconds,
+            "rounds_per_second": self.rounds_per_second,
+            "phase_seconds": dict(self.phase_seconds),
+        }
+
+    def summary(self):
+        phases = ", ".join(f"{phase} {seconds:.3f}s" for phase, seconds in self.phase_seconds.items())
+        return (
+            f"{self.agent}: {self.rounds} rounds in {self.seconds:.3f}s ({self.rounds_per_second:.0f}/s), "
+            f"tree {self.tree_size} nodes, depth {self.mean_depth:.1f} mean / {self.max_depth} max; {phases}"
+        )
+
+
+def count_nodes(root, children):
+    """The number of nodes in the tree under root, where children(node) returns a node's children."""
+    count = 0
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack.extend(children(node))
+    return count
+
+
+class SearchMetrics:
+    """
+    Accumulates the SearchStats of any number of agents (add it with agent.add_stats_listener) for monitoring.
+
+    Totals are kept per agent name and exported in the Prometheus text format by to_prometheus, e.g. for an HTTP
+    /metrics endpoint, or written to a file for the node_exporter textfile collector with write_prometheus. Search
+    throughput is then rate(dlgo_search_rounds_total[5m]). Agents may record from several threads.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._totals = {}
+        self._phase_seconds = {}
+        self._last = {}
+
+    def record(self, stats):
+        with self._lock:
+            totals = self._totals.setdefault(stats.agent, dict.fromkeys(_COUNTERS, 0))
+            totals["searches"] += 1
+            totals["rounds"] += stats.rounds
+            totals["evaluations"] += stats.evaluations
+            totals["nodes_added"] += stats.nodes_added
+            totals["seconds"] += stats.seconds
+            phase_seconds = self._phase_seconds.setdefault(stats.agent, {})
+            for phase, seconds in stats.phase_seconds.items():
+                phase_seconds[phase] = phase_seconds.get(phase, 0.0) + seconds
+            self._last[stats.agent] = stats
+
+    def totals(self, agent):
+        """The totals recorded for an agent name, as a dict of the counters (all 0 before its first search)."""
+        with self._lock:
+            return dict(self._totals.get(agent, dict.fromkeys(_COUNTERS, 0)))
+
+    def to_prometheus(self):
+        with self._lock:
+            lines = []
+            for name, (kind, help_text) in _METRICS.items():
+                lines.append(f"# HELP dlgo_search_{name} {help_text}")
+                lines.append(f"# TYPE dlgo_search_{name} {kind}")
+                for agent in sorted(self._totals):
+                    for labels, value in self._samples(name, agent):
+                        lines.append(f"dlgo_search_{name}{{{labels}}} {_format_value(value)}")
+            return "\n".join(lines) + "\n"
+
+    def _samples(self, name, agent):
+        labels = f'agent="{agent}"'
+        if name == "phase_seconds_total":
+            return [(f'{labels},phase="{phase}"', seconds) for phase, seconds in sorted(self._phase_seconds[agent].items())]
+        if name.endswith("_total"):
+            return [(labels, self._totals[agent][name[: -len("_total")]])]
+        # Gauges describe the agent's last search.
+        return [(labels, getattr(self._last[agent], name[len("last_") :]))]
+
+    def write_prometheus(self, path):
+        """Write to_prometheus to path, replacing it atomically so a collector never reads half a file."""
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w") as f:
+            f.write(self.to_prometheus())
+        os.replace(temp_path, path)
+
+
+_COUNTERS = ("searches", "rounds", "evaluations", "nodes_added", "seconds")
+
+_METRICS = {
+    "searches_total": ("counter", "Tree searches run."),
+    "rounds_total": ("counter", "Search rounds run."),
+    "evaluations_total": ("counter", "Leaves valued by random games or network evaluations."),
+    "nodes_added_total": ("counter", "Search tree nodes created."),
+    "seconds_total": ("counter", "Time spent searching."),
+    "phase_seconds_total": ("counter", "Time spent searching, by phase."),
+    "last_tree_size": ("gauge", "Nodes in the tree of the last search."),
+    "last_max_depth": ("gauge", "Deepest leaf reached by the last search."),
+    "last_rounds_per_second": ("gauge", "Search rounds per second of the last search."),
+}
+
+
+def _format_value(value):
+    return str(value) if isinstance(value, int) else repr(float(value))
+
+
+class SearchLog:
+    """Writes every SearchStats it records to a file as one JSON object per line; add it with agent.add_stats_listener."""
+
+    def __init__(self, path_or_file):
+        if isinstance(path_or_file, (str, os.PathLike)):
+            self._file = open(path_or_file, "a")
+            self._owned = True
+        else:
+            self._file = path_or_file
+            self._owned = False
+        self._lock = threading.Lock()
+
+    def record(self, stats):
+        line = json.dumps(stats.to_dict()) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self):
+        if self._owned:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
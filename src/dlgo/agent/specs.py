@@ -0,0 +1,45 @@
+"""
+This file is based on code from the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+Original code repository: https://github.com/maxpumperla/deep_learning_and_the_game_of_go
+
+The code may have been modified and adapted for educational purposes.
+"""
+
+import functools
+
+from dlgo.agent.mcts_agent import MCTSAgent
+from dlgo.agent.predict import load_prediction_agent
+from dlgo.agent.puct_agent import load_puct_agent
+from dlgo.agent.random_bot import RandomBot
+
+AGENT_SPECS = """\
+random                         RandomBot
+mcts[:rounds[:temperature]]    MCTSAgent with random rollouts (default 1000 rounds, temperature 0.8)
+policy:PATH[:temperature]      DeepLearningAgent saved at PATH
+puct:PATH[:rounds]             PUCTAgent saved at PATH (default 400 rounds)
+PATH                           same as policy:PATH"""
+
+
+def agent_factory(spec):
+    """
+    Turn an agent description from the command line (see AGENT_SPECS) into a picklable function that creates the
+    agent, so that every worker process of a match can build its own copy.
+    """
+    kind, _, rest = spec.partition(":")
+    args = rest.split(":") if rest else []
+    try:
+        if kind == "random" and not args:
+            return RandomBot
+        if kind == "mcts" and len(args) <= 2:
+            return functools.partial(MCTSAgent, *(convert(arg) for convert, arg in zip((int, float), args)))
+        if kind == "policy" and 1 <= len(args) <= 2:
+            return functools.partial(load_prediction_agent, args[0], temperature=float(args[1]) if len(args) > 1 else 0.0)
+        if kind == "puct" and 1 <= len(args) <= 2:
+            return functools.partial(load_puct_agent, args[0], num_rounds=int(args[1]) if len(args) > 1 else 400)
+    except ValueError:
+        pass
+    else:
+        if kind not in ("random", "mcts", "policy", "puct"):
+            return functools.partial(load_prediction_agent, spec)
+    raise ValueError(f"Invalid agent spec {spec!r}, expected one of:\n{AGENT_SPECS}")
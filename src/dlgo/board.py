@@ -9,11 +9,16 @@ The code may have been modified and adapted for educational purposes.
 import copy
 from typing import Dict
 
+import numpy as np
+
 from dlgo import zobrist
 from dlgo.gostring import GoString
-from dlgo.gotypes import Point
+from dlgo.gotypes import Player, Point
 from dlgo.utils import MoveAge
 
+# Values used in the vectorized stone view returned by Board.stone_array().
+STONE_VALUES = {Player.black: 1, Player.white: -1}
+
 neighbor_tables = {}
 corner_tables = {}
 
@@ -54,6 +59,9 @@ class Board:
         self.num_cols = num_cols
         self._grid: Dict[Point, GoString] = {}
         self._hash = zobrist.EMPTY_BOARD
+        # Mirror of _grid kept up to date by place_stone/_remove_string, so encoders
+        # can read the whole board at once instead of querying point by point.
+        self._stones = np.zeros((num_rows, num_cols), dtype=np.int8)
 
         global neighbor_tables
         dim = (num_rows, num_cols)
@@ -99,6 +107,7 @@ class Board:
             new_string = new_string.merged_with(same_color_string)
         for new_string_point in new_string.stones:
             self._grid[new_string_point] = new_string
+        self._stones[point.row - 1, point.col - 1] = STONE_VALUES[player]
         # Remove empty-point hash code.
         self._hash ^= zobrist.HASH_CODE[point, None]
         # Add filled point hash code.
@@ -131,6 +140,7 @@ class Board:
                 if neighbor_string is not string:
                     self._replace_string(neighbor_string.with_liberty(point))
             self._grid[point] = None
+            self._stones[point.row - 1, point.col - 1] = 0
             # Remove filled point hash code.
             self._hash ^= zobrist.HASH_CODE[point, string.color]
             # Add empty point hash code.
@@ -192,6 +202,25 @@ class Board:
             return None
         return string
 
+    def go_strings(self):
+        """Return the distinct GoStrings currently on the board."""
+        strings = {}
+        for string in self._grid.values():
+            if string is not None:
+                strings[id(string)] = string
+        return list(strings.values())
+
+    def stone_array(self):
+        """Return a read-only (num_rows, num_cols) int8 view of the stones.
+
+        Black stones are 1, white stones are -1 and empty points are 0. Row and
+        column indices are zero based, so Point(row, col) maps to [row - 1, col - 1].
+        The view tracks the board, copy it if you need a snapshot.
+        """
+        view = self._stones.view()
+        view.flags.writeable = False
+        return view
+
     def __eq__(self, other):
         return (
             isinstance(other, Board) and self.num_rows == other.num_rows and self.num_cols == other.num_cols and self._hash == other._hash
@@ -203,6 +232,8 @@ class Board:
         # (immutable) to GoStrings (also immutable)
         copied._grid = copy.copy(self._grid)
         copied._hash = self._hash
+        copied._stones = self._stones.copy()
+        copied.move_ages.move_ages = self.move_ages.move_ages.copy()
         return copied
 
     # tag::return_zobrist[]
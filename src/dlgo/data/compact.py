@@ -0,0 +1,133 @@
+"""
+This file is based on code from the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+Original code repository: https://github.com/maxpumperla/deep_learning_and_the_game_of_go
+
+The code may have been modified and adapted for educational purposes.
+"""
+
+import copy
+
+import numpy as np
+
+from dlgo.board import STONE_VALUES, Board
+from dlgo.gamestate import GameState
+from dlgo.gotypes import Player, Point
+from dlgo.move import Move
+
+# Compact positions store the stones with absolute colors (black 1, white -1, as in Board.stone_array()) and leave
+# the conversion into model input to the data loader.
+STONES_DTYPE = np.int8
+PLAYER_DTYPE = np.int8
+POINT_DTYPE = np.int16
+NO_KO = -1
+
+# 2-bit codes used by pack_stones: 0 empty, 1 black, 3 white (-1 & 0b11).
+_CODE_TO_STONE = np.array([0, 1, 0, -1], dtype=STONES_DTYPE)
+
+
+def ko_point(game_state: GameState):
+    """
+    Return the point the player to move may not play because it would retake a ko, or None.
+
+    Only a stone that captured and is now a single stone in atari can be taken back into a ko, so this looks at the
+    string of the last move instead of testing every point. It needs no earlier board, so it also works with bounded
+    history.
+    """
+    move = game_state.last_move
+    if move is None or not move.is_play:
+        return None
+    go_string = game_state.board.get_go_string(move.point)
+    if go_string is None or len(go_string.stones) != 1 or go_string.num_liberties != 1:
+        return None
+    (point,) = go_string.liberties
+    if game_state.does_move_violate_ko(game_state.next_player, Move.play(point)):
+        return point
+    return None
+
+
+def compact_position(game_state: GameState, move_number):
+    """Return the compact representation of a position as a dict of numpy scalars and arrays."""
+    board = game_state.board
+    point = ko_point(game_state)
+    return {
+        "stones": np.array(board.stone_array(), dtype=STONES_DTYPE),
+        "next_player": PLAYER_DTYPE(STONE_VALUES[game_state.next_player]),
+        "ko_point": POINT_DTYPE(NO_KO if point is None else (point.row - 1) * board.num_cols + (point.col - 1)),
+        "move_number": np.int16(move_number),
+    }
+
+
+def stack_positions(positions, board_shape):
+    """
+    Turn a list of compact_position dicts into a dict of arrays with one entry per position. board_shape, (rows,
+    cols), gives the shape of the stones when there are no positions, e.g. for a game resigned before the first play.
+    """
+    arrays = {
+        "stones": np.zeros((0,) + tuple(board_shape), dtype=STONES_DTYPE),
+        "next_player": np.zeros(0, dtype=PLAYER_DTYPE),
+        "ko_point": np.zeros(0, dtype=POINT_DTYPE),
+        "move_number": np.zeros(0, dtype=np.int16),
+    }
+    if not positions:
+        return arrays
+    return {name: np.array([position[name] for position in positions], dtype=empty.dtype) for name, empty in arrays.items()}
+
+
+def decode_oneplane(stones, next_player, dtype=np.float32):
+    """
+    Turn compact (N, rows, cols) stones and (N,) next players into (N, 1, rows, cols) oneplane encodings,
+    with 1 for the player to move and -1 for the opponent.
+    """
+    next_player = np.asarray(next_player).astype(dtype).reshape(-1, 1, 1, 1)
+    return np.asarray(stones, dtype=dtype)[:, np.newaxis] * next_player
+
+
+def pack_stones(stones):
+    """Pack (N, rows, cols) stones into 2 bits per point, giving an (N, ceil(rows * cols / 4)) uint8 array."""
+    stones = np.asarray(stones)
+    # Explicit sizes rather than -1, which numpy cannot resolve for a game without positions.
+    num_points = stones.shape[1] * stones.shape[2]
+    flat = stones.reshape(len(stones), num_points).astype(np.uint8) & 0b11
+    padding = -num_points % 4
+    if padding:
+        flat = np.pad(flat, ((0, 0), (0, padding)))
+    codes = flat.reshape(len(stones), (num_points + padding) // 4, 4)
+    return codes[:, :, 0] | (codes[:, :, 1] << 2) | (codes[:, :, 2] << 4) | (codes[:, :, 3] << 6)
+
+
+def unpack_stones(packed, board_shape):
+    """Inverse of pack_stones."""
+    packed = np.asarray(packed, dtype=np.uint8)
+    num_rows, num_cols = board_shape
+    codes = np.stack([(packed >> shift) & 0b11 for shift in (0, 2, 4, 6)], axis=-1).reshape(len(packed), packed.shape[1] * 4)
+    return _CODE_TO_STONE[codes[:, : num_rows * num_cols]].reshape(len(packed), num_rows, num_cols)
+
+
+def stones_from_arrays(arrays, board_shape):
+    """Return the (N, rows, cols) stones of a dataset or shard dict, unpacking them if they were stored packed."""
+    if "packed_stones" in arrays:
+        return unpack_stones(arrays["packed_stones"], board_shape)
+    return np.asarray(arrays["stones"])
+
+
+def to_game_state(stones, next_player, ko_point=NO_KO):
+    """
+    Rebuild a GameState from one compact position, e.g. to feed encoders that need more than the stones.
+    The history is not stored, so the rebuilt state knows nothing about move ages; with the stored ko_point, it
+    knows that retaking the ko there is forbidden (see GameState.does_move_violate_ko), but no longer cycles.
+    """
+    num_rows, num_cols = stones.shape
+    board = Board(num_rows, num_cols)
+    # In a legal position every string has a liberty, so placing the stones in any order captures nothing.
+    for row, col in zip(*np.nonzero(stones)):
+        color = Player.black if stones[row, col] == 1 else Player.white
+        board.place_stone(color, Point(row=int(row) + 1, col=int(col) + 1))
+    player = Player.black if next_player == 1 else Player.white
+    game_state = GameState(board, player, None, None)
+    if ko_point != NO_KO:
+        # The retake would recreate the board before the ko capture, with the opponent to move.
+        retaken = copy.deepcopy(board)
+        retaken.place_stone(player, Point(row=int(ko_point) // num_cols + 1, col=int(ko_point) % num_cols + 1))
+        game_state.previous_states = frozenset(((player.other, retaken.zobrist_hash()),))
+    return game_state
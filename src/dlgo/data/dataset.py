@@ -0,0 +1,176 @@
+"""
+This file is based on code from the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+Original code repository: https://github.com/maxpumperla/deep_learning_and_the_game_of_go
+
+The code may have been modified and adapted for educational purposes.
+"""
+
+import os
+import random
+
+import numpy as np
+import torch
+from torch.utils.data import Dataset, IterableDataset, get_worker_info
+
+from dlgo.data.compact import decode_oneplane, stones_from_arrays
+from dlgo.data.shards import read_manifest
+
+
+def split_shards(directory, test_fraction=0.1):
+    """
+    Split the shard indices of a dataset into (train, test) lists, keeping at least one shard on each side.
+    Splitting by shard keeps the positions of a game together.
+    """
+    num_shards = len(read_manifest(directory)["shards"])
+    if num_shards < 2:
+        raise ValueError(f"{directory} has {num_shards} shard(s), write it with a smaller shard size to split it")
+    num_test = min(max(1, round(num_shards * test_fraction)), num_shards - 1)
+    indices = list(range(num_shards))
+    return indices[: num_shards - num_test], indices[num_shards - num_test :]
+
+
+class _Shards:
+    """Lazily memory-maps the shards of a dataset and turns their arrays into (features, labels) pairs."""
+
+    def __init__(self, directory, shards=None):
+        self.directory = directory
+        self.manifest = read_manifest(directory)
+        board_size = self.manifest["metadata"].get("board_size")
+        self.board_shape = None if board_size is None else (board_size, board_size)
+        self.indices = list(range(len(self.manifest["shards"]))) if shards is None else list(shards)
+        self._opened = {}
+
+    def num_positions(self, shard_index):
+        return self.manifest["shards"][shard_index]["num_positions"]
+
+    def arrays(self, shard_index):
+        # Opened on first use so that each DataLoader worker maps the files itself instead of receiving copies.
+        if shard_index not in self._opened:
+            files = self.manifest["shards"][shard_index]["files"]
+            self._opened[shard_index] = {
+                name: np.load(os.path.join(self.directory, file_name), mmap_mode="r") for name, file_name in files.items()
+            }
+        return self._opened[shard_index]
+
+    def take(self, shard_index, positions):
+        """Return float32 features and int64 labels for the given positions of a shard."""
+        arrays = self.arrays(shard_index)
+        if "features" in arrays:
+            features = np.asarray(arrays["features"][positions], dtype=np.float32)
+            if features.ndim == 3:
+                # Encoded boards of the oneplane encoder are stored without their plane axis.
+                features = features[:, np.newaxis]
+        else:
+            selected = {name: arrays[name][positions] for name in ("stones", "packed_stones", "next_player") if name in arrays}
+            features = decode_oneplane(stones_from_arrays(selected, self.board_shape), selected["next_player"])
+        labels = np.asarray(arrays["labels"][positions], dtype=np.int64)
+        return features, labels
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_opened"] = {}
+        return state
+
+
+class ShardedDataset(Dataset):
+    """
+    Map-style dataset over a sharded game directory (see dlgo.data.shards), returning one (features, label) pair
+    per position. Shards are memory-mapped, so only the pages of the positions read are loaded.
+
+    Compact datasets (generate_mcts_games.py --compact) are decoded into oneplane float32 features on access.
+    Random access over a large dataset touches every shard; ShardedIterableDataset reads far more sequentially.
+    """
+
+    def __init__(self, directory, shards=None):
+        self._shards = _Shards(directory, shards)
+        lengths = [self._shards.num_positions(i) for i in self._shards.indices]
+        self._offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=self._offsets[1:])
+
+    def __len__(self):
+        return int(self._offsets[-1])
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"Position {index} is out of range for a dataset of {len(self)} positions")
+        shard = int(np.searchsorted(self._offsets, index, side="right")) - 1
+        features, labels = self._shards.take(self._shards.indices[shard], [index - int(self._offsets[shard])])
+        return torch.from_numpy(features[0]), torch.tensor(labels[0])
+
+
+class ShardedIterableDataset(IterableDataset):
+    """
+    Iterable dataset over a sharded game directory that yields whole (features, labels) batches.
+
+    Every pass visits the shards in a new random order and the positions of each shard in a random order, so
+    reading stays local to one memory-mapped shard at a time while batches still mix many games. With several
+    DataLoader workers, each worker takes its own subset of the shards and builds its batches itself; create the
+    DataLoader with batch_size=None since batching already happened.
+
+    features are float32 (batch, planes, rows, cols) and labels int64 point indices (batch,). Batches may span two
+    shards; only the last batch of a pass can be smaller than batch_size, and it is dropped with drop_last.
+    """
+
+    def __init__(self, directory, batch_size=64, shuffle=True, shards=None, seed=None, drop_last=False):
+        self._shards = _Shards(directory, shards)
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.drop_last = drop_last
+        # Workers must agree on the shard order, so it is derived from a seed they share.
+        self.seed = random.SystemRandom().randrange(2**32) if seed is None else seed
+        self._passes = 0
+
+    def num_positions(self):
+        return sum(self._shards.num_positions(i) for i in self._shards.indices)
+
+    def __len__(self):
+        """Number of batches per pass, when all of them are read by a single process."""
+        num_positions = self.num_positions()
+        if self.drop_last:
+            return num_positions // self.batch_size
+        return -(-num_positions // self.batch_size)
+
+    def __iter__(self):
+        worker = get_worker_info()
+        if worker is None:
+            worker_id, num_workers = 0, 1
+            pass_seed = self._passes
+            self._passes += 1
+        else:
+            worker_id, num_workers = worker.id, worker.num_workers
+            # DataLoader gives every worker base_seed + id, with a new base_seed for every pass.
+            pass_seed = (worker.seed - worker.id) % 2**63
+
+        shard_order = list(self._shards.indices)
+        if self.shuffle:
+            np.random.default_rng([self.seed, pass_seed]).shuffle(shard_order)
+        rng = np.random.default_rng([self.seed, pass_seed, worker_id])
+
+        pending = []
+        num_pending = 0
+        for shard_index in shard_order[worker_id::num_workers]:
+            num_positions = self._shards.num_positions(shard_index)
+            order = rng.permutation(num_positions) if self.shuffle else np.arange(num_positions)
+            start = 0
+            while start < num_positions:
+                positions = order[start : start + self.batch_size - num_pending]
+                start += len(positions)
+                if self.shuffle:
+                    # Sorted indices read the memory map front to back.
+                    positions = np.sort(positions)
+                pending.append(self._shards.take(shard_index, positions))
+                num_pending += len(positions)
+                if num_pending == self.batch_size:
+                    yield self._batch(pending)
+                    pending, num_pending = [], 0
+        if pending and not self.drop_last:
+            yield self._batch(pending)
+
+    @staticmethod
+    def _batch(parts):
+        features = np.concatenate([part[0] for part in parts])
+        labels = np.concatenate([part[1] for part in parts])
+        return torch.from_numpy(features), torch.from_numpy(labels)
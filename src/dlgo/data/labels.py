@@ -0,0 +1,54 @@
+"""
+This file is based on code from the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+Original code repository: https://github.com/maxpumperla/deep_learning_and_the_game_of_go
+
+The code may have been modified and adapted for educational purposes.
+"""
+
+import numpy as np
+
+# Moves are stored as flat point indices (Encoder.encode_point), which fit in an int16 up to 19x19 boards.
+LABEL_DTYPE = np.int16
+# Visit distributions are stored sparsely, one (point index, probability) entry per visited move.
+VISIT_INDEX_DTYPE = np.int16
+VISIT_PROB_DTYPE = np.float16
+
+
+def one_hot(labels, num_points, dtype=np.float32):
+    """Expand (N,) point indices into (N, num_points) one-hot rows, e.g. for one training batch."""
+    labels = np.asarray(labels)
+    expanded = np.zeros((len(labels), num_points), dtype=dtype)
+    expanded[np.arange(len(labels)), labels] = 1
+    return expanded
+
+
+def sparse_visit_distribution(visit_counts):
+    """
+    Turn a {point index: visit count} mapping into sparse (indices, probabilities) arrays, normalized to sum to 1.
+    """
+    indices = np.fromiter(visit_counts.keys(), dtype=VISIT_INDEX_DTYPE, count=len(visit_counts))
+    counts = np.fromiter(visit_counts.values(), dtype=np.float64, count=len(visit_counts))
+    total = counts.sum()
+    probs = counts / total if total > 0 else counts
+    return indices, probs.astype(VISIT_PROB_DTYPE)
+
+
+def expand_visit_distribution(lengths, indices, probs, num_points, dtype=np.float32):
+    """
+    Expand sparse visit distributions into dense (N, num_points) rows.
+
+    lengths (N,) gives the number of entries of each position, which are stored back to back in indices and probs.
+    """
+    lengths = np.asarray(lengths, dtype=np.int64)
+    rows = np.repeat(np.arange(len(lengths)), lengths)
+    expanded = np.zeros((len(lengths), num_points), dtype=dtype)
+    expanded[rows, np.asarray(indices, dtype=np.int64)] = probs
+    return expanded
+
+
+def visit_offsets(lengths):
+    """Start offset of every position's entries, for random access into sparse visit arrays."""
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets
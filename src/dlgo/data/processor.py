@@ -0,0 +1,223 @@
+"""
+This file is based on code from the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+Original code repository: https://github.com/maxpumperla/deep_learning_and_the_game_of_go
+
+The code may have been modified and adapted for educational purposes.
+"""
+
+import collections
+import hashlib
+import json
+import multiprocessing
+import os
+
+import numpy as np
+
+from dlgo.data.labels import LABEL_DTYPE
+from dlgo.data.shards import ShardWriter
+from dlgo.encoders.base import get_encoder_by_name
+from dlgo.sgf import SgfError, iter_game_texts, iter_record_streams, parse_game, record_files
+
+# Bump when the output of encode_games or the cache layout changes, so that stale cache entries are not reused.
+CACHE_VERSION = 3
+# Games per task handed to a worker: enough to keep the workers busy, few enough to bound the memory of a task.
+GAMES_PER_CHUNK = 64
+# All encoders produce planes of small integers (0/1, or -1/0/1 for oneplane), which fit in an int8.
+FEATURE_DTYPE = np.int8
+
+
+def _fingerprint(path, encoder_name, board_size):
+    """Identify a file's output by its location, size and modification time plus the encoding settings."""
+    stat = os.stat(path)
+    key = [os.path.realpath(path), stat.st_size, stat.st_mtime_ns, encoder_name, board_size, CACHE_VERSION]
+    return hashlib.sha1(json.dumps(key).encode("utf-8")).hexdigest()
+
+
+def encode_game(game, encoder):
+    """
+    Replay one SgfGame and return (features, labels) for every stone played: the encoded position before the move
+    and the index of the move's point.
+
+    Records are replayed in trusted mode on a single board (see dlgo.replay), so every position is encoded straight
+    into its row of the output before the next move is played.
+    """
+    num_plays = sum(1 for _, move in game.moves if move.is_play)
+    features = encoder.batch_buffer(num_plays, dtype=FEATURE_DTYPE)
+    labels = np.zeros(num_plays, dtype=LABEL_DTYPE)
+    i = 0
+    for game_state, move in game.replay(trusted=True):
+        if move.is_play:
+            encoder.encode_batch([game_state], out=features[i : i + 1])
+            labels[i] = encoder.encode_point(move.point)
+            i += 1
+    return features, labels
+
+
+def iter_text_chunks(path, games_per_chunk=GAMES_PER_CHUNK):
+    """Yield the game record texts of one record file (see dlgo.sgf.iter_record_streams) in lists of at most games_per_chunk."""
+    chunk = []
+    for _, stream in iter_record_streams(path):
+        for text in iter_game_texts(stream):
+            chunk.append(text)
+            if len(chunk) == games_per_chunk:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def encode_games(texts, encoder_name, board_size):
+    """
+    Encode a list of game record texts. Returns a dict with the features and labels of all positions, the number of
+    positions of every game (game_lengths), and the number of games skipped because they are malformed, are played
+    on another board size, or contain a play off the board, on an occupied point or capturing the player's own stones
+    (see dlgo.replay.replay_moves; ko is not checked).
+    """
+    encoder = get_encoder_by_name(encoder_name, board_size)
+    features, labels, game_lengths = [], [], []
+    skipped = 0
+    for text in texts:
+        try:
+            game = parse_game(text)
+            if game.board_size != board_size:
+                skipped += 1
+                continue
+            game_features, game_labels = encode_game(game, encoder)
+        except SgfError:
+            skipped += 1
+            continue
+        features.append(game_features)
+        labels.append(game_labels)
+        game_lengths.append(len(game_labels))
+
+    shape = (0,) + tuple(encoder.shape())
+    return {
+        "features": np.concatenate(features) if features else np.zeros(shape, dtype=FEATURE_DTYPE),
+        "labels": np.concatenate(labels) if labels else np.zeros(0, dtype=LABEL_DTYPE),
+        "game_lengths": np.array(game_lengths, dtype=np.int64),
+        "skipped": np.int64(skipped),
+    }
+
+
+def _encode_task(task):
+    texts, encoder_name, board_size, chunk_path = task
+    if texts is None:
+        with np.load(chunk_path) as cached:
+            return {name: cached[name] for name in cached.files}
+
+    result = encode_games(texts, encoder_name, board_size)
+    if chunk_path is not None:
+        # Written under a temporary name first, so an interrupted run never leaves a truncated cache entry.
+        tmp_path = chunk_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **result)
+        os.replace(tmp_path, chunk_path)
+    return result
+
+
+def _tasks(files, encoder_name, board_size, cache_dir, games_per_chunk):
+    """
+    Yield ("chunk", task) for every chunk of games of every file, followed by ("file", (cached, index_path,
+    num_chunks)) once a file's chunks are all out.
+
+    A file's cache entry is one npz per chunk plus an index naming the number of chunks. The index is written last
+    (see process_games), so a file only counts as cached once all its chunks are.
+    """
+    for path in files:
+        index_path = None
+        if cache_dir is not None:
+            fingerprint = os.path.join(cache_dir, _fingerprint(path, encoder_name, board_size))
+            index_path = fingerprint + ".json"
+            if os.path.exists(index_path):
+                with open(index_path) as f:
+                    num_chunks = json.load(f)["chunks"]
+                for i in range(num_chunks):
+                    yield "chunk", (None, encoder_name, board_size, f"{fingerprint}-{i}.npz")
+                yield "file", (True, index_path, num_chunks)
+                continue
+
+        num_chunks = 0
+        for texts in iter_text_chunks(path, games_per_chunk):
+            chunk_path = None if index_path is None else f"{fingerprint}-{num_chunks}.npz"
+            yield "chunk", (texts, encoder_name, board_size, chunk_path)
+            num_chunks += 1
+        yield "file", (False, index_path, num_chunks)
+
+
+def _run_tasks(items, workers):
+    """
+    Yield (item, result) for the items of _tasks in input order, with result None for the "file" items.
+
+    Only a couple of chunks per worker are read ahead, so the records are read no faster than they are encoded and
+    memory use does not grow with the size of a file or archive.
+    """
+    if workers <= 1:
+        for kind, task in items:
+            yield (kind, task), _encode_task(task) if kind == "chunk" else None
+        return
+
+    with multiprocessing.Pool(workers) as pool:
+        pending = collections.deque()
+        for kind, task in items:
+            pending.append(((kind, task), pool.apply_async(_encode_task, (task,)) if kind == "chunk" else None))
+            if len(pending) > 2 * workers:
+                item, result = pending.popleft()
+                yield item, None if result is None else result.get()
+        while pending:
+            item, result = pending.popleft()
+            yield item, None if result is None else result.get()
+
+
+def process_games(
+    paths,
+    out_dir,
+    encoder_name="oneplane",
+    board_size=19,
+    workers=1,
+    shard_size=4096,
+    cache_dir=None,
+    progress=None,
+    games_per_chunk=GAMES_PER_CHUNK,
+):
+    """
+    Encode a corpus of game records into a sharded dataset (see dlgo.data.shards) with int8 features and int16
+    move labels.
+
+    paths are SGF files, collections, directories or archives of them (see dlgo.sgf.iter_games). The games are read
+    in chunks of games_per_chunk, each encoded by one of the worker processes, and the results are written in input
+    order, so the dataset does not depend on the number of workers. With cache_dir, the output for every file is kept
+    there and reused as long as the file and the encoder settings are unchanged.
+
+    progress, if given, is called with (files_done, num_files, num_positions) after every file. Returns a dict of
+    counts: files, cached_files, games, skipped_games and positions.
+    """
+    files = [file_path for path in paths for file_path in record_files(path)]
+    if cache_dir is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+    items = _tasks(files, encoder_name, board_size, cache_dir, games_per_chunk)
+    metadata = {"encoder": encoder_name, "board_size": board_size, "labels": "point_index", "source": "sgf"}
+    stats = {"files": len(files), "cached_files": 0, "games": 0, "skipped_games": 0, "positions": 0}
+
+    files_done = 0
+    with ShardWriter(out_dir, shard_size, metadata=metadata) as writer:
+        for (kind, task), result in _run_tasks(items, workers):
+            if kind == "file":
+                cached, index_path, num_chunks = task
+                if index_path is not None and not cached:
+                    with open(index_path, "w") as f:
+                        json.dump({"chunks": num_chunks}, f)
+                stats["cached_files"] += int(cached)
+                files_done += 1
+                if progress is not None:
+                    progress(files_done, len(files), stats["positions"])
+                continue
+
+            if len(result["game_lengths"]) > 0:
+                offsets = np.cumsum(result["game_lengths"])[:-1]
+                for features, labels in zip(np.split(result["features"], offsets), np.split(result["labels"], offsets)):
+                    writer.write_game(features=features, labels=labels)
+            stats["games"] += len(result["game_lengths"])
+            stats["skipped_games"] += int(result["skipped"])
+            stats["positions"] += len(result["labels"])
+    return stats
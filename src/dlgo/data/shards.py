@@ -0,0 +1,177 @@
+"""
+This file is based on code from the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+Original code repository: https://github.com/maxpumperla/deep_learning_and_the_game_of_go
+
+The code may have been modified and adapted for educational purposes.
+"""
+
+import json
+import os
+
+import numpy as np
+
+MANIFEST = "manifest.json"
+MANIFEST_VERSION = 1
+
+
+def _write_atomically(path, write):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        write(f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def shard_file_name(shard_index, array_name):
+    return f"shard-{shard_index:05d}.{array_name}.npy"
+
+
+def read_manifest(directory):
+    with open(os.path.join(directory, MANIFEST)) as f:
+        return json.load(f)
+
+
+class ShardWriter:
+    """
+    Streams game data to a directory of shards, so that memory use does not grow with the number of games.
+
+    Each call to write_game adds the arrays of one game, e.g. write_game(features=boards, labels=moves), where all
+    arrays have one entry per position along their first axis. Games are buffered until they add up to at least
+    shard_size positions and are then written out together as one .npy file per array. Shards always contain whole
+    games, so they hold shard_size positions plus the tail of the last game.
+
+    Arrays whose length is not the number of positions, such as the entries of a sparse per-position distribution,
+    are passed in the ragged dict. They are concatenated per shard like the others; storing per-position lengths
+    alongside them keeps the entries addressable.
+
+    The manifest (manifest.json) lists the complete shards and is replaced atomically after every shard, so after a
+    crash only the games buffered for the next shard are lost. Opening the directory again with resume=True drops
+    any partially written shard and continues after the last complete one; num_games tells how many games to skip.
+    """
+
+    def __init__(self, directory, shard_size=4096, resume=False, metadata=None):
+        self.directory = directory
+        self.shard_size = shard_size
+        self._buffer = {}
+        self._buffered_positions = 0
+        self._buffered_games = 0
+
+        manifest_path = os.path.join(directory, MANIFEST)
+        if os.path.exists(manifest_path):
+            if not resume:
+                raise FileExistsError(f"{directory} already contains a dataset, pass resume=True to continue it")
+            self.manifest = read_manifest(directory)
+            self._remove_incomplete_shards()
+        else:
+            os.makedirs(directory, exist_ok=True)
+            self.manifest = {
+                "version": MANIFEST_VERSION,
+                "shard_size": shard_size,
+                "metadata": metadata or {},
+                "arrays": {},
+                "num_games": 0,
+                "num_positions": 0,
+                "shards": [],
+            }
+            self._write_manifest()
+
+    @property
+    def metadata(self):
+        return self.manifest["metadata"]
+
+    @property
+    def num_games(self):
+        """Number of games stored in complete shards."""
+        return self.manifest["num_games"]
+
+    @property
+    def num_positions(self):
+        """Number of positions stored in complete shards."""
+        return self.manifest["num_positions"]
+
+    def write_game(self, ragged=None, **arrays):
+        lengths = {len(array) for array in arrays.values()}
+        if len(lengths) != 1:
+            raise ValueError(f"All arrays of a game need the same number of positions, got {lengths}")
+        num_positions = lengths.pop()
+
+        if num_positions > 0:
+            ragged = ragged or {}
+            self._check_arrays(arrays, ragged)
+            for name, array in list(arrays.items()) + list(ragged.items()):
+                self._buffer.setdefault(name, []).append(np.asarray(array))
+            self._buffered_positions += num_positions
+        self._buffered_games += 1
+
+        if self._buffered_positions >= self.shard_size:
+            self.flush()
+
+    def flush(self):
+        """Write all buffered games as a new shard."""
+        if self._buffered_games == 0:
+            return
+        shard_index = len(self.manifest["shards"])
+        files = {}
+        for name, parts in self._buffer.items():
+            file_name = shard_file_name(shard_index, name)
+            data = np.concatenate(parts)
+            _write_atomically(os.path.join(self.directory, file_name), lambda f: np.save(f, data))
+            files[name] = file_name
+
+        self.manifest["shards"].append({"files": files, "num_positions": self._buffered_positions, "num_games": self._buffered_games})
+        self.manifest["num_games"] += self._buffered_games
+        self.manifest["num_positions"] += self._buffered_positions
+        self._write_manifest()
+
+        self._buffer = {}
+        self._buffered_positions = 0
+        self._buffered_games = 0
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Buffered games are complete, so they are worth keeping even if the caller failed.
+        self.close()
+
+    def _check_arrays(self, arrays, ragged):
+        layout = {}
+        for name, array in list(arrays.items()) + list(ragged.items()):
+            layout[name] = {"dtype": np.asarray(array).dtype.str, "shape": list(np.shape(array)[1:])}
+            if name in ragged:
+                layout[name]["ragged"] = True
+        if not self.manifest["arrays"]:
+            self.manifest["arrays"] = layout
+        elif layout != self.manifest["arrays"]:
+            raise ValueError(f"Game arrays {layout} don't match the dataset layout {self.manifest['arrays']}")
+
+    def _write_manifest(self):
+        data = json.dumps(self.manifest, indent=2).encode("utf-8")
+        _write_atomically(os.path.join(self.directory, MANIFEST), lambda f: f.write(data))
+
+    def _remove_incomplete_shards(self):
+        known = {file_name for shard in self.manifest["shards"] for file_name in shard["files"].values()}
+        for file_name in os.listdir(self.directory):
+            if file_name.startswith("shard-") and file_name not in known:
+                os.remove(os.path.join(self.directory, file_name))
+
+
+def iter_shards(directory, mmap_mode=None):
+    """Yield each shard of a dataset as a dict mapping array names to arrays, in the order they were written."""
+    manifest = read_manifest(directory)
+    for shard in manifest["shards"]:
+        yield {name: np.load(os.path.join(directory, file_name), mmap_mode=mmap_mode) for name, file_name in shard["files"].items()}
+
+
+def load_arrays(directory):
+    """Load a whole dataset into memory as a dict of concatenated arrays."""
+    parts = {}
+    for shard in iter_shards(directory):
+        for name, array in shard.items():
+            parts.setdefault(name, []).append(array)
+    return {name: np.concatenate(arrays) for name, arrays in parts.items()}
@@ -0,0 +1,151 @@
+"""
+This file is based on code from the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+Original code repository: https://github.com/maxpumperla/deep_learning_and_the_game_of_go
+
+The code may have been modified and adapted for educational purposes.
+"""
+
+import time
+from collections import namedtuple
+
+from dlgo import utils
+from dlgo.gamestate import GameState
+from dlgo.gotypes import Player
+from dlgo.scoring import compute_game_result
+from dlgo.sgf import SgfGame
+
+# The end of a game: the winning Player, the number of moves played, the result in SGF notation (e.g. "B+3.5",
+# "W+R"), the winning margin in points (None after a resignation) and the final GameState.
+GameOutcome = namedtuple("GameOutcome", "winner num_moves result margin game_state")
+
+
+class GameObserver:
+    """
+    Receives the events of games run by run_game. Subclasses override the hooks they need; the default ones do nothing.
+    """
+
+    def on_game_start(self, game_state):
+        pass
+
+    def on_move_start(self, game_state):
+        """Called with the position to move from, before the agent to move is asked for its move."""
+        pass
+
+    def on_move(self, game_state, move, seconds):
+        """Called after every move with the position the move was played from and the time the agent took."""
+        pass
+
+    def on_game_end(self, outcome):
+        pass
+
+
+class ConsoleRenderer(GameObserver):
+    """
+    Prints the board before every move, so a human asked for a move sees the current position, and then the move
+    played, optionally clearing the screen and pausing before each move.
+    """
+
+    def __init__(self, clear_screen=True, delay=0.0):
+        self.clear_screen = clear_screen
+        self.delay = delay
+
+    def on_move_start(self, game_state):
+        if self.delay > 0:
+            # Only for watching games; headless runs use no renderer.
+            time.sleep(self.delay)
+        if self.clear_screen:
+            print(chr(27) + "[2J")
+        utils.print_board(game_state.board)
+
+    def on_move(self, game_state, move, seconds):
+        utils.print_move(game_state.next_player, move)
+
+    def on_game_end(self, outcome):
+        utils.print_board(outcome.game_state.board)
+        print(f"Game over after {outcome.num_moves} moves: {outcome.result}")
+
+
+class GameRecorder(GameObserver):
+    """Records the moves of a game, e.g. to save it as SGF, without relying on the GameState history."""
+
+    def __init__(self, komi=7.5):
+        self.komi = komi
+        self.moves = []
+        self.setup = []
+        self.board_size = None
+        self.result = None
+
+    def on_game_start(self, game_state):
+        board = game_state.board
+        self.board_size = board.num_rows
+        self.moves = []
+        self.setup = [(go_string.color, point) for go_string in board.go_strings() for point in sorted(go_string.stones)]
+        self.result = None
+
+    def on_move(self, game_state, move, seconds):
+        # SGF has no resign move, it shows in the result.
+        if not move.is_resign:
+            self.moves.append((game_state.next_player, move))
+
+    def on_game_end(self, outcome):
+        self.result = outcome.result
+
+    def to_sgf_game(self, properties=None):
+        return SgfGame(self.board_size, self.komi, 0, list(self.moves), list(self.setup), self.result, properties)
+
+
+class MoveTimer(GameObserver):
+    """Collects the seconds every player spent per move."""
+
+    def __init__(self):
+        self.move_times = {Player.black: [], Player.white: []}
+
+    def on_game_start(self, game_state):
+        self.move_times = {Player.black: [], Player.white: []}
+
+    def on_move(self, game_state, move, seconds):
+        self.move_times[game_state.next_player].append(seconds)
+
+
+def score_game(game_state):
+    """Return (winner, result, margin) for a finished game, or for an unfinished one as it stands (see GameOutcome)."""
+    if game_state.last_move is not None and game_state.last_move.is_resign:
+        winner = game_state.next_player
+        return winner, f"{'B' if winner == Player.black else 'W'}+R", None
+    game_result = compute_game_result(game_state)
+    return game_result.winner, str(game_result), game_result.winning_margin
+
+
+def run_game(agents, board_size=9, observers=(), max_moves=None, game_state=None, max_history=0):
+    """
+    Play a game between agents, a dict mapping each Player to an agent, and return its GameOutcome.
+
+    The game starts from game_state, or from an empty board of board_size. observers (see GameObserver) are told
+    about the start, every move (before and after it is chosen) and the end; without any, nothing is printed and the
+    game runs at full speed.
+    Games that reach max_moves are scored as they stand. Agents only see the position and its ko history, so by
+    default no earlier states are kept (see GameState max_history); pass max_history=None for agents that need them.
+    """
+    if game_state is None:
+        game_state = GameState.new_game(board_size, max_history=max_history)
+    for observer in observers:
+        observer.on_game_start(game_state)
+
+    num_moves = 0
+    while not game_state.is_over() and (max_moves is None or num_moves < max_moves):
+        for observer in observers:
+            observer.on_move_start(game_state)
+        start = time.perf_counter()
+        move = agents[game_state.next_player].select_move(game_state)
+        seconds = time.perf_counter() - start
+        for observer in observers:
+            observer.on_move(game_state, move, seconds)
+        game_state = game_state.apply_move(move)
+        num_moves += 1
+
+    winner, result, margin = score_game(game_state)
+    outcome = GameOutcome(winner, num_moves, result, margin, game_state)
+    for observer in observers:
+        observer.on_game_end(outcome)
+    return outcome
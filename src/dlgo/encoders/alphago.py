@@ -0,0 +1,74 @@
+"""
+This file is based on code from the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+Original code repository: https://github.com/maxpumperla/deep_learning_and_the_game_of_go
+
+The code may have been modified and adapted for educational purposes.
+"""
+
+from dlgo.encoders.features import BoardFeatures, FeatureEncoder, one_hot_planes
+from dlgo.gotypes import Player
+
+FEATURE_OFFSETS = {
+    "stone_color": 0,
+    "ones": 3,
+    "zeros": 4,
+    "sensibleness": 5,
+    "turns_since": 6,
+    "liberties": 14,
+    "liberties_after": 22,
+    "capture_size": 30,
+    "self_atari_size": 38,
+    "ladder_capture": 46,
+    "ladder_escape": 47,
+    "current_player_color": 48,
+}
+
+
+def offset(feature):
+    return FEATURE_OFFSETS[feature]
+
+
+class AlphaGoEncoder(FeatureEncoder):
+    """
+    The 48 feature planes used by the AlphaGo policy networks, plus an optional plane for the colour of the
+    player to move (49 planes in total, as used by the value network).
+
+    Ladder captures and escapes are not read out and their planes are left empty.
+    """
+
+    move_age_levels = 8
+
+    def __init__(self, board_size, use_player_plane=False):
+        self.use_player_plane = use_player_plane
+        super().__init__(board_size, num_planes=48 + int(use_player_plane))
+
+    def name(self):
+        return "alphago"
+
+    def options(self):
+        return {"use_player_plane": self.use_player_plane}
+
+    def encode_features(self, features: BoardFeatures, out):
+        stones = features.stones
+        candidates = features.candidates
+
+        out[offset("stone_color")] = stones == 1
+        out[offset("stone_color") + 1] = stones == -1
+        out[offset("stone_color") + 2] = stones == 0
+        out[offset("ones")] = 1
+        out[offset("zeros")] = 0
+        out[offset("sensibleness")] = candidates.sensible
+        one_hot_planes(features.move_ages, out[offset("turns_since") : offset("turns_since") + self.move_age_levels])
+        one_hot_planes(features.liberties, out[offset("liberties") : offset("liberties") + 8], first_value=1)
+        one_hot_planes(candidates.liberties_after, out[offset("liberties_after") : offset("liberties_after") + 8], first_value=1)
+        one_hot_planes(candidates.capture_size, out[offset("capture_size") : offset("capture_size") + 8])
+        one_hot_planes(candidates.self_atari_size, out[offset("self_atari_size") : offset("self_atari_size") + 8], first_value=1)
+        out[offset("ladder_capture")] = 0
+        out[offset("ladder_escape")] = 0
+        if self.use_player_plane:
+            out[offset("current_player_color")] = features.next_player == Player.black
+
+
+def create(board_size, use_player_plane=False):
+    return AlphaGoEncoder(board_size, use_player_plane)
@@ -8,17 +8,50 @@ The code may have been modified and adapted for educational purposes.
 
 import importlib
 
+import numpy as np
+
 from dlgo.gamestate import GameState
 from dlgo.gotypes import Point
 
 
 class Encoder:
+    # How many move ages (see Board.move_ages) the encoding tells apart, counting older stones with the oldest level;
+    # 0 for encoders that do not look at move ages.
+    move_age_levels = 0
+
     def name(self):
         raise NotImplementedError()
 
     def encode(self, game_state: GameState):
         raise NotImplementedError()
 
+    def encode_batch(self, game_states, out=None, dtype=np.float32):
+        """
+        Encode a sequence of game states into a single (N, planes, rows, cols) array.
+        If out is given it is filled in place and returned, otherwise a new array of the given dtype is allocated.
+        Subclasses should override this with a version that avoids the per-state temporary arrays.
+        """
+        game_states = list(game_states)
+        out = self.batch_buffer(len(game_states), out, dtype)
+        for i, game_state in enumerate(game_states):
+            out[i] = self.encode(game_state)
+        return out
+
+    def batch_buffer(self, num_states, out=None, dtype=np.float32):
+        """
+        Return a buffer suitable for encode_batch: either a fresh zeroed array or the validated caller-provided one.
+        """
+        shape = (num_states,) + tuple(self.shape())
+        if out is None:
+            return np.zeros(shape, dtype=dtype)
+        if out.shape != shape:
+            raise ValueError(f"Output buffer has shape {out.shape}, expected {shape}")
+        if not out.flags.c_contiguous:
+            raise ValueError("Output buffer must be C-contiguous")
+        if not out.flags.writeable:
+            raise ValueError("Output buffer must be writeable")
+        return out
+
     def encode_point(self, point: Point):
         raise NotImplementedError()
 
@@ -31,10 +64,17 @@ class Encoder:
     def shape(self):
         raise NotImplementedError()
 
+    def options(self):
+        """The keyword arguments that make get_encoder_by_name(self.name(), board_size, **options) recreate this encoder."""
+        return {}
+
 
-def get_encoder_by_name(name, board_size):
+def get_encoder_by_name(name, board_size, **kwargs):
+    """
+    Create the encoder defined in dlgo.encoders.<name>. Extra keyword arguments are passed on to its create function.
+    """
     if isinstance(board_size, int):
         board_size = (board_size, board_size)
     module = importlib.import_module("dlgo.encoders." + name)
     constructor = getattr(module, "create")
-    return constructor(board_size)
+    return constructor(board_size, **kwargs)
@@ -0,0 +1,41 @@
+"""
+This file is based on code from the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+Original code repository: https://github.com/maxpumperla/deep_learning_and_the_game_of_go
+
+The code may have been modified and adapted for educational purposes.
+"""
+
+import numpy as np
+
+from dlgo.encoders.features import BoardFeatures, FeatureEncoder, one_hot_planes
+from dlgo.gotypes import Player
+
+
+class ElevenPlaneEncoder(FeatureEncoder):
+    """
+    Planes 0 - 3: black stones with 1, 2, 3 and 4+ liberties.
+    Planes 4 - 7: white stones with 1, 2, 3 and 4+ liberties.
+    Plane 8: all ones if black plays next.
+    Plane 9: all ones if white plays next.
+    Plane 10: points the player to move can't play because of ko.
+    """
+
+    def __init__(self, board_size):
+        super().__init__(board_size, num_planes=11)
+
+    def name(self):
+        return "elevenplane"
+
+    def encode_features(self, features: BoardFeatures, out):
+        liberties = features.liberties
+        stones = features.board.stone_array()
+        one_hot_planes(np.where(stones == 1, liberties, 0), out[0:4], first_value=1)
+        one_hot_planes(np.where(stones == -1, liberties, 0), out[4:8], first_value=1)
+        out[8] = features.next_player == Player.black
+        out[9] = features.next_player == Player.white
+        out[10] = features.ko
+
+
+def create(board_size):
+    return ElevenPlaneEncoder(board_size)
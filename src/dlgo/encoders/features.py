@@ -0,0 +1,191 @@
+"""
+This file is based on code from the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+Original code repository: https://github.com/maxpumperla/deep_learning_and_the_game_of_go
+
+The code may have been modified and adapted for educational purposes.
+"""
+
+from collections import namedtuple
+from functools import cached_property
+
+import numpy as np
+
+from dlgo.agent.helpers import is_point_an_eye
+from dlgo.board import STONE_VALUES
+from dlgo.encoders.base import Encoder
+from dlgo.gamestate import GameState
+from dlgo.gotypes import Point
+from dlgo.move import Move
+
+CandidateFeatures = namedtuple("CandidateFeatures", "legal sensible liberties_after capture_size self_atari_size")
+
+
+class BoardFeatures:
+    """
+    Per-position features shared by the multi-plane encoders.
+
+    Every feature is computed lazily and at most once, so an encoder only pays for the features its planes use,
+    and several planes built from the same feature (e.g. the liberty planes) share a single computation.
+    All arrays have shape (num_rows, num_cols) with Point(row, col) at [row - 1, col - 1].
+    """
+
+    def __init__(self, game_state: GameState):
+        self.game_state = game_state
+        self.board = game_state.board
+        self.next_player = game_state.next_player
+
+    @cached_property
+    def stones(self):
+        """1 for stones of the player to move, -1 for opponent stones and 0 for empty points."""
+        return self.board.stone_array() * np.int8(STONE_VALUES[self.next_player])
+
+    @cached_property
+    def liberties(self):
+        """Number of liberties of the string each stone belongs to, 0 for empty points."""
+        liberties = np.zeros((self.board.num_rows, self.board.num_cols), dtype=np.int16)
+        for go_string in self._go_strings:
+            num_liberties = go_string.num_liberties
+            for point in go_string.stones:
+                liberties[point.row - 1, point.col - 1] = num_liberties
+        return liberties
+
+    @cached_property
+    def move_ages(self):
+        """Number of moves since the stone on each point was played, -1 for empty points."""
+        return self.board.move_ages.move_ages
+
+    @cached_property
+    def ko(self):
+        """True on empty points the player to move may not play because of the ko rule."""
+        ko = np.zeros((self.board.num_rows, self.board.num_cols), dtype=bool)
+        # Only captures can repeat an earlier position, so the expensive check is limited to the last
+        # liberties of opponent strings in atari.
+        for go_string in self._go_strings:
+            if go_string.color != self.next_player and go_string.num_liberties == 1:
+                (point,) = go_string.liberties
+                ko[point.row - 1, point.col - 1] = self.game_state.does_move_violate_ko(self.next_player, Move.play(point))
+        return ko
+
+    @cached_property
+    def candidates(self):
+        """
+        Features describing what would happen if the player to move played on each empty point.
+
+        The outcome of a move is derived from the neighboring strings instead of playing it out on a board copy.
+        capture_size is -1 on points that are not legal moves so that it can be one-hot encoded starting at 0.
+        """
+        shape = (self.board.num_rows, self.board.num_cols)
+        legal = np.zeros(shape, dtype=bool)
+        sensible = np.zeros(shape, dtype=bool)
+        liberties_after = np.zeros(shape, dtype=np.int16)
+        capture_size = np.full(shape, -1, dtype=np.int16)
+        self_atari_size = np.zeros(shape, dtype=np.int16)
+
+        board = self.board
+        player = self.next_player
+        ko = self.ko
+        for point in self._empty_points:
+            r, c = point.row - 1, point.col - 1
+            if ko[r, c]:
+                continue
+            liberties = set()
+            friendly = {}
+            captured = {}
+            # A point can only be our own eye if all of its neighbors are our stones.
+            could_be_eye = True
+            for neighbor in board.neighbors(point):
+                neighbor_string = board.get_go_string(neighbor)
+                if neighbor_string is None:
+                    liberties.add(neighbor)
+                    could_be_eye = False
+                elif neighbor_string.color == player:
+                    friendly[id(neighbor_string)] = neighbor_string
+                else:
+                    could_be_eye = False
+                    if neighbor_string.num_liberties == 1:
+                        captured[id(neighbor_string)] = neighbor_string
+
+            new_stones = {point}
+            for go_string in friendly.values():
+                new_stones |= go_string.stones
+                liberties |= go_string.liberties
+            liberties.discard(point)
+            num_captured = 0
+            for go_string in captured.values():
+                num_captured += len(go_string.stones)
+                # Captured stones touching the new string become its liberties.
+                for stone in go_string.stones:
+                    if any(n in new_stones for n in board.neighbors(stone)):
+                        liberties.add(stone)
+
+            if not liberties:
+                # Self capture.
+                continue
+            legal[r, c] = True
+            sensible[r, c] = not (could_be_eye and is_point_an_eye(board, point, player))
+            liberties_after[r, c] = len(liberties)
+            capture_size[r, c] = num_captured
+            if len(liberties) == 1:
+                self_atari_size[r, c] = len(new_stones)
+
+        return CandidateFeatures(legal, sensible, liberties_after, capture_size, self_atari_size)
+
+    @cached_property
+    def _go_strings(self):
+        return self.board.go_strings()
+
+    @cached_property
+    def _empty_points(self):
+        rows, cols = np.nonzero(self.board.stone_array() == 0)
+        return [Point(row=int(r) + 1, col=int(c) + 1) for r, c in zip(rows, cols)]
+
+
+def one_hot_planes(values, out, first_value=0):
+    """
+    Write out[k] = (values == first_value + k) for every plane in out, counting values past the last plane in it.
+    """
+    num_planes = out.shape[0]
+    clipped = np.minimum(values, first_value + num_planes - 1)
+    levels = np.arange(first_value, first_value + num_planes).reshape(num_planes, 1, 1)
+    np.equal(clipped, levels, out=out, casting="unsafe")
+
+
+class FeatureEncoder(Encoder):
+    """
+    Base class for encoders that derive their planes from BoardFeatures.
+
+    Subclasses implement encode_features, which must write every one of their planes (so that a caller-provided
+    batch buffer never needs to be cleared first).
+    """
+
+    def __init__(self, board_size, num_planes):
+        self.board_width, self.board_height = board_size
+        self.num_planes = num_planes
+
+    def encode_features(self, features: BoardFeatures, out):
+        raise NotImplementedError()
+
+    def encode(self, game_state: GameState):
+        return self.encode_batch([game_state], dtype=np.float64)[0]
+
+    def encode_batch(self, game_states, out=None, dtype=np.float32):
+        game_states = list(game_states)
+        out = self.batch_buffer(len(game_states), out, dtype)
+        for i, game_state in enumerate(game_states):
+            self.encode_features(BoardFeatures(game_state), out[i])
+        return out
+
+    def encode_point(self, point: Point):
+        return self.board_width * (point.row - 1) + (point.col - 1)
+
+    def decode_point_index(self, index):
+        row = index // self.board_width
+        col = index % self.board_width
+        return Point(row=row + 1, col=col + 1)
+
+    def num_points(self):
+        return self.board_width * self.board_height
+
+    def shape(self):
+        return self.num_planes, self.board_height, self.board_width
@@ -6,8 +6,11 @@ Original code repository: https://github.com/maxpumperla/deep_learning_and_the_g
 The code may have been modified and adapted for educational purposes.
 """
 
+from collections import OrderedDict
+
 import numpy as np
 
+from dlgo.board import STONE_VALUES
 from dlgo.encoders.base import Encoder
 from dlgo.gamestate import GameState
 from dlgo.gotypes import Point
@@ -25,20 +28,19 @@ class OnePlaneEncoder(Encoder):
         """
         Fill a matrix with 1s for the current player, -1 for the opponent's and 0 for empty spaces on the board
         """
-        board_matrix = np.zeros(self.shape())
-        next_player = game_state.next_player
-
-        for r in range(self.board_width):
-            for c in range(self.board_width):
-                p = Point(row=r + 1, col=c + 1)
-                go_string = game_state.board.get_go_string(p)
-                if go_string is None:
-                    continue
-                if go_string.color == next_player:
-                    board_matrix[0, r, c] = 1
-                else:
-                    board_matrix[0, r, c] = -1
-        return board_matrix
+        return self.encode_batch([game_state], dtype=np.float64)[0]
+
+    def encode_batch(self, game_states, out=None, dtype=np.float32):
+        """
+        Encode all game states into one (N, 1, rows, cols) array, reading each board through its
+        vectorized stone view. A caller-provided out buffer (e.g. float32 or int8) is filled in place.
+        """
+        game_states = list(game_states)
+        out = self.batch_buffer(len(game_states), out, dtype)
+        for i, game_state in enumerate(game_states):
+            # The stone view has black as 1 and white as -1, flip it when white is to play.
+            np.multiply(game_state.board.stone_array(), STONE_VALUES[game_state.next_player], out=out[i, 0], casting="unsafe")
+        return out
 
     def encode_point(self, point: Point):
         """
@@ -61,5 +63,71 @@ class OnePlaneEncoder(Encoder):
         return self.num_planes, self.board_height, self.board_width
 
 
-def create(board_size):
+class IncrementalOnePlaneEncoder(OnePlaneEncoder):
+    """
+    OnePlaneEncoder for sequential game processing and self-play.
+
+    It keeps the board of the last state it encoded for up to max_games games. When it is asked to encode the state
+    that follows a cached one, it only applies the stone placed by the last move and the stones that move captured,
+    instead of reading the whole board again. Anything else (a new game, a jump back in history) is encoded in full.
+    The encoder is not thread safe.
+    """
+
+    def __init__(self, board_size, max_games=64):
+        super().__init__(board_size)
+        self.max_games = max_games
+        # id(game_state) -> (game_state, stones with black as 1 and white as -1). Holding on to the state keeps its
+        # id from being reused.
+        self._cache = OrderedDict()
+
+    def options(self):
+        return {"incremental": True}
+
+    def encode_batch(self, game_states, out=None, dtype=np.float32):
+        game_states = list(game_states)
+        out = self.batch_buffer(len(game_states), out, dtype)
+        for i, game_state in enumerate(game_states):
+            np.multiply(self._stones(game_state), STONE_VALUES[game_state.next_player], out=out[i, 0], casting="unsafe")
+        return out
+
+    def _stones(self, game_state: GameState):
+        entry = self._cache.get(id(game_state))
+        if entry is not None and entry[0] is game_state:
+            self._cache.move_to_end(id(game_state))
+            return entry[1]
+
+        previous = game_state.previous_state
+        entry = self._cache.get(id(previous)) if previous is not None else None
+        if entry is not None and entry[0] is previous:
+            # The cached array moves on to the new state.
+            del self._cache[id(previous)]
+            stones = entry[1]
+            self._apply_move(stones, previous, game_state.last_move)
+        else:
+            stones = np.array(game_state.board.stone_array(), dtype=np.int8)
+
+        self._cache[id(game_state)] = (game_state, stones)
+        if len(self._cache) > self.max_games:
+            self._cache.popitem(last=False)
+        return stones
+
+    @staticmethod
+    def _apply_move(stones, previous: GameState, move):
+        if not move.is_play:
+            return
+        player = previous.next_player
+        point = move.point
+        stones[point.row - 1, point.col - 1] = STONE_VALUES[player]
+        board = previous.board
+        for neighbor in board.neighbors(point):
+            neighbor_string = board.get_go_string(neighbor)
+            # Opponent strings whose last liberty was the new stone are captured.
+            if neighbor_string is not None and neighbor_string.color != player and neighbor_string.num_liberties == 1:
+                for stone in neighbor_string.stones:
+                    stones[stone.row - 1, stone.col - 1] = 0
+
+
+def create(board_size, incremental=False):
+    if incremental:
+        return IncrementalOnePlaneEncoder(board_size)
     return OnePlaneEncoder(board_size)
@@ -0,0 +1,36 @@
+"""
+This file is based on code from the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+Original code repository: https://github.com/maxpumperla/deep_learning_and_the_game_of_go
+
+The code may have been modified and adapted for educational purposes.
+"""
+
+import numpy as np
+
+from dlgo.encoders.features import BoardFeatures, FeatureEncoder, one_hot_planes
+
+
+class SevenPlaneEncoder(FeatureEncoder):
+    """
+    Planes 0 - 2: stones of the player to move with 1, 2 and 3+ liberties.
+    Planes 3 - 5: opponent stones with 1, 2 and 3+ liberties.
+    Plane 6: points the player to move can't play because of ko.
+    """
+
+    def __init__(self, board_size):
+        super().__init__(board_size, num_planes=7)
+
+    def name(self):
+        return "sevenplane"
+
+    def encode_features(self, features: BoardFeatures, out):
+        liberties = features.liberties
+        stones = features.stones
+        one_hot_planes(np.where(stones == 1, liberties, 0), out[0:3], first_value=1)
+        one_hot_planes(np.where(stones == -1, liberties, 0), out[3:6], first_value=1)
+        out[6] = features.ko
+
+
+def create(board_size):
+    return SevenPlaneEncoder(board_size)
@@ -25,15 +25,39 @@ class IllegalMoveError(Exception):
 
 
 class GameState:
-    def __init__(self, board, next_player, previous, move):
+    """
+    A position together with how it was reached.
+
+    By default every state keeps its predecessor alive through previous_state, and with it every earlier board. Pass
+    max_history (e.g. to new_game) to keep at most that many previous states reachable, so that memory per game stays
+    proportional to one board: the superko hashes in previous_states, the last two moves for is_over, and a compact
+    record of the moves (see move_history and replay) are kept regardless. max_history carries over to the states
+    created by apply_move.
+    """
+
+    def __init__(self, board, next_player, previous, move, max_history=None):
         self.board = board
         self.next_player = next_player
         self.previous_state = previous
+        self.max_history = max_history
         if previous is None:
             self.previous_states = frozenset()
+            self.previous_move = None
+            # The first position of the game, from which the moves in _move_record can be replayed.
+            self._root = self
+            self._move_record = None
+            # Moves played since the first position, i.e. len(move_history()), without walking the record.
+            self.move_number = 0
         else:
             self.previous_states = frozenset(previous.previous_states | {(previous.next_player, previous.board.zobrist_hash())})
+            self.previous_move = previous.last_move
+            self._root = previous._root
+            # A linked list of (move, earlier record) pairs, shared with the previous states.
+            self._move_record = (move, previous._move_record)
+            self.move_number = previous.move_number + 1
         self.last_move = move
+        if max_history is not None:
+            self.previous_state = _limit_history(previous, max_history)
 
     def apply_move(self, move):
         """Return the new GameState after applying the move."""
@@ -42,14 +66,43 @@ class GameState:
             next_board.place_stone(self.next_player, move.point)
         else:
             next_board = self.board
-        return GameState(next_board, self.next_player.other, self, move)
+        return GameState(next_board, self.next_player.other, self, move, self.max_history)
 
     @classmethod
-    def new_game(cls, board_size):
+    def new_game(cls, board_size, max_history=None):
         if isinstance(board_size, int):
             board_size = (board_size, board_size)
         board = Board(*board_size)
-        return GameState(board, Player.black, None, None)
+        return GameState(board, Player.black, None, None, max_history)
+
+    def move_history(self):
+        """All moves played since the first position of the game, oldest first."""
+        moves = []
+        record = self._move_record
+        while record is not None:
+            move, record = record
+            moves.append(move)
+        moves.reverse()
+        return moves
+
+    def replay(self):
+        """
+        Rebuild the states of the game from its first position up to this one, oldest first, with their full history.
+        This works however much history is retained, e.g. to review a game played with max_history.
+        """
+        game_state = GameState(self._root.board, self._root.next_player, None, self._root.last_move)
+        yield game_state
+        for move in self.move_history():
+            game_state = game_state.apply_move(move)
+            yield game_state
+
+    @property
+    def history_truncated(self):
+        """True if previous_state does not lead back to the first position of the game."""
+        state = self
+        while state.previous_state is not None:
+            state = state.previous_state
+        return state is not self._root
 
     def is_move_self_capture(self, player, move):
         if not move.is_play:
@@ -86,7 +139,7 @@ class GameState:
             return False
         if self.last_move.is_resign:
             return True
-        second_last_move = self.previous_state.last_move
+        second_last_move = self.previous_move
         if second_last_move is None:
             return False
         return self.last_move.is_pass and second_last_move.is_pass
@@ -111,3 +164,23 @@ class GameState:
             return self.next_player
         game_result = compute_game_result(self)
         return game_result.winner
+
+
+def _limit_history(state, num_states):
+    """
+    Return state if at most num_states states, state included, are reachable from it through previous_state, and
+    otherwise a shallow copy of state that reaches only num_states. Existing states are never changed, as other
+    states (e.g. the siblings in a search tree) may still rely on their history.
+    """
+    if state is None or num_states == 0:
+        return None
+    reachable = state
+    for _ in range(num_states - 1):
+        reachable = reachable.previous_state
+        if reachable is None:
+            return state
+    if reachable.previous_state is None:
+        return state
+    trimmed = copy.copy(state)
+    trimmed.previous_state = _limit_history(state.previous_state, num_states - 1)
+    return trimmed
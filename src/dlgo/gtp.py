@@ -0,0 +1,262 @@
+"""
+This file is based on code from the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+Original code repository: https://github.com/maxpumperla/deep_learning_and_the_game_of_go
+
+The code may have been modified and adapted for educational purposes.
+"""
+
+import inspect
+import sys
+
+from dlgo.gamestate import GameState
+from dlgo.gotypes import Player, Point
+from dlgo.move import Move
+from dlgo.scoring import compute_game_result
+from dlgo.utils import COLS
+
+PROTOCOL_VERSION = 2
+# In main time, a move may use this fraction of the remaining time.
+MAIN_TIME_FRACTION = 1 / 20
+# In byo-yomi, a move may use this share of its part of the period, keeping a margin for overhead.
+BYO_YOMI_SAFETY = 0.8
+
+_PLAYERS = {"b": Player.black, "black": Player.black, "w": Player.white, "white": Player.white}
+
+
+class GTPError(Exception):
+    """A command that fails; its message is sent back as the GTP error response."""
+
+
+def format_vertex(move):
+    if move.is_pass:
+        return "pass"
+    if move.is_resign:
+        return "resign"
+    return f"{COLS[move.point.col - 1]}{move.point.row}"
+
+
+def parse_vertex(text, board_size):
+    text = text.strip().upper()
+    if text == "PASS":
+        return Move.pass_turn()
+    if text == "RESIGN":
+        return Move.resign()
+    if len(text) < 2 or text[0] not in COLS or not text[1:].isdigit():
+        raise GTPError("invalid coordinate")
+    point = Point(row=int(text[1:]), col=COLS.index(text[0]) + 1)
+    if not (1 <= point.row <= board_size and 1 <= point.col <= board_size):
+        raise GTPError("invalid coordinate")
+    return Move.play(point)
+
+
+def parse_color(text):
+    if text.lower() not in _PLAYERS:
+        raise GTPError("invalid color")
+    return _PLAYERS[text.lower()]
+
+
+class GTPEngine:
+    """
+    Runs an agent as a Go Text Protocol engine, for Go GUIs and tournament managers.
+
+    Besides the required commands, the engine supports komi, showboard, final_score, undo, time_settings and
+    time_left. Before every genmove the agent gets a time budget (see Agent.set_time_budget) derived from the time
+    left for its color. Agents that can keep their search tree between moves (reuse_tree) are switched to do so,
+    so the tree of one genmove is continued after the opponent's reply.
+
+    board_sizes limits the sizes that boardsize accepts, e.g. to the size an agent's encoder was built for.
+    """
+
+    def __init__(self, agent, board_size=19, komi=7.5, name="dlgo", version="0.1", board_sizes=None):
+        self.agent = agent
+        if hasattr(agent, "reuse_tree"):
+            agent.reuse_tree = True
+        self.name = name
+        self.version = version
+        self.komi = komi
+        self.board_sizes = board_sizes
+        self.board_size = board_size
+        self.time_settings = None
+        self.time_left = {}
+        # The states of the game so far, the current one last, for undo.
+        self.history = [GameState.new_game(board_size)]
+        self.commands = {
+            "protocol_version": self.cmd_protocol_version,
+            "name": self.cmd_name,
+            "version": self.cmd_version,
+            "known_command": self.cmd_known_command,
+            "list_commands": self.cmd_list_commands,
+            "quit": self.cmd_quit,
+            "boardsize": self.cmd_boardsize,
+            "clear_board": self.cmd_clear_board,
+            "komi": self.cmd_komi,
+            "play": self.cmd_play,
+            "genmove": self.cmd_genmove,
+            "undo": self.cmd_undo,
+            "time_settings": self.cmd_time_settings,
+            "time_left": self.cmd_time_left,
+            "showboard": self.cmd_showboard,
+            "final_score": self.cmd_final_score,
+        }
+        self.stopped = False
+
+    @property
+    def game_state(self):
+        return self.history[-1]
+
+    def handle(self, line):
+        """Execute one line of GTP input and return the response, or None for empty lines and comments."""
+        # Comments and control characters are dropped, tabs count as spaces.
+        line = line.split("#", 1)[0].replace("\t", " ")
+        parts = "".join(c for c in line if ord(c) >= 32).split()
+        if not parts:
+            return None
+        command_id = ""
+        if parts[0].isdigit():
+            command_id = parts.pop(0)
+            if not parts:
+                return f"?{command_id} missing command\n\n"
+        command, args = parts[0].lower(), parts[1:]
+        if command not in self.commands:
+            return f"?{command_id} unknown command\n\n"
+        handler = self.commands[command]
+        try:
+            inspect.signature(handler).bind(*args)
+        except TypeError:
+            return f"?{command_id} wrong number of arguments\n\n"
+        try:
+            result = handler(*args)
+        except GTPError as e:
+            return f"?{command_id} {e}\n\n"
+        return f"={command_id} {result or ''}".rstrip(" ") + "\n\n"
+
+    def run(self, stdin=None, stdout=None):
+        """Serve commands from stdin until quit or end of input."""
+        stdin = sys.stdin if stdin is None else stdin
+        stdout = sys.stdout if stdout is None else stdout
+        for line in stdin:
+            response = self.handle(line)
+            if response is not None:
+                stdout.write(response)
+                stdout.flush()
+            if self.stopped:
+                break
+
+    def cmd_protocol_version(self):
+        return str(PROTOCOL_VERSION)
+
+    def cmd_name(self):
+        return self.name
+
+    def cmd_version(self):
+        return self.version
+
+    def cmd_known_command(self, command):
+        return "true" if command in self.commands else "false"
+
+    def cmd_list_commands(self):
+        return "\n".join(self.commands)
+
+    def cmd_quit(self):
+        self.stopped = True
+
+    def cmd_boardsize(self, size):
+        if not size.isdigit() or not 2 <= int(size) <= len(COLS):
+            raise GTPError("unacceptable size")
+        if self.board_sizes is not None and int(size) not in self.board_sizes:
+            raise GTPError("unacceptable size")
+        self.board_size = int(size)
+        self.cmd_clear_board()
+
+    def cmd_clear_board(self):
+        self.history = [GameState.new_game(self.board_size)]
+
+    def cmd_komi(self, komi):
+        try:
+            self.komi = float(komi)
+        except ValueError:
+            raise GTPError("syntax error")
+
+    def _state_for(self, player):
+        """The current state with player to move. GTP allows several moves of one color in a row; our game states
+        alternate, so the other side passes in between."""
+        if self.game_state.next_player != player:
+            return self.game_state.apply_move(Move.pass_turn())
+        return self.game_state
+
+    def _append(self, game_state, move):
+        if game_state is not self.game_state:
+            self.history.append(game_state)
+        self.history.append(game_state.apply_move(move))
+
+    def cmd_play(self, color, vertex):
+        player = parse_color(color)
+        move = parse_vertex(vertex, self.board_size)
+        game_state = self._state_for(player)
+        if move.is_play and not game_state.is_valid_move(move):
+            raise GTPError("illegal move")
+        self._append(game_state, move)
+
+    def cmd_genmove(self, color):
+        game_state = self._state_for(parse_color(color))
+        self.agent.set_time_budget(self.time_budget(game_state.next_player))
+        move = self.agent.select_move(game_state)
+        self._append(game_state, move)
+        return format_vertex(move)
+
+    def cmd_undo(self):
+        if len(self.history) < 2:
+            raise GTPError("cannot undo")
+        self.history.pop()
+
+    def cmd_time_settings(self, main_time, byo_yomi_time, byo_yomi_stones):
+        try:
+            self.time_settings = (float(main_time), float(byo_yomi_time), int(byo_yomi_stones))
+        except ValueError:
+            raise GTPError("syntax error")
+        self.time_left = {}
+
+    def cmd_time_left(self, color, seconds, stones):
+        player = parse_color(color)
+        try:
+            self.time_left[player] = (float(seconds), int(stones))
+        except ValueError:
+            raise GTPError("syntax error")
+
+    def cmd_showboard(self):
+        board = self.game_state.board
+        lines = [""]
+        for row in range(board.num_rows, 0, -1):
+            stones = []
+            for col in range(1, board.num_cols + 1):
+                color = board.get_go_string_color(Point(row=row, col=col))
+                stones.append("." if color is None else "X" if color == Player.black else "O")
+            lines.append(f"{row:2d} {' '.join(stones)}")
+        lines.append("   " + " ".join(COLS[: board.num_cols]))
+        return "\n".join(lines)
+
+    def cmd_final_score(self):
+        result = compute_game_result(self.game_state)
+        # Scoring counts area with its own komi; apply the one set by the controller instead.
+        margin = result.b - (result.w + self.komi)
+        if margin == 0:
+            return "0"
+        return f"B+{margin:g}" if margin > 0 else f"W+{-margin:g}"
+
+    def time_budget(self, player):
+        """Seconds the agent may think about its next move, or None without time limits."""
+        if self.time_settings is None:
+            return None
+        main_time, byo_yomi_time, byo_yomi_stones = self.time_settings
+        if byo_yomi_time > 0 and byo_yomi_stones == 0:
+            # GTP's way of saying there are no time limits.
+            return None
+        seconds, stones = self.time_left.get(player, (main_time, 0))
+        if stones > 0:
+            return BYO_YOMI_SAFETY * seconds / stones
+        budget = seconds * MAIN_TIME_FRACTION
+        if byo_yomi_stones > 0:
+            # With byo-yomi to come, every move can use at least its part of a period.
+            budget = max(budget, BYO_YOMI_SAFETY * byo_yomi_time / byo_yomi_stones)
+        return budget
@@ -0,0 +1,187 @@
+"""
+This file is based on code from the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+Original code repository: https://github.com/maxpumperla/deep_learning_and_the_game_of_go
+
+The code may have been modified and adapted for educational purposes.
+"""
+
+import math
+import multiprocessing
+import random
+from collections import namedtuple
+
+import numpy as np
+
+from dlgo.driver import MoveTimer, run_game
+from dlgo.gotypes import Player
+
+# One game of a match. black and winner are agent indices (0 or 1); move_times holds each agent's seconds per move.
+MatchGame = namedtuple("MatchGame", "game_index black winner num_moves margin move_times")
+
+
+def wilson_interval(wins, num_games, z=1.96):
+    """Wilson score interval for a win rate, 95% by default. Unlike the normal approximation it stays in [0, 1]."""
+    if num_games == 0:
+        return 0.0, 1.0
+    p = wins / num_games
+    center = (p + z * z / (2 * num_games)) / (1 + z * z / num_games)
+    spread = z * math.sqrt(p * (1 - p) / num_games + z * z / (4 * num_games * num_games)) / (1 + z * z / num_games)
+    return max(0.0, center - spread), min(1.0, center + spread)
+
+
+def elo_difference(score):
+    """Elo rating difference implied by an expected score (win rate); infinite for scores of 0 or 1."""
+    if score <= 0:
+        return -math.inf
+    if score >= 1:
+        return math.inf
+    return -400 * math.log10(1 / score - 1)
+
+
+def play_timed_game(agents, board_size, max_moves=None):
+    """
+    Play one game between agents, a dict mapping each Player to an agent. Returns (winner, num_moves, margin,
+    move_times) with move_times a dict of each Player's seconds per move. Games that reach max_moves are scored as
+    they stand; margin is None for resignations.
+    """
+    timer = MoveTimer()
+    outcome = run_game(agents, board_size, [timer], max_moves)
+    return outcome.winner, outcome.num_moves, outcome.margin, timer.move_times
+
+
+def _finite(value):
+    return value if math.isfinite(value) else None
+
+
+class MatchResult:
+    """The games of a match between two agents, with win rate, Elo and move time statistics for the first one."""
+
+    def __init__(self, games, names=("A", "B")):
+        self.games = sorted(games, key=lambda game: game.game_index)
+        self.names = tuple(names)
+
+    @property
+    def num_games(self):
+        return len(self.games)
+
+    def wins(self, agent=0):
+        return sum(1 for game in self.games if game.winner == agent)
+
+    def win_rate(self, agent=0):
+        return self.wins(agent) / self.num_games if self.games else 0.0
+
+    def confidence_interval(self, agent=0, z=1.96):
+        return wilson_interval(self.wins(agent), self.num_games, z)
+
+    def elo(self, agent=0):
+        """Elo difference of agent over its opponent, with the confidence interval carried over from the win rate."""
+        low, high = self.confidence_interval(agent)
+        return elo_difference(self.win_rate(agent)), (elo_difference(low), elo_difference(high))
+
+    def wins_as_black(self, agent=0):
+        return sum(1 for game in self.games if game.black == agent and game.winner == agent)
+
+    def move_times(self, agent=0):
+        return np.array([t for game in self.games for t in game.move_times[agent]])
+
+    def move_time_stats(self, agent=0):
+        times = self.move_times(agent)
+        if len(times) == 0:
+            return {"moves": 0}
+        return {
+            "moves": len(times),
+            "mean": float(times.mean()),
+            "median": float(np.median(times)),
+            "p95": float(np.percentile(times, 95)),
+            "max": float(times.max()),
+        }
+
+    def to_dict(self):
+        """The match statistics as plain JSON data; infinite Elo differences (no wins or no losses) become None."""
+        elo, (elo_low, elo_high) = self.elo()
+        low, high = self.confidence_interval()
+        return {
+            "agents": list(self.names),
+            "games": self.num_games,
+            "wins": [self.wins(0), self.wins(1)],
+            "wins_as_black": [self.wins_as_black(0), self.wins_as_black(1)],
+            "win_rate": self.win_rate(),
+            "win_rate_interval": [low, high],
+            "elo": _finite(elo),
+            "elo_interval": [_finite(elo_low), _finite(elo_high)],
+            "mean_game_length": float(np.mean([game.num_moves for game in self.games])) if self.games else 0.0,
+            "move_times": [self.move_time_stats(0), self.move_time_stats(1)],
+        }
+
+    def summary(self):
+        data = self.to_dict()
+        low, high = data["win_rate_interval"]
+        elo, (elo_low, elo_high) = self.elo()
+        lines = [
+            f"{self.names[0]} vs {self.names[1]}: {data['wins'][0]}-{data['wins'][1]} in {self.num_games} games",
+            f"Win rate of {self.names[0]}: {data['win_rate']:.1%} (95% CI {low:.1%} - {high:.1%})",
+            f"Elo difference: {elo:+.0f} (95% CI {elo_low:+.0f} - {elo_high:+.0f})",
+            f"Average game length: {data['mean_game_length']:.1f} moves",
+        ]
+        for name, stats in zip(self.names, data["move_times"]):
+            if stats["moves"]:
+                lines.append(
+                    f"{name}: {stats['moves']} moves, {stats['mean'] * 1000:.1f} ms mean, "
+                    f"{stats['median'] * 1000:.1f} ms median, {stats['p95'] * 1000:.1f} ms p95, {stats['max'] * 1000:.1f} ms max"
+                )
+        return "\n".join(lines)
+
+
+# The agents of a match worker process, created once by _init_worker.
+_worker_agents = None
+
+
+def _init_worker(factories):
+    global _worker_agents
+    _worker_agents = [factory() for factory in factories]
+
+
+def _play_match_game(task):
+    game_index, seed, board_size, max_moves = task
+    random.seed(seed)
+    np.random.seed(seed)
+    # The agents swap colors every game.
+    black = game_index % 2
+    agents = {Player.black: _worker_agents[black], Player.white: _worker_agents[1 - black]}
+    winner, num_moves, margin, move_times = play_timed_game(agents, board_size, max_moves)
+    by_agent = (move_times[Player.black], move_times[Player.white]) if black == 0 else (move_times[Player.white], move_times[Player.black])
+    winner_index = black if winner == Player.black else 1 - black
+    return MatchGame(game_index, black, winner_index, num_moves, margin, by_agent)
+
+
+def play_match(agent_a, agent_b, num_games, board_size=9, max_moves=None, workers=1, seed=None, names=("A", "B"), progress=None):
+    """
+    Play num_games games between two agents and return a MatchResult from the point of view of agent_a.
+
+    agent_a and agent_b are picklable functions creating the agents (e.g. an Agent class, a functools.partial or
+    dlgo.agent.specs.agent_factory), called once in every worker process. The agents alternate colors, agent_a
+    taking black in even games. Game i is seeded with seed + i, so results do not depend on the number of workers.
+    progress, if given, is called with (games_done, num_games, result_so_far) after every game.
+    """
+    if seed is None:
+        seed = random.SystemRandom().randrange(2**32)
+    tasks = [(i, (seed + i) % 2**32, board_size, max_moves) for i in range(num_games)]
+    games = []
+    for game in _play_tasks(tasks, (agent_a, agent_b), workers):
+        games.append(game)
+        if progress is not None:
+            progress(len(games), num_games, MatchResult(games, names))
+    return MatchResult(games, names)
+
+
+def _play_tasks(tasks, factories, workers):
+    if workers <= 1:
+        _init_worker(factories)
+        for task in tasks:
+            yield _play_match_game(task)
+        return
+
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(factories,)) as pool:
+        # Results are collected as games finish; MatchResult orders them by game index.
+        yield from pool.imap_unordered(_play_match_game, tasks)
@@ -0,0 +1,198 @@
+"""
+This file is based on code from the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+Original code repository: https://github.com/maxpumperla/deep_learning_and_the_game_of_go
+
+The code may have been modified and adapted for educational purposes.
+"""
+
+import multiprocessing
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+import numpy as np
+import torch
+
+__all__ = [
+    "InferenceClient",
+    "InferenceQueue",
+    "InferenceServer",
+    "model_evaluator",
+]
+
+
+def model_evaluator(model, device=None):
+    """Wrap a PyTorch model into a numpy-in, numpy-out evaluate function for InferenceQueue and agents."""
+    device = torch.device("cpu") if device is None else torch.device(device)
+    model = model.to(device)
+    model.eval()
+
+    def evaluate(features):
+        with torch.inference_mode():
+            output = model(torch.from_numpy(np.ascontiguousarray(features, dtype=np.float32)).to(device))
+        if isinstance(output, (tuple, list)):
+            return tuple(part.float().cpu().numpy() for part in output)
+        return output.float().cpu().numpy()
+
+    return evaluate
+
+
+def _split(results, sizes):
+    """Split batched results (an array or a tuple of arrays, e.g. policy and value) into one result per request."""
+    offsets = np.cumsum(sizes)[:-1]
+    if isinstance(results, tuple):
+        return list(zip(*(np.split(part, offsets) for part in results)))
+    return np.split(results, offsets)
+
+
+def _collect(requests, first, max_batch_size, timeout):
+    """Gather requests after first until they add up to max_batch_size positions or timeout seconds have passed."""
+    batch = [first]
+    size = len(first[1])
+    deadline = time.monotonic() + timeout
+    while size < max_batch_size:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            request = requests.get(timeout=remaining)
+        except queue.Empty:
+            break
+        if request is None:
+            # Put the stop request back for the serving loop.
+            requests.put(None)
+            break
+        batch.append(request)
+        size += len(request[1])
+    return batch
+
+
+class InferenceQueue:
+    """
+    Collects evaluation requests from many threads (e.g. one per game) and runs them as batched calls.
+
+    evaluate takes an (N, ...) numpy batch and returns an (N, ...) array or a tuple of them, e.g. model_evaluator(model).
+    A background thread waits for the first request, then gathers more until max_batch_size positions are waiting
+    or timeout seconds have passed, runs evaluate once on all of them and hands every caller its own rows.
+
+    The queue can be used directly as the evaluate function of an agent: calling it with a batch submits the batch
+    and waits for its rows.
+    """
+
+    def __init__(self, evaluate, max_batch_size=64, timeout=0.002):
+        self.evaluate = evaluate
+        self.max_batch_size = max_batch_size
+        self.timeout = timeout
+        self.num_batches = 0
+        self.num_positions = 0
+        self._requests = queue.Queue()
+        self._thread = threading.Thread(target=self._serve, name="InferenceQueue", daemon=True)
+        self._thread.start()
+
+    def submit(self, features):
+        """Submit an (N, ...) batch of positions and return a Future for the (N, ...) results."""
+        future = Future()
+        self._requests.put((future, np.asarray(features)))
+        return future
+
+    def __call__(self, features):
+        return self.submit(features).result()
+
+    def close(self):
+        """Stop the background thread once the requests already submitted are served."""
+        self._requests.put(None)
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _serve(self):
+        while True:
+            first = self._requests.get()
+            if first is None:
+                return
+            batch = _collect(self._requests, first, self.max_batch_size, self.timeout)
+            futures = [future for future, _ in batch]
+            sizes = [len(features) for _, features in batch]
+            try:
+                results = _split(self.evaluate(np.concatenate([features for _, features in batch])), sizes)
+            except Exception as e:
+                for future in futures:
+                    future.set_exception(e)
+                continue
+            self.num_batches += 1
+            self.num_positions += sum(sizes)
+            for future, result in zip(futures, results):
+                future.set_result(result)
+
+
+def _serve_process(make_evaluate, requests, responses, max_batch_size, timeout):
+    evaluate = make_evaluate()
+    while True:
+        first = requests.get()
+        if first is None:
+            return
+        batch = _collect(requests, first, max_batch_size, timeout)
+        sizes = [len(features) for _, features in batch]
+        try:
+            results = _split(evaluate(np.concatenate([features for _, features in batch])), sizes)
+        except Exception as e:
+            results = [e] * len(batch)
+        for (client, _), result in zip(batch, results):
+            responses[client].put(result)
+
+
+class InferenceClient:
+    """Callable handle on an InferenceServer for one process; each client serves one caller at a time."""
+
+    def __init__(self, requests, responses, index):
+        self._requests = requests
+        self._responses = responses
+        self._index = index
+
+    def __call__(self, features):
+        self._requests.put((self._index, np.asarray(features)))
+        result = self._responses.get()
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+class InferenceServer:
+    """
+    Batches requests from several processes, e.g. self-play workers, in one serving process that owns the model.
+
+    make_evaluate is a picklable callable (e.g. a module-level function or functools.partial) that builds the
+    evaluate function inside the serving process, so the model is loaded once, there. Hand client(i) to worker i
+    (for example through multiprocessing.Pool's initializer); every client can have one request in flight.
+    """
+
+    def __init__(self, make_evaluate, num_clients, max_batch_size=64, timeout=0.002, context=None):
+        ctx = multiprocessing.get_context(context)
+        self._requests = ctx.Queue()
+        self._responses = [ctx.Queue() for _ in range(num_clients)]
+        self._process = ctx.Process(
+            target=_serve_process,
+            args=(make_evaluate, self._requests, self._responses, max_batch_size, timeout),
+            name="InferenceServer",
+            daemon=True,
+        )
+        self._process.start()
+
+    def client(self, index):
+        return InferenceClient(self._requests, self._responses[index], index)
+
+    def close(self):
+        self._requests.put(None)
+        self._process.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,152 @@
+"""
+This file is based on code from the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+Original code repository: https://github.com/maxpumperla/deep_learning_and_the_game_of_go
+
+The code may have been modified and adapted for educational purposes.
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from dlgo.data.compact import ko_point
+from dlgo.symmetry import canonical_hash, inverse_symmetry, transform_planes, transform_point
+
+__all__ = [
+    "EvaluationCache",
+    "evaluate_with_cache",
+    "position_key",
+]
+
+# Rough per-entry cost of the dictionary slot, key tuple and value tuple, on top of the arrays themselves.
+_ENTRY_OVERHEAD = 256
+
+
+def position_key(game_state, encoder_name, canonicalize=False, move_age_levels=0):
+    """
+    Return (key, symmetry) identifying the encoded position of game_state: the board, the player to move and the
+    point that is forbidden by ko. This covers encoders that only look at the current position, like oneplane,
+    sevenplane and elevenplane. For encoders that also look at the recent moves, like the move-age planes of the
+    alphago encoder, pass their move_age_levels (see Encoder.move_age_levels) to add the move ages of the stones,
+    as far as the encoder tells them apart, to the key.
+
+    With canonicalize, the key uses the board's canonical hash (see dlgo.symmetry.canonical_hash), so all rotations
+    and reflections of a position share it, and symmetry is the one that turns this board into the canonical one.
+    Otherwise the key uses the board's Zobrist hash and symmetry is 0, the identity.
+    """
+    board = game_state.board
+    point = ko_point(game_state)
+    if canonicalize:
+        code, symmetry = canonical_hash(board.stone_array())
+        if point is not None:
+            point = transform_point(point, (board.num_cols, board.num_rows), symmetry)
+    else:
+        code, symmetry = board.zobrist_hash(), 0
+    ko = None if point is None else (point.row, point.col)
+    key = (code, game_state.next_player, encoder_name, ko)
+    if move_age_levels:
+        ages = np.minimum(board.move_ages.move_ages, move_age_levels - 1).astype(np.int8)
+        key += (transform_planes(ages, symmetry).tobytes(),)
+    return key, symmetry
+
+
+class EvaluationCache:
+    """
+    A thread-safe LRU cache of network outputs, (policy, value) per position, bounded by max_bytes.
+
+    Keys come from position_key. Policies are laid out as one entry per board point, numbered row by row as the
+    encoders do, optionally followed by extra entries such as a pass logit; with canonicalized keys, the point
+    entries are stored in the orientation of the canonical board and turned back on lookup, so a position seen
+    rotated or mirrored is a hit. A cache can be shared by several agents or search threads and kept across
+    select_move calls and games. hits, misses and evictions count lookups and dropped entries.
+    """
+
+    def __init__(self, max_bytes=64 << 20, canonicalize=False):
+        self.max_bytes = max_bytes
+        self.canonicalize = canonicalize
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        return {
+            "entries": len(self._entries),
+            "bytes": self.nbytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hit_rate,
+        }
+
+    def key(self, game_state, encoder_name, move_age_levels=0):
+        return position_key(game_state, encoder_name, self.canonicalize, move_age_levels)
+
+    def get(self, key, symmetry, board_shape):
+        """Return the (policy, value) stored for key, in the orientation of the board symmetry was taken from."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        policy, value, _ = entry
+        return self._orient(policy, inverse_symmetry(symmetry), board_shape), value
+
+    def put(self, key, symmetry, board_shape, policy, value):
+        policy = self._orient(np.array(policy), symmetry, board_shape)
+        size = policy.nbytes + _ENTRY_OVERHEAD
+        with self._lock:
+            if key in self._entries:
+                self.nbytes -= self._entries.pop(key)[2]
+            self._entries[key] = (policy, float(value), size)
+            self.nbytes += size
+            while self.nbytes > self.max_bytes and self._entries:
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self.nbytes -= evicted
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    @staticmethod
+    def _orient(policy, symmetry, board_shape):
+        if symmetry == 0:
+            return policy
+        num_points = board_shape[0] * board_shape[1]
+        points = transform_planes(policy[:num_points].reshape(board_shape), symmetry)
+        return np.concatenate([points.ravel(), policy[num_points:]])
+
+
+def evaluate_with_cache(cache, encoder, evaluate, game_states):
+    """
+    Return the (policy, values) arrays for game_states, looking positions up in cache and passing only the misses,
+    as one batch, to evaluate (e.g. dlgo.nn.batching.model_evaluator). New results are added to cache.
+    """
+    name = encoder.name()
+    board_shape = (encoder.board_height, encoder.board_width)
+    keys = [cache.key(game_state, name, encoder.move_age_levels) for game_state in game_states]
+    results = [cache.get(key, symmetry, board_shape) for key, symmetry in keys]
+    missing = [i for i, result in enumerate(results) if result is None]
+    if missing:
+        policy, values = evaluate(encoder.encode_batch([game_states[i] for i in missing]))
+        for i, logits, value in zip(missing, policy, values):
+            key, symmetry = keys[i]
+            cache.put(key, symmetry, board_shape, logits, value)
+            results[i] = (logits, float(value))
+    return np.stack([policy for policy, _ in results]), np.array([value for _, value in results])
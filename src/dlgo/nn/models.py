@@ -0,0 +1,77 @@
+"""
+This file is based on code from the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+Original code repository: https://github.com/maxpumperla/deep_learning_and_the_game_of_go
+
+The code may have been modified and adapted for educational purposes.
+"""
+
+import torch
+import torch.nn as nn
+
+
+class PolicyNet(nn.Module):
+    """
+    Convolutional move prediction network: a stack of 3x3 convolutions followed by a 1x1 convolution that gives one
+    logit per board point. Takes (N, num_planes, rows, cols) encoded positions and returns (N, rows * cols) logits.
+    Being fully convolutional, it works for any board size.
+    """
+
+    def __init__(self, num_planes, num_filters=64, num_layers=4):
+        super().__init__()
+        # The constructor arguments, saved with the weights so that the model can be rebuilt (see create_model).
+        self.config = {"num_planes": num_planes, "num_filters": num_filters, "num_layers": num_layers}
+        layers = []
+        in_channels = num_planes
+        for _ in range(num_layers):
+            layers += [nn.Conv2d(in_channels, num_filters, kernel_size=3, padding=1), nn.ReLU()]
+            in_channels = num_filters
+        self.body = nn.Sequential(*layers)
+        self.policy = nn.Conv2d(in_channels, 1, kernel_size=1)
+
+    def forward(self, x):
+        return torch.flatten(self.policy(self.body(x)), start_dim=1)
+
+
+class PolicyValueNet(nn.Module):
+    """
+    Policy and value network for tree search (see dlgo.agent.puct_agent). A shared stack of 3x3 convolutions feeds
+    a policy head with one logit per board point plus a last one for passing, and a value head that estimates the
+    outcome for the player to move, from -1 (loss) to 1 (win). Takes (N, num_planes, rows, cols) encoded positions
+    and returns (policy, value) with shapes (N, rows * cols + 1) and (N,).
+
+    The pass logit and the value are computed from the board features averaged over all points, so the network
+    stays independent of the board size.
+    """
+
+    def __init__(self, num_planes, num_filters=64, num_layers=4):
+        super().__init__()
+        self.config = {"num_planes": num_planes, "num_filters": num_filters, "num_layers": num_layers}
+        layers = []
+        in_channels = num_planes
+        for _ in range(num_layers):
+            layers += [nn.Conv2d(in_channels, num_filters, kernel_size=3, padding=1), nn.ReLU()]
+            in_channels = num_filters
+        self.body = nn.Sequential(*layers)
+        self.policy = nn.Conv2d(in_channels, 1, kernel_size=1)
+        self.pass_logit = nn.Linear(in_channels, 1)
+        self.value = nn.Sequential(nn.Linear(in_channels, num_filters), nn.ReLU(), nn.Linear(num_filters, 1), nn.Tanh())
+
+    def forward(self, x):
+        features = self.body(x)
+        pooled = features.mean(dim=(2, 3))
+        policy = torch.cat([torch.flatten(self.policy(features), start_dim=1), self.pass_logit(pooled)], dim=1)
+        return policy, self.value(pooled).squeeze(1)
+
+
+# Models that can be restored by name from a saved agent (see dlgo.agent.predict.load_prediction_agent).
+MODELS = {
+    "PolicyNet": PolicyNet,
+    "PolicyValueNet": PolicyValueNet,
+}
+
+
+def create_model(name, **kwargs):
+    if name not in MODELS:
+        raise ValueError(f"Unknown model {name}, expected one of {sorted(MODELS)}")
+    return MODELS[name](**kwargs)
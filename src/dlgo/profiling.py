@@ -0,0 +1,166 @@
+"""
+This file is based on code from the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+Original code repository: https://github.com/maxpumperla/deep_learning_and_the_game_of_go
+
+The code may have been modified and adapted for educational purposes.
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+OUTSIDE_DLGO = "(outside dlgo)"
+
+
+# The directory holding the dlgo package.
+_PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def module_name(filename):
+    """The dotted module name of a dlgo source file (e.g. "dlgo.agent.mcts_agent"), or None for other files."""
+    try:
+        path = os.path.relpath(os.path.abspath(os.path.splitext(filename)[0]), _PACKAGE_ROOT)
+    except ValueError:
+        # On Windows, for files on another drive.
+        return None
+    parts = path.split(os.sep)
+    if parts[0] != "dlgo":
+        return None
+    if parts[-1] == "__init__":
+        parts = parts[:-1]
+    return ".".join(parts)
+
+
+def frame_label(code):
+    """A readable name for a code object, e.g. "dlgo.board:Board.place_stone" or "random.py:choice"."""
+    name = getattr(code, "co_qualname", code.co_name)
+    module = module_name(code.co_filename)
+    return f"{module or os.path.basename(code.co_filename)}:{name}"
+
+
+class SamplingProfiler:
+    """
+    A sampling profiler for the thread that starts it, e.g. around the game loop of a script.
+
+    A background thread records the Python call stack of the profiled thread every interval seconds; as Python
+    switches threads every few milliseconds (see sys.setswitchinterval), the effective interval may be longer.
+    Sampling keeps the slowdown small compared with cProfile, and the samples give whole call stacks:
+    write_collapsed writes them in the collapsed format of flamegraph.pl, speedscope and similar tools, and summary
+    attributes the time to dlgo modules and functions.
+    """
+
+    def __init__(self, interval=0.001):
+        self.interval = interval
+        # Number of samples per call stack, a tuple of code objects from the outermost call to the innermost.
+        self.stacks = Counter()
+        self.seconds = 0.0
+        self._thread_id = None
+        self._stop = threading.Event()
+        self._sampler = None
+        self._start_time = None
+
+    @property
+    def num_samples(self):
+        return sum(self.stacks.values())
+
+    def start(self):
+        self._thread_id = threading.get_ident()
+        self._stop.clear()
+        self._start_time = time.perf_counter()
+        self._sampler = threading.Thread(target=self._sample, name="SamplingProfiler", daemon=True)
+        self._sampler.start()
+
+    def stop(self):
+        self._stop.set()
+        self._sampler.join()
+        self.seconds += time.perf_counter() - self._start_time
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(frame.f_code)
+                frame = frame.f_back
+            if stack:
+                self.stacks[tuple(reversed(stack))] += 1
+
+    def collapsed(self):
+        """The samples as collapsed stacks, one "outer;...;inner count" line per distinct stack."""
+        lines = Counter()
+        for stack, count in self.stacks.items():
+            lines[";".join(frame_label(code) for code in stack)] += count
+        return [f"{stack} {count}" for stack, count in lines.most_common()]
+
+    def write_collapsed(self, path):
+        with open(path, "w") as f:
+            for line in self.collapsed():
+                f.write(line + "\n")
+
+    def module_samples(self):
+        """
+        Samples per dlgo module. Each sample counts for the innermost dlgo function on its stack, so time spent in
+        the standard library or numpy on behalf of, say, an encoder is attributed to the encoder.
+        """
+        counts = Counter()
+        for stack, count in self.stacks.items():
+            module = next((module_name(code.co_filename) for code in reversed(stack) if module_name(code.co_filename)), None)
+            counts[module or OUTSIDE_DLGO] += count
+        return counts
+
+    def function_samples(self):
+        """(self, total) samples per function label: self counts the samples where the function was running."""
+        own, total = Counter(), Counter()
+        for stack, count in self.stacks.items():
+            own[frame_label(stack[-1])] += count
+            # Recursive functions count once per sample.
+            for label in {frame_label(code) for code in stack}:
+                total[label] += count
+        return own, total
+
+    def summary(self, top=20):
+        """A report of the time per dlgo module and of the top functions by self time."""
+        num_samples = self.num_samples
+        if not num_samples:
+            return "No samples recorded."
+        seconds_per_sample = self.seconds / num_samples
+        lines = [f"{num_samples} samples over {self.seconds:.2f}s", "", f"{'module':<40} {'seconds':>8} {'share':>7}"]
+        for module, count in self.module_samples().most_common():
+            lines.append(f"{module:<40} {count * seconds_per_sample:>8.2f} {count / num_samples:>7.1%}")
+        own, total = self.function_samples()
+        lines += ["", f"{'function':<60} {'self':>7} {'total':>7}"]
+        for label, count in own.most_common(top):
+            lines.append(f"{label:<60} {count / num_samples:>7.1%} {total[label] / num_samples:>7.1%}")
+        return "\n".join(lines)
+
+
+@contextmanager
+def profile_to(path, top=20, file=None):
+    """
+    Profile the enclosed block with a SamplingProfiler if path is given, then write the collapsed stacks to path and
+    print the summary to file (stderr by default), also when the block is interrupted, e.g. with Ctrl-C.
+    """
+    if path is None:
+        yield None
+        return
+    file = sys.stderr if file is None else file
+    profiler = SamplingProfiler()
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        profiler.write_collapsed(path)
+        print(profiler.summary(top), file=file)
+        print(f"Wrote the collapsed stacks to {path}", file=file)
@@ -0,0 +1,65 @@
+"""
+This file is based on code from the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+Original code repository: https://github.com/maxpumperla/deep_learning_and_the_game_of_go
+
+The code may have been modified and adapted for educational purposes.
+"""
+
+from dlgo.board import Board
+from dlgo.gamestate import GameState, IllegalMoveError
+from dlgo.gotypes import Player
+
+
+def replay_moves(moves, board_size=19, board=None):
+    """
+    Replay trusted (player, move) pairs on a single mutable board, yielding (game_state, move) for every move with
+    game_state the position the move is played from and game_state.next_player the player making it.
+
+    Unlike GameState.apply_move, no board is copied and no history is kept, so memory use is constant and each move
+    costs one Board.place_stone. Plays off the board, on an occupied point or that capture their own stones raise
+    IllegalMoveError before the board changes; ko and superko are not checked. In return:
+
+    - every yielded game_state shares the same board, which changes as soon as the generator resumes, so use (e.g.
+      encode) each position before asking for the next one and copy it if it must be kept;
+    - game_state.previous_state is None and previous_states only holds the position before the last move, which is
+      enough to detect simple ko (e.g. for the ko planes of the encoders) but not longer cycles.
+
+    If board is given, the moves are played on it (e.g. a board with handicap stones), otherwise on an empty board.
+    """
+    if board is None:
+        board = Board(board_size, board_size) if isinstance(board_size, int) else Board(*board_size)
+    previous_situation = None
+    last_move = None
+    previous_move = None
+    for move_number, (player, move) in enumerate(moves):
+        game_state = GameState(board, player, None, last_move)
+        game_state.previous_move = previous_move
+        game_state.move_number = move_number
+        if previous_situation is not None:
+            game_state.previous_states = frozenset((previous_situation,))
+        yield game_state, move
+        if move.is_play:
+            _check_play(board, player, move.point)
+            # Retaking a ko would recreate this board with the opponent to play.
+            previous_situation = (player, board.zobrist_hash())
+            board.place_stone(player, move.point)
+        previous_move = last_move
+        last_move = move
+
+
+def _check_play(board, player, point):
+    if not board.is_on_grid(point):
+        raise IllegalMoveError(f"{player} plays off the board at {point}")
+    if board.get_go_string_color(point) is not None:
+        raise IllegalMoveError(f"{player} plays on the occupied point {point}")
+    if board.is_self_capture(player, point):
+        raise IllegalMoveError(f"{player} captures their own stones at {point}")
+
+
+def alternate(moves, first_player=Player.black):
+    """Pair a plain list of moves with alternating players, for replay_moves."""
+    player = first_player
+    for move in moves:
+        yield player, move
+        player = player.other
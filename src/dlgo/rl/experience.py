@@ -0,0 +1,112 @@
+"""
+This file is based on code from the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+Original code repository: https://github.com/maxpumperla/deep_learning_and_the_game_of_go
+
+The code may have been modified and adapted for educational purposes.
+"""
+
+import os
+
+import numpy as np
+
+from dlgo.data.compact import compact_position, decode_oneplane, stack_positions, stones_from_arrays, to_game_state
+from dlgo.data.labels import LABEL_DTYPE
+from dlgo.data.shards import read_manifest
+
+# Rewards are game outcomes (1 for a win, -1 for a loss) or, for other schemes, small advantages.
+REWARD_DTYPE = np.float16
+
+
+def experience_metadata(encoder, **extra):
+    """Metadata for a ShardWriter that stores experience from agents using encoder."""
+    return {
+        "encoder": encoder.name(),
+        "board_size": encoder.board_width,
+        "labels": "action",
+        "boards": "compact",
+        "source": "self-play",
+        **extra,
+    }
+
+
+class ExperienceCollector:
+    """
+    Records the decisions of one agent during self-play, one episode (game) at a time.
+
+    Every decision is kept as a compact position (see dlgo.data.compact) and the index of the point played. When an
+    episode ends, complete_episode assigns its reward to all of its decisions. Completed episodes are held in
+    episodes until write_to moves them into an experience buffer, a sharded dataset (see dlgo.data.shards) with one
+    game per episode and the arrays stones, next_player, ko_point, move_number, actions and rewards.
+    """
+
+    def __init__(self):
+        self.episodes = []
+        self._positions = []
+        self._actions = []
+
+    def begin_episode(self):
+        self._positions = []
+        self._actions = []
+
+    def record_decision(self, game_state, action):
+        self._positions.append(compact_position(game_state, game_state.move_number))
+        self._actions.append(action)
+
+    def complete_episode(self, reward):
+        if not self._positions:
+            # Without decisions, e.g. when the opponent resigned first, there is nothing to learn from.
+            self.begin_episode()
+            return
+        arrays = stack_positions(self._positions, self._positions[0]["stones"].shape)
+        arrays["actions"] = np.array(self._actions, dtype=LABEL_DTYPE)
+        arrays["rewards"] = np.full(len(self._actions), reward, dtype=REWARD_DTYPE)
+        self.episodes.append(arrays)
+        self.begin_episode()
+
+    def write_to(self, writer):
+        """Write the completed episodes to a ShardWriter and forget them."""
+        for episode in self.episodes:
+            writer.write_game(**episode)
+        self.episodes = []
+
+
+def decode_positions(arrays, encoder):
+    """
+    Turn the compact positions of an experience shard (or a selection of them) into float32 model input.
+
+    oneplane encodings are computed directly from the stones. For other encoders the positions are rebuilt into
+    game states first, with their ko point but without the rest of their history (e.g. move ages).
+    """
+    stones = stones_from_arrays(arrays, (encoder.board_height, encoder.board_width))
+    if encoder.name() == "oneplane":
+        return decode_oneplane(stones, arrays["next_player"])
+    return encoder.encode_batch([to_game_state(s, p, ko) for s, p, ko in zip(stones, arrays["next_player"], arrays["ko_point"])])
+
+
+def iter_experience_batches(directories, encoder, batch_size=256, shuffle=True, rng=None):
+    """
+    Yield (features, actions, rewards) batches from one or more experience buffers, as float32, int64 and float32
+    numpy arrays. Shards are memory-mapped and read one at a time; with shuffle, the shards and the positions within
+    each shard are visited in random order. Batches do not span shards, so a shard's last batch may be smaller.
+    """
+    if isinstance(directories, str):
+        directories = [directories]
+    rng = np.random.default_rng() if rng is None else rng
+    shards = [(directory, shard["files"]) for directory in directories for shard in read_manifest(directory)["shards"]]
+    if shuffle:
+        rng.shuffle(shards)
+
+    for directory, files in shards:
+        arrays = {name: np.load(os.path.join(directory, file_name), mmap_mode="r") for name, file_name in files.items()}
+        num_positions = len(arrays["actions"])
+        order = rng.permutation(num_positions) if shuffle else np.arange(num_positions)
+        for start in range(0, num_positions, batch_size):
+            # Sorted indices read the memory map front to back.
+            positions = np.sort(order[start : start + batch_size])
+            selected = {name: array[positions] for name, array in arrays.items()}
+            yield (
+                np.asarray(decode_positions(selected, encoder), dtype=np.float32),
+                selected["actions"].astype(np.int64),
+                selected["rewards"].astype(np.float32),
+            )
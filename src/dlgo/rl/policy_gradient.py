@@ -0,0 +1,54 @@
+"""
+This file is based on code from the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+Original code repository: https://github.com/maxpumperla/deep_learning_and_the_game_of_go
+
+The code may have been modified and adapted for educational purposes.
+"""
+
+import numpy as np
+import torch
+
+from dlgo.rl.experience import iter_experience_batches
+
+
+def policy_gradient_loss(logits, actions, rewards):
+    """
+    REINFORCE loss: raise the log probability of the actions taken in won games and lower it in lost ones.
+    logits (N, num_points), actions (N,) point indices and rewards (N,).
+    """
+    log_probs = torch.log_softmax(logits, dim=1)
+    return -(rewards * log_probs.gather(1, actions.unsqueeze(1)).squeeze(1)).mean()
+
+
+def train_policy_gradient(agent, directories, learning_rate=1e-4, batch_size=256, epochs=1, clip_norm=1.0, rng=None):
+    """
+    Update the model of agent (a DeepLearningAgent) with policy gradient on the experience buffers in directories,
+    using SGD. Returns the mean loss of every epoch.
+    """
+    model = agent.model
+    device = next(model.parameters()).device
+    optimizer = torch.optim.SGD(model.parameters(), lr=learning_rate)
+    rng = np.random.default_rng() if rng is None else rng
+
+    losses = []
+    model.train()
+    try:
+        for _ in range(epochs):
+            total, num_batches = 0.0, 0
+            for features, actions, rewards in iter_experience_batches(directories, agent.encoder, batch_size, rng=rng):
+                output = model(torch.from_numpy(features).to(device))
+                if isinstance(output, tuple):
+                    # Policy/value networks: train the policy over the board points.
+                    output = output[0][:, : agent.encoder.num_points()]
+                loss = policy_gradient_loss(output, torch.from_numpy(actions).to(device), torch.from_numpy(rewards).to(device))
+                optimizer.zero_grad()
+                loss.backward()
+                torch.nn.utils.clip_grad_norm_(model.parameters(), clip_norm)
+                optimizer.step()
+                total += loss.item()
+                num_batches += 1
+            losses.append(total / max(num_batches, 1))
+    finally:
+        model.eval()
+    return losses
@@ -0,0 +1,112 @@
+"""
+This file is based on code from the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+Original code repository: https://github.com/maxpumperla/deep_learning_and_the_game_of_go
+
+The code may have been modified and adapted for educational purposes.
+"""
+
+import multiprocessing
+import random
+
+import numpy as np
+import torch
+
+from dlgo.agent.predict import DeepLearningAgent, load_prediction_agent
+from dlgo.data.shards import ShardWriter
+from dlgo.driver import run_game
+from dlgo.gotypes import Player
+from dlgo.rl.experience import ExperienceCollector, experience_metadata
+
+
+def play_game(agents, board_size, max_moves=None):
+    """
+    Play one game between agents, a dict mapping each Player to an agent, and return the winner. Games that reach
+    max_moves are scored as they stand.
+    """
+    return run_game(agents, board_size, max_moves=max_moves).winner
+
+
+def self_play_episodes(agent, board_size, max_moves=None):
+    """
+    Let agent (a DeepLearningAgent) play a game against itself and return the experience of both sides as two
+    episodes (see ExperienceCollector), rewarded 1 for the winner and -1 for the loser.
+    """
+    collectors = {}
+    agents = {}
+    for player in (Player.black, Player.white):
+        # Both sides share the model and its evaluate function but record their own decisions.
+        agents[player] = DeepLearningAgent(agent.model, agent.encoder, temperature=agent.temperature, evaluate=agent.evaluate)
+        collectors[player] = ExperienceCollector()
+        agents[player].set_collector(collectors[player])
+        collectors[player].begin_episode()
+
+    winner = play_game(agents, board_size, max_moves)
+    for player, collector in collectors.items():
+        collector.complete_episode(1 if player == winner else -1)
+    return collectors[Player.black].episodes + collectors[Player.white].episodes
+
+
+# The agent of a self-play worker process, loaded once by _init_worker.
+_worker_agent = None
+
+
+def _load_worker_agent(agent_path, temperature):
+    global _worker_agent
+    _worker_agent = load_prediction_agent(agent_path, temperature=temperature)
+
+
+def _init_worker(agent_path, temperature):
+    # Each worker runs its own forward passes; one thread apiece keeps the processes from competing for the cores.
+    torch.set_num_threads(1)
+    _load_worker_agent(agent_path, temperature)
+
+
+def _play_seeded_game(task):
+    game_index, seed, max_moves = task
+    random.seed(seed)
+    np.random.seed(seed)
+    torch.manual_seed(seed)
+    board_size = (_worker_agent.encoder.board_width, _worker_agent.encoder.board_height)
+    return game_index, self_play_episodes(_worker_agent, board_size, max_moves)
+
+
+def generate_experience(
+    agent_path, out_dir, num_games, temperature=1.0, max_moves=None, workers=1, seed=None, shard_size=4096, progress=None
+):
+    """
+    Let the agent saved at agent_path play num_games games against itself and store the experience of both sides
+    in an experience buffer at out_dir (see dlgo.rl.experience).
+
+    Games are played by a pool of worker processes, each with its own copy of the agent, while this process
+    writes their episodes. Game i is seeded with seed + i, so the buffer does not depend on the number of workers.
+    progress, if given, is called with (games_done, num_games, num_positions) after every game. Returns the number
+    of positions written.
+    """
+    if seed is None:
+        seed = random.SystemRandom().randrange(2**32)
+    tasks = [(i, (seed + i) % 2**32, max_moves) for i in range(num_games)]
+    agent = load_prediction_agent(agent_path)
+    metadata = experience_metadata(agent.encoder, agent=agent_path, temperature=temperature, seed=seed)
+
+    num_positions = 0
+    with ShardWriter(out_dir, shard_size, metadata=metadata) as writer:
+        for games_done, (_, episodes) in enumerate(_play_tasks(tasks, agent_path, temperature, workers), start=1):
+            for episode in episodes:
+                writer.write_game(**episode)
+                num_positions += len(episode["actions"])
+            if progress is not None:
+                progress(games_done, num_games, num_positions)
+    return num_positions
+
+
+def _play_tasks(tasks, agent_path, temperature, workers):
+    if workers <= 1:
+        _load_worker_agent(agent_path, temperature)
+        for task in tasks:
+            yield _play_seeded_game(task)
+        return
+
+    with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(agent_path, temperature)) as pool:
+        # imap hands results back in task order, so the output does not depend on which worker finishes first.
+        yield from pool.imap(_play_seeded_game, tasks)
@@ -0,0 +1,431 @@
+"""
+This file is based on code from the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+Original code repository: https://github.com/maxpumperla/deep_learning_and_the_game_of_go
+
+The code may have been modified and adapted for educational purposes.
+"""
+
+import asyncio
+import itertools
+import json
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from http import HTTPStatus
+
+from dlgo.agent.human import parse_move
+from dlgo.agent.search_stats import SearchMetrics
+from dlgo.agent.specs import agent_factory
+from dlgo.driver import score_game
+from dlgo.gamestate import GameState
+from dlgo.gotypes import Player, Point
+from dlgo.gtp import format_vertex
+
+MAX_BODY_SIZE = 64 * 1024
+
+_PLAYER_NAMES = {Player.black: "black", Player.white: "white"}
+_PLAYERS = {name: player for player, name in _PLAYER_NAMES.items()}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+# Agents of a worker process, by spec, for servers that search in a process pool.
+_worker_agents = {}
+
+
+def _select_move_in_worker(spec, game_state):
+    if spec not in _worker_agents:
+        _worker_agents[spec] = agent_factory(spec)()
+    return _worker_agents[spec].select_move(game_state)
+
+
+class GameSession:
+    """One game hosted by a GameServer: its current state, the agent playing in it and the clients following it."""
+
+    def __init__(self, session_id, board_size, agent_name, agent, human):
+        self.id = session_id
+        # Agents only need the ko history, which is kept regardless, so no earlier states stay alive.
+        self.game_state = GameState.new_game(board_size, max_history=0)
+        self.board_size = board_size
+        self.agent_name = agent_name
+        self.agent = agent
+        # The Player moving through the API, or None if the agent plays both sides.
+        self.human = human
+        self.num_moves = 0
+        self.subscribers = set()
+        # The task playing the agent's moves, while it thinks.
+        self.task = None
+        self.error = None
+        # time.monotonic() of the last move or error; once the game is finished, of its end.
+        self.last_active = time.monotonic()
+
+    @property
+    def agent_to_move(self):
+        return not self.game_state.is_over() and self.game_state.next_player != self.human
+
+    @property
+    def thinking(self):
+        return self.task is not None and not self.task.done()
+
+    @property
+    def finished(self):
+        """True once the game is over or cannot go on because its agent failed."""
+        return self.game_state.is_over() or self.error is not None
+
+    def apply_move(self, move):
+        self.game_state = self.game_state.apply_move(move)
+        self.num_moves += 1
+        self.publish()
+
+    def publish(self):
+        self.last_active = time.monotonic()
+        state = self.to_dict()
+        for queue in self.subscribers:
+            queue.put_nowait(state)
+
+    def close(self):
+        """Stop the agent and end the event streams of the clients following the game."""
+        if self.task is not None:
+            self.task.cancel()
+        for queue in self.subscribers:
+            queue.put_nowait(None)
+
+    def to_dict(self):
+        board = self.game_state.board
+        rows = []
+        for row in range(board.num_rows, 0, -1):
+            colors = (board.get_go_string_color(Point(row=row, col=col)) for col in range(1, board.num_cols + 1))
+            rows.append("".join("." if color is None else "X" if color == Player.black else "O" for color in colors))
+        over = self.game_state.is_over()
+        last_move = self.game_state.last_move
+        return {
+            "id": self.id,
+            "board_size": self.board_size,
+            "agent": self.agent_name,
+            "human": None if self.human is None else _PLAYER_NAMES[self.human],
+            # Rows from the top (row board_size) down, X for black and O for white stones.
+            "board": rows,
+            "next_player": _PLAYER_NAMES[self.game_state.next_player],
+            "last_move": None if last_move is None else format_vertex(last_move),
+            "moves": self.num_moves,
+            "thinking": self.thinking,
+            "over": over,
+            "result": score_game(self.game_state)[1] if over else None,
+            "error": self.error,
+        }
+
+
+class GameServer:
+    """
+    Hosts many concurrent games over HTTP from one asyncio event loop.
+
+    agents maps the agent names clients can ask for to agent specs (see dlgo.agent.specs). Agents think in a pool of
+    worker threads, or with use_processes in worker processes, so the event loop keeps serving other games while a
+    search runs; with processes, each worker keeps one agent per spec, shared by the games it serves.
+
+    The JSON API:
+
+    - POST /games {"board_size": 9, "agent": "random", "human": "black"} starts a game; "human" is the color played
+      through the API, or null to let the agent play both sides. Returns the game state, including its "id".
+    - GET /games lists the ids of the games; GET /games/<id> returns a game's state.
+    - POST /games/<id>/moves {"move": "D4"} plays the human's move ("pass" and "resign" work too); the agent
+      replies in the background.
+    - GET /games/<id>/events streams the game as server-sent events, one "state" event now and after every move,
+      until the game is over.
+    - DELETE /games/<id> ends a game. Games are also dropped finished_ttl seconds after they end, and after
+      idle_timeout seconds without a move, but never while their agent thinks or a client follows their events.
+    - GET /metrics returns the search metrics of the agents (see dlgo.agent.search_stats.SearchMetrics) in the
+      Prometheus text format; agents searching in worker processes are not included.
+    """
+
+    def __init__(self, agents=None, workers=4, use_processes=False, max_sessions=1000, finished_ttl=60.0, idle_timeout=3600.0):
+        self.agents = {"random": "random"} if agents is None else dict(agents)
+        self.use_processes = use_processes
+        if use_processes:
+            # Forked workers would inherit the sockets of open connections and keep them from closing.
+            self.executor = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"))
+        else:
+            self.executor = ThreadPoolExecutor(workers)
+        self.max_sessions = max_sessions
+        self.finished_ttl = finished_ttl
+        self.idle_timeout = idle_timeout
+        self.sessions = {}
+        self.metrics = SearchMetrics()
+        self.server = None
+        self._ids = itertools.count(1)
+
+    async def start(self, host="127.0.0.1", port=8000):
+        """Start listening; port 0 picks a free port (see port)."""
+        self.server = await asyncio.start_server(self._handle_connection, host, port)
+        return self.server
+
+    @property
+    def port(self):
+        return self.server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        for session in self.sessions.values():
+            session.close()
+        self.sessions.clear()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def create_session(self, board_size=9, agent="random", human="black"):
+        if agent not in self.agents:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"Unknown agent {agent!r}, expected one of {sorted(self.agents)}")
+        if not isinstance(board_size, int) or not 2 <= board_size <= 19:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "board_size must be between 2 and 19")
+        if human is not None and human not in _PLAYERS:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "human must be black, white or null")
+        self.expire_sessions()
+        if len(self.sessions) >= self.max_sessions:
+            raise HTTPError(HTTPStatus.SERVICE_UNAVAILABLE, "Too many games")
+        # With a process pool, the workers build their own agents.
+        instance = None if self.use_processes else agent_factory(self.agents[agent])()
+        if hasattr(instance, "add_stats_listener"):
+            instance.add_stats_listener(self.metrics)
+        session = GameSession(str(next(self._ids)), board_size, agent, instance, None if human is None else _PLAYERS[human])
+        self.sessions[session.id] = session
+        self._start_agent(session)
+        return session
+
+    def expire_sessions(self, now=None):
+        """
+        Drop the games that ended finished_ttl seconds ago or saw no move for idle_timeout seconds, along with their
+        agents and search trees, unless their agent is thinking or a client follows their events. Returns the ids of the dropped games.
+        """
+        now = time.monotonic() if now is None else now
+        expired = [
+            session
+            for session in self.sessions.values()
+            if not session.subscribers
+            and not session.thinking
+            and now - session.last_active >= (self.finished_ttl if session.finished else self.idle_timeout)
+        ]
+        for session in expired:
+            del self.sessions[session.id]
+            session.close()
+        return [session.id for session in expired]
+
+    def play(self, session, text):
+        if session.game_state.is_over():
+            raise HTTPError(HTTPStatus.CONFLICT, "The game is over")
+        if session.agent_to_move:
+            raise HTTPError(HTTPStatus.CONFLICT, "It is not your turn")
+        move = parse_move(str(text), session.game_state.board)
+        if move is None or not session.game_state.is_valid_move(move):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"Illegal move {text!r}")
+        session.apply_move(move)
+        self._start_agent(session)
+
+    def _start_agent(self, session):
+        if session.agent_to_move and (session.task is None or session.task.done()):
+            session.task = asyncio.get_running_loop().create_task(self._play_agent(session))
+
+    async def _play_agent(self, session):
+        loop = asyncio.get_running_loop()
+        while session.agent_to_move:
+            game_state = session.game_state
+            try:
+                if self.use_processes:
+                    spec = self.agents[session.agent_name]
+                    move = await loop.run_in_executor(self.executor, _select_move_in_worker, spec, game_state)
+                else:
+                    move = await loop.run_in_executor(self.executor, session.agent.select_move, game_state)
+            except Exception as e:
+                # The game cannot go on; clients see the error in the game state.
+                session.error = f"{type(e).__name__}: {e}"
+                session.publish()
+                return
+            if session.id not in self.sessions:
+                return
+            session.apply_move(move)
+
+    def _session(self, session_id):
+        if session_id not in self.sessions:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"No game {session_id}")
+        return self.sessions[session_id]
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            try:
+                method, path, body = await _read_request(reader)
+                await self._route(method, path, body, writer)
+            except HTTPError as e:
+                await _send_json(writer, e.status, {"error": str(e)})
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _route(self, method, path, body, writer):
+        parts = [part for part in path.split("?", 1)[0].split("/") if part]
+        if parts == ["metrics"] and method == "GET":
+            return await _send(writer, HTTPStatus.OK, self.metrics.to_prometheus().encode("utf-8"), "text/plain; version=0.0.4")
+        if parts == ["games"]:
+            if method == "GET":
+                self.expire_sessions()
+                return await _send_json(writer, HTTPStatus.OK, {"games": list(self.sessions)})
+            if method == "POST":
+                options = _json_object(body)
+                session = self.create_session(options.get("board_size", 9), options.get("agent", "random"), options.get("human", "black"))
+                return await _send_json(writer, HTTPStatus.CREATED, session.to_dict())
+        elif len(parts) == 2 and parts[0] == "games":
+            session = self._session(parts[1])
+            if method == "GET":
+                return await _send_json(writer, HTTPStatus.OK, session.to_dict())
+            if method == "DELETE":
+                del self.sessions[session.id]
+                session.close()
+                return await _send_json(writer, HTTPStatus.OK, {"id": session.id, "deleted": True})
+        elif len(parts) == 3 and parts[0] == "games" and parts[2] == "moves" and method == "POST":
+            session = self._session(parts[1])
+            self.play(session, _json_object(body).get("move"))
+            return await _send_json(writer, HTTPStatus.ACCEPTED, session.to_dict())
+        elif len(parts) == 3 and parts[0] == "games" and parts[2] == "events" and method == "GET":
+            return await self._stream_events(self._session(parts[1]), writer)
+        else:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"No route for {path}")
+        raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, f"{method} is not supported for {path}")
+
+    async def _stream_events(self, session, writer):
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nCache-Control: no-cache\r\nConnection: close\r\n\r\n")
+        queue = asyncio.Queue()
+        session.subscribers.add(queue)
+        try:
+            state = session.to_dict()
+            while True:
+                writer.write(f"event: state\ndata: {json.dumps(state)}\n\n".encode("utf-8"))
+                await writer.drain()
+                if state["over"] or state["error"]:
+                    return
+                state = await queue.get()
+                if state is None:
+                    return
+        finally:
+            session.subscribers.discard(queue)
+
+
+async def _read_request(reader):
+    request_line = await reader.readline()
+    try:
+        method, path, _ = request_line.decode("latin-1").split()
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Malformed request line")
+    content_length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            try:
+                content_length = int(value)
+            except ValueError:
+                raise HTTPError(HTTPStatus.BAD_REQUEST, "Malformed Content-Length")
+    if content_length > MAX_BODY_SIZE:
+        raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large")
+    body = await reader.readexactly(content_length) if content_length else b""
+    return method.upper(), path, body
+
+
+def _json_object(body):
+    try:
+        data = json.loads(body or b"{}")
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "The body must be JSON")
+    if not isinstance(data, dict):
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "The body must be a JSON object")
+    return data
+
+
+async def _send_json(writer, status, data):
+    await _send(writer, status, json.dumps(data).encode("utf-8"), "application/json")
+
+
+async def _send(writer, status, body, content_type):
+    head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\nContent-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n"
+    )
+    writer.write(head.encode("latin-1") + body)
+    await writer.drain()
+
+
+class GameClient:
+    """A minimal asyncio client for GameServer, e.g. for tests and load generation on localhost."""
+
+    def __init__(self, host="127.0.0.1", port=8000):
+        self.host = host
+        self.port = port
+
+    async def request(self, method, path, data=None):
+        """Send one request and return (status, body), with JSON bodies decoded and others as text."""
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            body = b"" if data is None else json.dumps(data).encode("utf-8")
+            head = f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n"
+            writer.write(head.encode("latin-1") + body)
+            await writer.drain()
+            response = await reader.read()
+        finally:
+            writer.close()
+        head, _, body = response.partition(b"\r\n\r\n")
+        status = int(head.split(b" ", 2)[1])
+        if not body:
+            return status, None
+        if b"content-type: application/json" in head.lower():
+            return status, json.loads(body)
+        return status, body.decode("utf-8")
+
+    async def _checked(self, method, path, data=None):
+        status, body = await self.request(method, path, data)
+        if status >= 400:
+            raise HTTPError(HTTPStatus(status), body.get("error", "") if isinstance(body, dict) else body or "")
+        return body
+
+    async def create_game(self, board_size=9, agent="random", human="black"):
+        return await self._checked("POST", "/games", {"board_size": board_size, "agent": agent, "human": human})
+
+    async def state(self, game_id):
+        return await self._checked("GET", f"/games/{game_id}")
+
+    async def play(self, game_id, move):
+        return await self._checked("POST", f"/games/{game_id}/moves", {"move": move})
+
+    async def delete(self, game_id):
+        return await self._checked("DELETE", f"/games/{game_id}")
+
+    async def metrics(self):
+        return await self._checked("GET", "/metrics")
+
+    async def events(self, game_id):
+        """Yield the game states streamed for a game until it is over."""
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            writer.write(f"GET /games/{game_id}/events HTTP/1.1\r\nHost: {self.host}\r\n\r\n".encode("latin-1"))
+            await writer.drain()
+            status_line = await reader.readline()
+            if int(status_line.split(b" ", 2)[1]) != HTTPStatus.OK:
+                raise HTTPError(HTTPStatus(int(status_line.split(b" ", 2)[1])), "Cannot follow the game")
+            while await reader.readline() not in (b"\r\n", b""):
+                pass
+            while True:
+                line = await reader.readline()
+                if not line:
+                    return
+                if line.startswith(b"data: "):
+                    yield json.loads(line[len(b"data: ") :])
+        finally:
+            writer.close()
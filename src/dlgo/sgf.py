@@ -0,0 +1,401 @@
+"""
+This file is based on code from the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+Original code repository: https://github.com/maxpumperla/deep_learning_and_the_game_of_go
+
+The code may have been modified and adapted for educational purposes.
+"""
+
+import codecs
+import os
+import re
+import tarfile
+import zipfile
+
+from dlgo.gamestate import GameState, IllegalMoveError
+from dlgo.gotypes import Player, Point
+from dlgo.move import Move
+from dlgo.replay import replay_moves
+
+__all__ = [
+    "SgfError",
+    "SgfGame",
+    "iter_games",
+    "iter_game_texts",
+    "iter_record_streams",
+    "is_record_file",
+    "parse_game",
+    "record_files",
+    "write_sgf",
+]
+
+# A property value, with \] and \\ escapes; used both to find values and to skip over them while splitting games.
+_VALUE = r"\[(?:\\.|[^\\\]])*\]"
+# Tokens needed to split a collection into games: parentheses outside values, values, and the start of a value that
+# is not terminated yet (which means more input is needed).
+_SPLIT_TOKEN = re.compile(rf"{_VALUE}|[()]|\[", re.S)
+# Tokens of a single game: parentheses, node starts and properties with all their values.
+_GAME_TOKEN = re.compile(rf"([()])|(;)|([A-Za-z]+)\s*((?:{_VALUE}\s*)+)", re.S)
+_VALUES = re.compile(r"\[((?:\\.|[^\\\]])*)\]", re.S)
+_ESCAPE = re.compile(r"\\(.)", re.S)
+
+_COLORS = {"B": Player.black, "W": Player.white}
+_COLOR_NAMES = {Player.black: "B", Player.white: "W"}
+
+_SGF_EXTENSIONS = (".sgf", ".sgfs")
+_TAR_EXTENSIONS = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz")
+
+
+class SgfError(ValueError):
+    pass
+
+
+class SgfGame:
+    """
+    The main line of an SGF game record.
+
+    moves is a list of (player, move) pairs in the order they were played; setup holds the stones placed before the
+    first move (handicap stones) as (player, point) pairs. Points use the Board convention, where row 1 is the
+    bottom row; SGF counts rows from the top.
+    """
+
+    def __init__(self, board_size=19, komi=0.0, handicap=0, moves=None, setup=None, result=None, properties=None):
+        self.board_size = board_size
+        self.komi = komi
+        self.handicap = handicap
+        self.moves = [] if moves is None else moves
+        self.setup = [] if setup is None else setup
+        self.result = result
+        # Root properties as read from the file, e.g. player names in PB and PW, with their first value.
+        self.properties = {} if properties is None else properties
+
+    @property
+    def winner(self):
+        """The winner according to the RE property, or None for draws, unknown or missing results."""
+        if self.result and self.result[:2] in ("B+", "W+"):
+            return _COLORS[self.result[0]]
+        return None
+
+    @property
+    def first_player(self):
+        if self.moves:
+            return self.moves[0][0]
+        return Player.white if self.handicap > 1 else Player.black
+
+    def initial_state(self):
+        """The GameState before the first move, with the setup stones on the board."""
+        game_state = GameState.new_game(self.board_size)
+        for player, point in self.setup:
+            game_state.board.place_stone(player, point)
+        return GameState(game_state.board, self.first_player, None, None)
+
+    def replay(self, trusted=False):
+        """
+        Yield (game_state, move) for every move of the game, where game_state is the position the move is played
+        from and game_state.next_player the player making it.
+
+        With trusted, the game is replayed on a single mutable board without history (see dlgo.replay.replay_moves),
+        which is much faster but only valid for one position at a time. Either way, a play on an occupied point raises
+        SgfError; the trusted replay also raises it for plays that capture their own stones.
+        """
+        if trusted:
+            try:
+                yield from replay_moves(self.moves, board=self.initial_state().board)
+            except IllegalMoveError as e:
+                raise SgfError(str(e)) from e
+            return
+        game_state = self.initial_state()
+        for player, move in self.moves:
+            if game_state.next_player != player:
+                # Records may contain two moves in a row by the same player, e.g. when placing handicap stones.
+                game_state = GameState(game_state.board, player, game_state.previous_state, game_state.last_move)
+            if move.is_play and game_state.board.get_go_string_color(move.point) is not None:
+                raise SgfError(f"{player} plays on the occupied point {move.point}")
+            yield game_state, move
+            game_state = game_state.apply_move(move)
+
+    def final_state(self):
+        """The GameState after the last move."""
+        game_state, move = None, None
+        for game_state, move in self.replay():
+            pass
+        if game_state is None:
+            return self.initial_state()
+        return game_state.apply_move(move)
+
+    @classmethod
+    def from_game_state(cls, game_state: GameState, komi=7.5, result=None, properties=None):
+        """Build a record of a game played from an empty board, e.g. a self-play game, from its final state."""
+        moves = []
+        state = game_state
+        while state.previous_state is not None:
+            if not state.last_move.is_resign:
+                moves.append((state.previous_state.next_player, state.last_move))
+            elif result is None:
+                result = f"{_COLOR_NAMES[state.next_player]}+R"
+            state = state.previous_state
+        moves.reverse()
+        if state.board.num_rows != state.board.num_cols:
+            raise SgfError(f"SGF records need a square board, got {state.board.num_rows}x{state.board.num_cols}")
+        setup = []
+        for go_string in state.board.go_strings():
+            setup.extend((go_string.color, point) for point in sorted(go_string.stones))
+        return cls(state.board.num_rows, komi, 0, moves, setup, result, properties)
+
+    def to_sgf(self):
+        """Return the game as SGF text, one node per move."""
+        size = self.board_size
+        root = [f"FF[4]GM[1]SZ[{size}]KM[{_format_number(self.komi)}]"]
+        if self.handicap:
+            root.append(f"HA[{self.handicap}]")
+        if self.result:
+            root.append(f"RE[{_escape(self.result)}]")
+        for name, value in self.properties.items():
+            if name not in ("FF", "GM", "SZ", "KM", "HA", "RE", "AB", "AW"):
+                root.append(f"{name}[{_escape(value)}]")
+        for player in (Player.black, Player.white):
+            points = [point for color, point in self.setup if color == player]
+            if points:
+                root.append("A" + _COLOR_NAMES[player] + "".join(f"[{_encode_point(point, size)}]" for point in points))
+        nodes = [f"{_COLOR_NAMES[player]}[{_encode_move(move, size)}]" for player, move in self.moves]
+        return "(;" + "".join(root) + "".join(";" + node for node in nodes) + ")\n"
+
+
+def _format_number(value):
+    return f"{value:g}"
+
+
+def _escape(text):
+    return str(text).replace("\\", "\\\\").replace("]", "\\]")
+
+
+def _unescape(text):
+    if "\\" not in text:
+        return text
+    # Escaped line breaks are soft breaks and disappear.
+    text = re.sub(r"\\\r?\n", "", text)
+    return _ESCAPE.sub(r"\1", text)
+
+
+def _decode_point(value, size):
+    if len(value) != 2:
+        raise SgfError(f"Invalid point [{value}]")
+    col = ord(value[0]) - 97
+    row = ord(value[1]) - 97
+    if not (0 <= col < size and 0 <= row < size):
+        raise SgfError(f"Invalid point [{value}] on a {size}x{size} board")
+    return Point(row=size - row, col=col + 1)
+
+
+def _encode_point(point, size):
+    return chr(97 + point.col - 1) + chr(97 + size - point.row)
+
+
+def _decode_move(value, size):
+    value = value.strip()
+    # An empty value is a pass, and so is tt on boards up to 19x19 for compatibility with FF[3].
+    if value == "" or (value == "tt" and size <= 19):
+        return Move.pass_turn()
+    return Move.play(_decode_point(value, size))
+
+
+def _encode_move(move, size):
+    if move.is_pass:
+        return ""
+    return _encode_point(move.point, size)
+
+
+def _decode_points(values, size):
+    """Decode a list of points, expanding compressed rectangles such as [aa:cc]."""
+    points = []
+    for value in values:
+        if ":" in value:
+            first, last = (_decode_point(corner, size) for corner in value.split(":"))
+            for row in range(min(first.row, last.row), max(first.row, last.row) + 1):
+                for col in range(min(first.col, last.col), max(first.col, last.col) + 1):
+                    points.append(Point(row=row, col=col))
+        else:
+            points.append(_decode_point(value, size))
+    return points
+
+
+def _parse_size(value):
+    try:
+        if ":" in value:
+            cols, rows = (int(part) for part in value.split(":"))
+            if cols != rows:
+                raise SgfError(f"Only square boards are supported, got SZ[{value}]")
+            return cols
+        size = int(value)
+    except ValueError:
+        raise SgfError(f"Invalid board size SZ[{value}]") from None
+    if not 1 <= size <= 25:
+        raise SgfError(f"Unsupported board size SZ[{value}]")
+    return size
+
+
+def parse_game(text):
+    """
+    Parse the main line of one SGF game tree into an SgfGame.
+
+    Only the first variation at every branch is read: since the main line ends at the first closing parenthesis,
+    everything after it is skipped without being tokenized.
+    """
+    root = None
+    move_nodes = []
+    node = None
+    started = False
+    for match in _GAME_TOKEN.finditer(text):
+        paren, node_start, name, values = match.groups()
+        if paren == "(":
+            started = True
+        elif paren == ")":
+            break
+        elif node_start:
+            if not started:
+                raise SgfError("SGF game does not start with '('")
+            node = {}
+            if root is None:
+                root = node
+            else:
+                move_nodes.append(node)
+        elif node is not None:
+            # Long property names such as "AddBlack" are FF[1]-style spellings; only capitals count.
+            name = "".join(c for c in name if c.isupper())
+            node.setdefault(name, []).extend(_VALUES.findall(values))
+    if root is None:
+        raise SgfError("SGF game has no nodes")
+    return _build_game(root, move_nodes)
+
+
+def _build_game(root, move_nodes):
+    if root.get("GM", ["1"])[0].strip() not in ("", "1"):
+        raise SgfError(f"Not a game of Go: GM[{root['GM'][0]}]")
+    size = _parse_size(root["SZ"][0]) if "SZ" in root else 19
+    try:
+        komi = float(root["KM"][0]) if root.get("KM", [""])[0].strip() else 0.0
+        handicap = int(root["HA"][0]) if root.get("HA", [""])[0].strip() else 0
+    except ValueError as e:
+        raise SgfError(f"Invalid root property: {e}") from None
+
+    setup = []
+    moves = []
+    for node in [root] + move_nodes:
+        for color in ("B", "W"):
+            if "A" + color in node:
+                if node is not root:
+                    raise SgfError("Setup stones after the first move are not supported")
+                setup.extend((_COLORS[color], point) for point in _decode_points(node["A" + color], size))
+            if color in node:
+                moves.append((_COLORS[color], _decode_move(node[color][0], size)))
+
+    result = _unescape(root["RE"][0]).strip() if "RE" in root else None
+    properties = {name: _unescape(values[0]) for name, values in root.items() if values}
+    return SgfGame(size, komi, handicap, moves, setup, result or None, properties)
+
+
+def iter_game_texts(stream, chunk_size=1 << 20):
+    """
+    Yield the text of every game tree in an SGF collection read from a text stream, one chunk at a time, so that
+    collections of any size can be processed in constant memory.
+    """
+    buffer = ""
+    scanned = 0
+    depth = 0
+    start = None
+    while True:
+        chunk = stream.read(chunk_size)
+        buffer += chunk
+        for match in _SPLIT_TOKEN.finditer(buffer, scanned):
+            token = match.group()
+            if token == "[":
+                # A value that is not terminated yet; scan it again once the next chunk is in.
+                break
+            scanned = match.end()
+            if token == "(":
+                if depth == 0:
+                    start = match.start()
+                depth += 1
+            elif token == ")" and depth > 0:
+                depth -= 1
+                if depth == 0:
+                    yield buffer[start:scanned]
+                    start = None
+        if not chunk:
+            if depth > 0:
+                raise SgfError("SGF collection ends inside a game")
+            return
+        # Drop the text that is done with: finished games and anything between games.
+        keep = scanned if start is None else start
+        buffer = buffer[keep:]
+        scanned -= keep
+        if start is not None:
+            start = 0
+
+
+def _open_text(binary):
+    # A StreamReader only needs read(), unlike TextIOWrapper, so it also works on members of streamed tar archives.
+    return codecs.getreader("utf-8")(binary, errors="replace")
+
+
+def is_record_file(path):
+    """True for the files iter_games reads: .sgf and .sgfs files and zip or tar archives."""
+    return path.lower().endswith(_SGF_EXTENSIONS + _TAR_EXTENSIONS + (".zip",))
+
+
+def record_files(path):
+    """Return the game record files (see is_record_file) in a directory tree, or [path] for a single file."""
+    if not os.path.isdir(path):
+        return [path]
+    files = []
+    for directory, _, file_names in sorted(os.walk(path)):
+        files.extend(os.path.join(directory, file_name) for file_name in sorted(file_names) if is_record_file(file_name))
+    return files
+
+
+def iter_record_streams(path):
+    """Yield (name, text stream) for every SGF file in a file, directory, tar or zip archive."""
+    lower = path.lower()
+    if os.path.isdir(path):
+        for file_path in record_files(path):
+            yield from iter_record_streams(file_path)
+    elif lower.endswith(_TAR_EXTENSIONS):
+        # Streaming mode reads compressed archives front to back without seeking.
+        with tarfile.open(path, "r|*") as archive:
+            for member in archive:
+                if member.isfile() and member.name.lower().endswith(_SGF_EXTENSIONS):
+                    with _open_text(archive.extractfile(member)) as stream:
+                        yield f"{path}/{member.name}", stream
+    elif lower.endswith(".zip"):
+        with zipfile.ZipFile(path) as archive:
+            for name in archive.namelist():
+                if name.lower().endswith(_SGF_EXTENSIONS):
+                    with _open_text(archive.open(name)) as stream:
+                        yield f"{path}/{name}", stream
+    elif lower.endswith(_SGF_EXTENSIONS):
+        with open(path, encoding="utf-8", errors="replace") as stream:
+            yield path, stream
+
+
+def iter_games(path, skip_errors=False):
+    """
+    Yield (name, SgfGame) for every game in an .sgf file, a multi-game collection, a directory, or a tar/zip
+    archive of them. name identifies the file the game comes from. With skip_errors, malformed games are skipped
+    instead of raising SgfError.
+    """
+    for name, stream in iter_record_streams(path):
+        for text in iter_game_texts(stream):
+            try:
+                game = parse_game(text)
+            except SgfError:
+                if skip_errors:
+                    continue
+                raise
+            yield name, game
+
+
+def write_sgf(path, games):
+    """Write one or more SgfGames to a file, several games making a collection."""
+    with open(path, "w", encoding="utf-8") as f:
+        for game in games:
+            f.write(game.to_sgf())
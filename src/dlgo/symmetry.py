@@ -0,0 +1,192 @@
+"""
+This file is based on code from the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+Original code repository: https://github.com/maxpumperla/deep_learning_and_the_game_of_go
+
+The code may have been modified and adapted for educational purposes.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from dlgo import zobrist
+from dlgo.gotypes import Player, Point
+
+# The eight symmetries of the square (the dihedral group D4). Symmetry s rotates the board by (s % 4) quarter turns
+# and, for s >= 4, then mirrors it left to right. Symmetry 0 is the identity.
+NUM_SYMMETRIES = 8
+
+__all__ = [
+    "NUM_SYMMETRIES",
+    "augment_batch",
+    "canonical_hash",
+    "deduplicate",
+    "inverse_symmetry",
+    "transform_labels",
+    "transform_planes",
+    "transform_point",
+]
+
+
+def _check_symmetry(symmetry, num_rows, num_cols):
+    if not 0 <= symmetry < NUM_SYMMETRIES:
+        raise ValueError(f"symmetry must be between 0 and {NUM_SYMMETRIES - 1}, got {symmetry}")
+    if num_rows != num_cols and symmetry % 2 == 1:
+        raise ValueError(f"Symmetry {symmetry} swaps rows and columns and needs a square board, got {num_rows}x{num_cols}")
+
+
+def transform_planes(planes, symmetry):
+    """
+    Apply a symmetry to the last two (row, col) axes of an array, e.g. a single (rows, cols) plane, an encoded
+    position (planes, rows, cols) or a whole batch (N, planes, rows, cols). Returns a view where possible.
+    """
+    _check_symmetry(symmetry, planes.shape[-2], planes.shape[-1])
+    transformed = np.rot90(planes, symmetry % 4, axes=(-2, -1))
+    if symmetry >= 4:
+        transformed = np.flip(transformed, axis=-1)
+    return transformed
+
+
+def inverse_symmetry(symmetry):
+    """Return the symmetry that undoes the given one."""
+    if symmetry < 4:
+        return (4 - symmetry) % 4
+    # Mirrored symmetries are their own inverse.
+    return symmetry
+
+
+@lru_cache(maxsize=None)
+def _index_permutation(num_rows, num_cols, symmetry):
+    """permutation[i] is the flat point index that flat point index i is moved to by the symmetry."""
+    indices = np.arange(num_rows * num_cols).reshape(num_rows, num_cols)
+    # transform_planes(indices)[r, c] holds the original index of the point that lands on (r, c).
+    source = transform_planes(indices, symmetry).ravel()
+    permutation = np.empty(num_rows * num_cols, dtype=np.int64)
+    permutation[source] = np.arange(num_rows * num_cols)
+    permutation.flags.writeable = False
+    return permutation
+
+
+def _board_dims(board_size):
+    if isinstance(board_size, int):
+        return board_size, board_size
+    # Encoders store board sizes as (width, height).
+    width, height = board_size
+    return height, width
+
+
+def transform_labels(labels, board_size, symmetry):
+    """
+    Map move labels, given as flat point indices (see Encoder.encode_point), through a symmetry.
+    Labels outside the board, such as a pass encoded as num_points or -1, are left unchanged.
+    """
+    num_rows, num_cols = _board_dims(board_size)
+    _check_symmetry(symmetry, num_rows, num_cols)
+    labels = np.asarray(labels)
+    permutation = _index_permutation(num_rows, num_cols, symmetry)
+    on_board = (labels >= 0) & (labels < num_rows * num_cols)
+    return np.where(on_board, permutation[np.where(on_board, labels, 0)], labels).astype(labels.dtype)
+
+
+def transform_point(point: Point, board_size, symmetry):
+    """Map a single Point through a symmetry."""
+    num_rows, num_cols = _board_dims(board_size)
+    _check_symmetry(symmetry, num_rows, num_cols)
+    index = _index_permutation(num_rows, num_cols, symmetry)[(point.row - 1) * num_cols + (point.col - 1)]
+    return Point(row=int(index) // num_cols + 1, col=int(index) % num_cols + 1)
+
+
+def augment_batch(features, labels, rng=None, symmetries=None):
+    """
+    Apply an independent random symmetry to every position of a batch, for on-the-fly training augmentation.
+
+    features has shape (N, planes, rows, cols). labels is either (N,) flat point indices or a dense (N, rows * cols)
+    move distribution (one-hot moves, visit counts). Pass symmetries (N,) to choose them instead of drawing them
+    from rng. Returns new (features, labels, symmetries) arrays.
+    """
+    num_positions, _, num_rows, num_cols = features.shape
+    if symmetries is None:
+        rng = np.random.default_rng() if rng is None else rng
+        choices = NUM_SYMMETRIES if num_rows == num_cols else [0, 2, 4, 6]
+        symmetries = rng.choice(choices, size=num_positions)
+    symmetries = np.asarray(symmetries)
+
+    labels = np.asarray(labels)
+    dense = labels.ndim == 2
+    new_features = np.empty_like(features)
+    new_labels = np.empty_like(labels)
+    # Transform all positions sharing a symmetry in one vectorized call.
+    for symmetry in np.unique(symmetries):
+        selected = np.nonzero(symmetries == symmetry)[0]
+        new_features[selected] = transform_planes(features[selected], int(symmetry))
+        if dense:
+            planes = labels[selected].reshape(len(selected), num_rows, num_cols)
+            new_labels[selected] = transform_planes(planes, int(symmetry)).reshape(len(selected), -1)
+        else:
+            new_labels[selected] = transform_labels(labels[selected], (num_cols, num_rows), int(symmetry))
+    return new_features, new_labels, symmetries
+
+
+@lru_cache(maxsize=None)
+def _zobrist_tables(num_rows, num_cols):
+    """XOR masks that turn the hash of an empty point into the hash of a black or white stone, by flat index."""
+    tables = np.zeros((2, num_rows * num_cols), dtype=np.uint64)
+    for i, player in enumerate((Player.black, Player.white)):
+        for index in range(num_rows * num_cols):
+            point = Point(row=index // num_cols + 1, col=index % num_cols + 1)
+            tables[i, index] = zobrist.HASH_CODE[point, None] ^ zobrist.HASH_CODE[point, player]
+    return tables
+
+
+def _zobrist_hash(flat_stones, tables):
+    code = np.bitwise_xor.reduce(tables[0][flat_stones == 1]) ^ np.bitwise_xor.reduce(tables[1][flat_stones == -1])
+    return int(code) ^ zobrist.EMPTY_BOARD
+
+
+def canonical_hash(stones, label=None):
+    """
+    Return (hash, symmetry) where hash is the smallest Zobrist hash of the position over all symmetries and
+    symmetry is one that produces it.
+
+    stones is a (rows, cols) array with 1 for black and -1 for white, such as Board.stone_array(); for the identity
+    symmetry the hash equals Board.zobrist_hash(). A relative plane (e.g. a oneplane encoding) works as well and then
+    treats positions with colors and player to move swapped as equal.
+    If a move label is given, the result is (hash, symmetry, label) with the label mapped through the symmetry. When
+    several symmetries give the smallest hash (symmetric positions), the one giving the smallest label is chosen.
+    """
+    num_rows, num_cols = stones.shape
+    tables = _zobrist_tables(num_rows, num_cols)
+    best = None
+    for symmetry in range(NUM_SYMMETRIES):
+        if num_rows != num_cols and symmetry % 2 == 1:
+            continue
+        code = _zobrist_hash(transform_planes(stones, symmetry).ravel(), tables)
+        new_label = None if label is None else int(transform_labels(label, (num_cols, num_rows), symmetry))
+        key = (code, -1 if new_label is None else new_label)
+        if best is None or key < best[0]:
+            best = (key, symmetry, new_label)
+    (code, _), symmetry, new_label = best
+    if label is None:
+        return code, symmetry
+    return code, symmetry, new_label
+
+
+def deduplicate(stones, labels=None):
+    """
+    Return the indices of the first occurrence of every distinct position in a dataset, treating positions that are
+    symmetric to each other as equal. stones has shape (N, rows, cols) (see canonical_hash). If labels (N,) are given,
+    a position is only a duplicate if the move played from it is the same up to the same symmetry.
+    """
+    seen = set()
+    keep = []
+    for i in range(len(stones)):
+        if labels is None:
+            key = canonical_hash(stones[i])[0]
+        else:
+            code, _, label = canonical_hash(stones[i], int(labels[i]))
+            key = (code, label)
+        if key not in seen:
+            seen.add(key)
+            keep.append(i)
+    return np.array(keep, dtype=np.int64)
@@ -54,7 +54,13 @@ class GameVisualizer:
         os.makedirs(output_dir, exist_ok=True)
         move_number = 0
 
-        while game_state is not None:
+        if game_state.history_truncated:
+            # Games played with bounded history no longer reference their earlier states, so rebuild them.
+            states = list(game_state.replay())[::-1]
+        else:
+            states = self._previous_states(game_state)
+
+        for game_state in states:
             num_rows, num_cols = game_state.board.num_rows, game_state.board.num_cols
             image, draw = self._create_empty_board(num_rows, num_cols)
 
@@ -73,12 +79,16 @@ class GameVisualizer:
             # Save the image
             image.save(os.path.join(output_dir, f"move_{move_number:03d}.png"))
 
-            # Move to the previous state
-            game_state = game_state.previous_state
             move_number += 1
 
         print(f"Generated {move_number} images in {output_dir}")
 
+    @staticmethod
+    def _previous_states(game_state):
+        while game_state is not None:
+            yield game_state
+            game_state = game_state.previous_state
+
     def visualize_game_state(self, game_state: GameState, output_path):
         num_rows, num_cols = game_state.board.num_rows, game_state.board.num_cols
         image, draw = self._create_empty_board(num_rows, num_cols)
@@ -19,6 +19,9 @@ check_gpu_availability()
 np.random.seed(123)
 X = np.load("src/dlgo/generated_games/features-40k.npy")
 Y = np.load("src/dlgo/generated_games/labels-40k.npy")
+if Y.ndim == 1:
+    # Labels are stored as move indices, Keras wants one-hot vectors.
+    Y = np.eye(9 * 9, dtype=np.float32)[Y]
 
 samples = X.shape[0]
 size = 9
@@ -10,38 +10,18 @@ This was translated to pytorch by Anthropic's Claude 3.5 model.
 import numpy as np
 import torch
 import torch.nn as nn
+import torch.nn.functional as F
 import torch.optim as optim
 from configure_pytorch_gpu import configure_pytorch_gpu
-from torch.utils.data import DataLoader, TensorDataset
+from torch.utils.data import DataLoader
 
-# Configure GPU and get device
-device = configure_pytorch_gpu()
+from dlgo.data.dataset import ShardedIterableDataset, split_shards
 
-# Set random seed for reproducibility
-torch.manual_seed(123)
-np.random.seed(123)
-
-# Load data
-X = np.load("src/dlgo/generated_games/features-40k.npy")
-Y = np.load("src/dlgo/generated_games/labels-40k.npy")
-
-# Preprocess data
-samples = X.shape[0]
+# Stream the data from a sharded dataset written by generate_mcts_games.py --out-dir. The shards are
+# memory-mapped and batches are built in the DataLoader workers, so the dataset does not need to fit in RAM.
+# Features come in PyTorch's (C, H, W) format, labels are move indices.
+data_dir = "src/dlgo/generated_games/mcts-9x9"
 size = 9
-X = X.reshape(samples, 1, size, size)  # PyTorch uses (C, H, W) format
-X = torch.FloatTensor(X).to(device)
-Y = torch.FloatTensor(Y).to(device)
-
-# Split data
-train_samples = int(0.9 * samples)
-X_train, X_test = X[:train_samples], X[train_samples:]
-Y_train, Y_test = Y[:train_samples], Y[train_samples:]
-
-# Create datasets and dataloaders
-train_dataset = TensorDataset(X_train, Y_train)
-test_dataset = TensorDataset(X_test, Y_test)
-train_loader = DataLoader(train_dataset, batch_size=64, shuffle=True)
-test_loader = DataLoader(test_dataset, batch_size=64, shuffle=False)
 
 
 # Define the model
@@ -64,13 +44,6 @@ class GoCNN(nn.Module):
         return x
 
 
-model = GoCNN().to(device)
-
-# Define loss function and optimizer
-criterion = nn.MSELoss()
-optimizer = optim.SGD(model.parameters(), lr=0.01)
-
-
 # Training loop
 def train(model, train_loader, criterion, optimizer, epochs, device):
     model.train()
@@ -78,6 +51,7 @@ def train(model, train_loader, criterion, optimizer, epochs, device):
         running_loss = 0.0
         for inputs, labels in train_loader:
             inputs, labels = inputs.to(device), labels.to(device)
+            labels = F.one_hot(labels, num_classes=size * size).float()
             optimizer.zero_grad()
             outputs = model(inputs)
             loss = criterion(outputs, labels)
@@ -93,15 +67,15 @@ def evaluate(model, test_loader, criterion, device):
     correct = 0
     total = 0
     with torch.no_grad():
-        for inputs, labels in test_loader:
-            inputs, labels = inputs.to(device), labels.to(device)
+        for inputs, true_moves in test_loader:
+            inputs, true_moves = inputs.to(device), true_moves.to(device)
+            labels = F.one_hot(true_moves, num_classes=size * size).float()
             outputs = model(inputs)
             loss = criterion(outputs, labels)
             total_loss += loss.item()
 
-            # Find the position of the highest probability in outputs and labels
+            # Find the position of the highest probability in outputs
             _, predicted = outputs.max(1)
-            _, true_moves = labels.max(1)
 
             correct += (predicted == true_moves).sum().item()
             total += labels.size(0)
@@ -111,10 +85,36 @@ def evaluate(model, test_loader, criterion, device):
     return avg_loss, accuracy
 
 
-# Train the model
-train(model, train_loader, criterion, optimizer, epochs=15, device=device)
+def main():
+    # Configure GPU and get device
+    device = configure_pytorch_gpu()
+
+    # Set random seed for reproducibility
+    torch.manual_seed(123)
+    np.random.seed(123)
+
+    # The DataLoader workers are separate processes, which re-import this module on platforms that spawn them
+    # (Windows, macOS), so the training only runs under the __main__ guard below.
+    train_shards, test_shards = split_shards(data_dir, test_fraction=0.1)
+    train_dataset = ShardedIterableDataset(data_dir, batch_size=64, shards=train_shards, seed=123)
+    test_dataset = ShardedIterableDataset(data_dir, batch_size=64, shards=test_shards, shuffle=False)
+    train_loader = DataLoader(train_dataset, batch_size=None, num_workers=2, pin_memory=device.type == "cuda")
+    test_loader = DataLoader(test_dataset, batch_size=None)
+
+    model = GoCNN().to(device)
+
+    # Define loss function and optimizer
+    criterion = nn.MSELoss()
+    optimizer = optim.SGD(model.parameters(), lr=0.01)
+
+    # Train the model
+    train(model, train_loader, criterion, optimizer, epochs=15, device=device)
+
+    # Evaluate the model
+    test_loss, test_accuracy = evaluate(model, test_loader, criterion, device)
+    print(f"Test loss: {test_loss:.4f}")
+    print(f"Test accuracy: {test_accuracy:.4f}")
+
 
-# Evaluate the model
-test_loss, test_accuracy = evaluate(model, test_loader, criterion, device)
-print(f"Test loss: {test_loss:.4f}")
-print(f"Test accuracy: {test_accuracy:.4f}")
+if __name__ == "__main__":
+    main()
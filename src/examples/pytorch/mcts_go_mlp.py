@@ -9,44 +9,18 @@ The code may have been modified and adapted for educational purposes.
 import numpy as np
 import torch
 import torch.nn as nn
+import torch.nn.functional as F
 import torch.optim as optim
-from torch.utils.data import DataLoader, TensorDataset
+from torch.utils.data import DataLoader
 
-# Set random seed for reproducibility
-torch.manual_seed(123)
-np.random.seed(123)
+from dlgo.data.dataset import ShardedIterableDataset, split_shards
 
-# Load data
-X = np.load("src/dlgo/generated_games/features-40k.npy")
-Y = np.load("src/dlgo/generated_games/labels-40k.npy")
-
-samples = X.shape[0]
+# Stream the data from a sharded dataset written by generate_mcts_games.py --out-dir. The shards are
+# memory-mapped, so the dataset does not need to fit in RAM. Labels are move indices, they are expanded to one-hot
+# vectors batch by batch.
+data_dir = "src/dlgo/generated_games/mcts-9x9"
 board_size = 9 * 9
 
-X = X.reshape(samples, board_size)
-Y = Y.reshape(samples, board_size)
-
-# Split data
-train_samples = int(0.9 * samples)
-X_train, X_test = X[:train_samples], X[train_samples:]
-Y_train, Y_test = Y[:train_samples], Y[train_samples:]
-
-# Convert to PyTorch tensors
-X_train = torch.FloatTensor(X_train)
-Y_train = torch.FloatTensor(Y_train)
-X_test = torch.FloatTensor(X_test)
-Y_test = torch.FloatTensor(Y_test)
-
-# Create DataLoader
-train_dataset = TensorDataset(X_train, Y_train)
-test_dataset = TensorDataset(X_test, Y_test)
-train_loader = DataLoader(train_dataset, batch_size=64, shuffle=True)
-test_loader = DataLoader(test_dataset, batch_size=64, shuffle=False)
-
-# Get cpu, gpu or mps device for training.
-device = "cuda" if torch.cuda.is_available() else "mps" if torch.backends.mps.is_available() else "cpu"
-print(f"Using {device} device")
-
 
 # Define the model
 class Net(nn.Module):
@@ -64,31 +38,71 @@ class Net(nn.Module):
         return x
 
 
-# Instantiate the model
-model = Net(board_size, 1000, 500, board_size).to(device)
-
-# Define loss function and optimizer
-criterion = nn.MSELoss()
-optimizer = optim.SGD(model.parameters(), lr=0.01)
-
-# Training loop
-num_epochs = 15
-for epoch in range(num_epochs):
-    model.train()
-    for batch_X, batch_y in train_loader:
-        optimizer.zero_grad()
-        outputs = model(batch_X)
-        loss = criterion(outputs, batch_y)
-        loss.backward()
-        optimizer.step()
-
-    # Print epoch results
+def main():
+    # Set random seed for reproducibility
+    torch.manual_seed(123)
+    np.random.seed(123)
+
+    train_shards, test_shards = split_shards(data_dir, test_fraction=0.1)
+    train_loader = DataLoader(
+        ShardedIterableDataset(data_dir, batch_size=64, shards=train_shards, seed=123), batch_size=None, num_workers=2
+    )
+    test_loader = DataLoader(ShardedIterableDataset(data_dir, batch_size=64, shards=test_shards, shuffle=False), batch_size=None)
+
+    # Get cpu, gpu or mps device for training.
+    device = "cuda" if torch.cuda.is_available() else "mps" if torch.backends.mps.is_available() else "cpu"
+    print(f"Using {device} device")
+
+    # Instantiate the model
+    model = Net(board_size, 1000, 500, board_size).to(device)
+
+    # Define loss function and optimizer
+    criterion = nn.MSELoss()
+    optimizer = optim.SGD(model.parameters(), lr=0.01)
+
+    # Training loop
+    num_epochs = 15
+    for epoch in range(num_epochs):
+        model.train()
+        for batch_X, batch_y in train_loader:
+            batch_X = batch_X.reshape(len(batch_X), board_size).to(device)
+            batch_y = batch_y.to(device)
+            batch_y = F.one_hot(batch_y, num_classes=board_size).float()
+            optimizer.zero_grad()
+            outputs = model(batch_X)
+            loss = criterion(outputs, batch_y)
+            loss.backward()
+            optimizer.step()
+
+        # Print epoch results
+        model.eval()
+        with torch.no_grad():
+            test_loss = 0
+            correct = 0
+            total = 0
+            for batch_X, batch_y in test_loader:
+                batch_X = batch_X.reshape(len(batch_X), board_size).to(device)
+                batch_y = batch_y.to(device)
+                batch_y = F.one_hot(batch_y, num_classes=board_size).float()
+                outputs = model(batch_X)
+                test_loss += criterion(outputs, batch_y).item()
+                predicted = (outputs > 0.5).float()
+                total += batch_y.size(0) * batch_y.size(1)
+                correct += (predicted == batch_y).sum().item()
+
+            accuracy = correct / total
+            print(f"Epoch [{epoch+1}/{num_epochs}], Loss: {test_loss:.4f}, Accuracy: {accuracy:.4f}")
+
+    # Final evaluation
     model.eval()
     with torch.no_grad():
         test_loss = 0
         correct = 0
         total = 0
         for batch_X, batch_y in test_loader:
+            batch_X = batch_X.reshape(len(batch_X), board_size).to(device)
+            batch_y = batch_y.to(device)
+            batch_y = F.one_hot(batch_y, num_classes=board_size).float()
             outputs = model(batch_X)
             test_loss += criterion(outputs, batch_y).item()
             predicted = (outputs > 0.5).float()
@@ -96,21 +110,9 @@ for epoch in range(num_epochs):
             correct += (predicted == batch_y).sum().item()
 
         accuracy = correct / total
-        print(f"Epoch [{epoch+1}/{num_epochs}], Loss: {test_loss:.4f}, Accuracy: {accuracy:.4f}")
-
-# Final evaluation
-model.eval()
-with torch.no_grad():
-    test_loss = 0
-    correct = 0
-    total = 0
-    for batch_X, batch_y in test_loader:
-        outputs = model(batch_X)
-        test_loss += criterion(outputs, batch_y).item()
-        predicted = (outputs > 0.5).float()
-        total += batch_y.size(0) * batch_y.size(1)
-        correct += (predicted == batch_y).sum().item()
-
-    accuracy = correct / total
-    print(f"Test loss: {test_loss:.4f}")
-    print(f"Test accuracy: {accuracy:.4f}")
+        print(f"Test loss: {test_loss:.4f}")
+        print(f"Test accuracy: {accuracy:.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+This file is based on code from the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+Original code repository: https://github.com/maxpumperla/deep_learning_and_the_game_of_go
+
+The code may have been modified and adapted for educational purposes.
+"""
+
+import argparse
+import asyncio
+
+from dlgo.agent.specs import AGENT_SPECS, agent_factory
+from dlgo.server import GameServer
+
+
+def parse_agent(text):
+    name, _, spec = text.partition("=")
+    if not name or not spec:
+        raise argparse.ArgumentTypeError(f"expected NAME=SPEC, got {text!r}")
+    try:
+        agent_factory(spec)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+    return name, spec
+
+
+async def serve(args):
+    agents = dict(args.agent or [("random", "random"), ("mcts", "mcts:500")])
+    server = GameServer(agents, args.workers, args.processes, finished_ttl=args.finished_ttl, idle_timeout=args.idle_timeout)
+    await server.start(args.host, args.port)
+    print(f"Serving games on http://{args.host}:{server.port} with agents {', '.join(server.agents)}")
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Serve games against agents over HTTP (JSON API with server-sent events)",
+        epilog="Agent specs:\n" + AGENT_SPECS,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", "-p", type=int, default=8000)
+    parser.add_argument("--workers", "-w", type=int, default=4, help="Threads or processes running agent searches")
+    parser.add_argument("--processes", action="store_true", help="Search in worker processes instead of threads")
+    parser.add_argument("--agent", "-a", type=parse_agent, action="append", help="Offer an agent as NAME=SPEC, repeatable")
+    parser.add_argument("--finished-ttl", type=float, default=60.0, help="Seconds finished games stay available")
+    parser.add_argument("--idle-timeout", type=float, default=3600.0, help="Seconds after which games without moves are dropped")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
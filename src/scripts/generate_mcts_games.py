@@ -7,37 +7,62 @@ The code may have been modified and adapted for educational purposes.
 """
 
 import argparse
+import multiprocessing
+import os
+import random
+import sys
 
 import numpy as np
 
 from dlgo import gamestate as goboard
 from dlgo.agent import mcts_agent
+from dlgo.data.compact import compact_position, pack_stones, stack_positions
+from dlgo.data.labels import LABEL_DTYPE, VISIT_INDEX_DTYPE, VISIT_PROB_DTYPE, sparse_visit_distribution
+from dlgo.data.shards import MANIFEST, ShardWriter, read_manifest
 from dlgo.encoders.base import get_encoder_by_name
+from dlgo.profiling import profile_to
 from dlgo.utils import print_board, print_move
 
 
-def generate_game(board_size, rounds, max_moves, temperature):
+def generate_game(board_size, rounds, max_moves, temperature, verbose=False, visit_counts=False, compact=False):
+    """
+    Play one MCTS self-play game and return (boards, moves, visits).
+
+    boards holds the oneplane encoding of every position, or with compact a dict of compact position arrays
+    (see dlgo.data.compact.stack_positions).
+
+    moves holds the index of every move played (Encoder.encode_point) as int16. With visit_counts, visits is a
+    (lengths, indices, probabilities) triple giving the sparse root visit distribution of every position; otherwise
+    it is None.
+    """
     boards, moves = [], []
+    visit_lengths, visit_indices, visit_probs = [], [], []
 
     encoder = get_encoder_by_name("oneplane", board_size)
 
-    game = goboard.GameState.new_game(board_size)
+    # Nothing here looks back at earlier positions, so no previous states are kept alive during the game.
+    game = goboard.GameState.new_game(board_size, max_history=0)
 
     bot = mcts_agent.MCTSAgent(rounds, temperature)
 
     num_moves = 0
 
     while not game.is_over():
-        print_board(game.board)
-        move = bot.select_move(game)
-        print(move)
+        if verbose:
+            print_board(game.board)
+        root = bot.search(game)
+        move = bot.pick_best_move(root.children, game.next_player)
         if move.is_play:
-            boards.append(encoder.encode(game))
-
-            move_one_hot = np.zeros(encoder.num_points())
-            move_one_hot[encoder.encode_point(move.point)] = 1
-            moves.append(move_one_hot)
-        print_move(game.next_player, move)
+            boards.append(compact_position(game, num_moves) if compact else encoder.encode(game))
+            moves.append(encoder.encode_point(move.point))
+            if visit_counts:
+                counts = {encoder.encode_point(child.move.point): child.num_rollouts for child in root.children if child.move.is_play}
+                indices, probs = sparse_visit_distribution(counts)
+                visit_lengths.append(len(indices))
+                visit_indices.append(indices)
+                visit_probs.append(probs)
+        if verbose:
+            print_move(game.next_player, move)
         game = game.apply_move(move)
 
         num_moves += 1
@@ -45,7 +70,69 @@ def generate_game(board_size, rounds, max_moves, temperature):
         if num_moves > max_moves:
             break
 
-    return np.array(boards), np.array(moves)
+    visits = None
+    if visit_counts:
+        visits = (
+            np.array(visit_lengths, dtype=LABEL_DTYPE),
+            np.concatenate(visit_indices) if visit_indices else np.zeros(0, dtype=VISIT_INDEX_DTYPE),
+            np.concatenate(visit_probs) if visit_probs else np.zeros(0, dtype=VISIT_PROB_DTYPE),
+        )
+    if compact:
+        boards = stack_positions(boards, (board_size, board_size))
+    else:
+        boards = np.array(boards).reshape((len(boards),) + tuple(encoder.shape()))
+    return boards, np.array(moves, dtype=LABEL_DTYPE), visits
+
+
+def _generate_seeded_game(task):
+    game_index, seed, board_size, rounds, max_moves, temperature, verbose, visit_counts, compact = task
+    # Seeding per game rather than per worker makes every game reproducible whichever worker plays it.
+    random.seed(seed)
+    np.random.seed(seed)
+    boards, moves, visits = generate_game(board_size, rounds, max_moves, temperature, verbose, visit_counts, compact)
+    return game_index, boards, moves, visits
+
+
+def generate_games(
+    num_games,
+    board_size,
+    rounds,
+    max_moves,
+    temperature,
+    workers=1,
+    seed=None,
+    verbose=False,
+    first_game=0,
+    visit_counts=False,
+    compact=False,
+):
+    """
+    Yield (game_index, boards, moves, visits) for games first_game .. num_games - 1, in game order.
+
+    With workers > 1 the games are played in a process pool. Game i is seeded with seed + i, so a given seed always
+    produces the same games in the same order, regardless of the number of workers.
+    """
+    if seed is None:
+        seed = random.SystemRandom().randrange(2**32)
+    tasks = [
+        (i, (seed + i) % 2**32, board_size, rounds, max_moves, temperature, verbose, visit_counts, compact)
+        for i in range(first_game, num_games)
+    ]
+
+    if workers <= 1:
+        for task in tasks:
+            yield _generate_seeded_game(task)
+        return
+
+    with multiprocessing.Pool(workers) as pool:
+        # imap hands results back in task order, so the output does not depend on which worker finishes first.
+        yield from pool.imap(_generate_seeded_game, tasks)
+
+
+def report_progress(games_done, num_games, num_positions):
+    print(f"\rGenerated {games_done}/{num_games} games, {num_positions} positions", end="", file=sys.stderr, flush=True)
+    if games_done == num_games:
+        print(file=sys.stderr)
 
 
 def main():
@@ -55,19 +142,128 @@ def main():
     parser.add_argument("--temperature", "-t", type=float, default=0.8)
     parser.add_argument("--max-moves", "-m", type=int, default=60, help="Max moves per game")
     parser.add_argument("--num-games", "-n", type=int, default=10)
+    parser.add_argument("--workers", "-w", type=int, default=1, help="Number of processes playing games in parallel")
+    parser.add_argument("--seed", "-s", type=int, default=None, help="Base random seed, game i uses seed + i")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Print the board and every move")
     parser.add_argument("--board-out")
     parser.add_argument("--move-out")
+    parser.add_argument("--out-dir", help="Stream games to a sharded dataset in this directory instead of --board-out/--move-out")
+    parser.add_argument("--shard-size", type=int, default=4096, help="Positions per shard with --out-dir")
+    parser.add_argument("--resume", action="store_true", help="Continue an interrupted --out-dir run")
+    parser.add_argument("--visit-counts", action="store_true", help="Also store the MCTS root visit distributions (with --out-dir)")
+    parser.add_argument(
+        "--compact", action="store_true", help="Store int8 stones and position metadata instead of encodings (with --out-dir)"
+    )
+    parser.add_argument("--pack", action="store_true", help="With --compact, pack the stones into 2 bits per point")
+    parser.add_argument("--profile", metavar="PATH", help="Profile the games and write collapsed stacks (for flame graphs) to PATH")
+    parser.add_argument("--profile-top", type=int, default=20, help="Number of functions in the profile summary")
 
     args = parser.parse_args()
+    if (args.compact or args.pack or args.visit_counts) and not args.out_dir:
+        parser.error("--compact, --pack and --visit-counts need --out-dir")
+    if args.resume and args.out_dir and os.path.exists(os.path.join(args.out_dir, MANIFEST)):
+        changed = resume_mismatches(read_manifest(args.out_dir)["metadata"], args)
+        if changed:
+            parser.error(f"--resume with other settings than the dataset in {args.out_dir}: {', '.join(changed)}")
+    if args.profile and args.workers > 1:
+        parser.error("--profile profiles games played in this process, use --workers 1")
+
+    with profile_to(args.profile, args.profile_top):
+        if args.out_dir:
+            write_shards(args)
+        else:
+            write_arrays(args)
+
+
+def shard_metadata(args, seed):
+    return {
+        "encoder": "oneplane",
+        "board_size": args.board_size,
+        "rounds": args.rounds,
+        "temperature": args.temperature,
+        "max_moves": args.max_moves,
+        "seed": seed,
+        "labels": "point_index",
+        "boards": board_format(args),
+        "visit_counts": args.visit_counts,
+    }
+
+
+def resume_mismatches(stored, args):
+    """
+    Describe the settings of args that differ from the stored metadata of the dataset being resumed, as
+    "name stored -> new" strings. Without --seed the stored seed is used, so only an explicit seed can differ.
+    """
+    metadata = shard_metadata(args, args.seed)
+    return [
+        f"{name} {stored[name]} -> {value}"
+        for name, value in metadata.items()
+        if name in stored and stored[name] != value and not (name == "seed" and value is None)
+    ]
+
+
+def write_shards(args):
+    seed = args.seed if args.seed is not None else random.SystemRandom().randrange(2**32)
+    metadata = shard_metadata(args, seed)
+    with ShardWriter(args.out_dir, args.shard_size, resume=args.resume, metadata=metadata) as writer:
+        # Resumed runs replay the original seeds so the dataset is the same as an uninterrupted run.
+        seed = writer.metadata.get("seed", seed)
+        num_positions = writer.num_positions
+        games = generate_games(
+            args.num_games,
+            args.board_size,
+            args.rounds,
+            args.max_moves,
+            args.temperature,
+            args.workers,
+            seed,
+            args.verbose,
+            first_game=writer.num_games,
+            visit_counts=args.visit_counts,
+            compact=args.compact or args.pack,
+        )
+        for game_index, x, y, visits in games:
+            arrays = board_arrays(x, args)
+            arrays["labels"] = y
+            ragged = None
+            if visits is not None:
+                lengths, indices, probs = visits
+                arrays["visit_lengths"] = lengths
+                ragged = {"visit_indices": indices, "visit_probs": probs}
+            writer.write_game(ragged=ragged, **arrays)
+            num_positions += len(y)
+            report_progress(game_index + 1, args.num_games, num_positions)
+
+
+def board_format(args):
+    if args.pack:
+        return "packed"
+    return "compact" if args.compact else "encoded"
+
+
+def board_arrays(boards, args):
+    """The arrays stored for the boards of one game, named after what they hold."""
+    if not (args.compact or args.pack):
+        return {"features": boards}
+    arrays = dict(boards)
+    if args.pack:
+        arrays["packed_stones"] = pack_stones(arrays.pop("stones"))
+    return arrays
+
 
+def write_arrays(args):
     xs = []
     ys = []
 
-    for i in range(args.num_games):
-        print(f"Generating game {i+1}/{args.num_games}...")
-        x, y = generate_game(args.board_size, args.rounds, args.max_moves, args.temperature)
+    num_positions = 0
+    games = generate_games(
+        args.num_games, args.board_size, args.rounds, args.max_moves, args.temperature, args.workers, args.seed, args.verbose
+    )
+    for game_index, x, y, _ in games:
         xs.append(x)
         ys.append(y)
+        num_positions += len(x)
+        report_progress(game_index + 1, args.num_games, num_positions)
 
     x = np.concatenate(xs)
     y = np.concatenate(ys)
@@ -77,5 +273,4 @@ def main():
 
 
 if __name__ == "__main__":
-    print(f"Running a game generation sequence")
     main()
@@ -0,0 +1,70 @@
+"""
+This file is based on code from the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+Original code repository: https://github.com/maxpumperla/deep_learning_and_the_game_of_go
+
+The code may have been modified and adapted for educational purposes.
+"""
+
+import argparse
+
+from dlgo.agent.search_stats import SearchLog, SearchMetrics
+from dlgo.agent.specs import AGENT_SPECS, agent_factory
+from dlgo.gtp import GTPEngine
+
+
+class MetricsFileWriter(SearchMetrics):
+    """Rewrites the metrics file after every search, for the node_exporter textfile collector."""
+
+    def __init__(self, path):
+        SearchMetrics.__init__(self)
+        self.path = path
+
+    def record(self, stats):
+        SearchMetrics.record(self, stats)
+        self.write_prometheus(self.path)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run an agent as a GTP engine on stdin/stdout, e.g. for Sabaki, GoGui or gogui-twogtp",
+        epilog="Agents:\n" + AGENT_SPECS,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("agent", nargs="?", default="mcts")
+    parser.add_argument("--board-size", "-b", type=int, default=19, help="Board size until the controller sets one")
+    parser.add_argument("--komi", type=float, default=7.5)
+    parser.add_argument("--search-log", help="Append the statistics of every search to this file as JSON lines")
+    parser.add_argument("--metrics-file", help="Keep the search metrics in this file in the Prometheus text format")
+    args = parser.parse_args()
+
+    try:
+        agent = agent_factory(args.agent)()
+    except ValueError as e:
+        parser.error(str(e))
+
+    board_size = args.board_size
+    board_sizes = None
+    encoder = getattr(agent, "encoder", None)
+    if encoder is not None:
+        # Network agents only play on the board size their encoder was built for.
+        board_size = encoder.board_width
+        board_sizes = {board_size}
+    search_log = None
+    if args.search_log or args.metrics_file:
+        if not hasattr(agent, "add_stats_listener"):
+            parser.error(f"{args.agent} does not search, so there are no search statistics")
+        if args.search_log:
+            search_log = SearchLog(args.search_log)
+            agent.add_stats_listener(search_log)
+        if args.metrics_file:
+            agent.add_stats_listener(MetricsFileWriter(args.metrics_file))
+    try:
+        GTPEngine(agent, board_size, args.komi, name=f"dlgo {args.agent}", board_sizes=board_sizes).run()
+    finally:
+        if search_log is not None:
+            search_log.close()
+
+
+if __name__ == "__main__":
+    main()
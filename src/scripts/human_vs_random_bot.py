@@ -6,31 +6,15 @@ Original code repository: https://github.com/maxpumperla/deep_learning_and_the_g
 The code may have been modified and adapted for educational purposes.
 """
 
-import time
-
-from dlgo import agent, gotypes, utils
-from dlgo.gamestate import GameState
-from dlgo.move import Move
+from dlgo import agent, gotypes
+from dlgo.agent.human import HumanAgent
+from dlgo.driver import ConsoleRenderer, run_game
 
 
 def main():
     board_size = 9
-    game = GameState.new_game(board_size)
-    bot = agent.random_bot.RandomBot()
-
-    while not game.is_over():
-        time.sleep(0.3)
-
-        print(chr(27) + "[2J")
-        utils.print_board(game.board)
-        if game.next_player == gotypes.Player.black:
-            human_move = input("-- ")
-            point = utils.point_from_coords(human_move.strip())
-            move = Move.play(point)
-        else:
-            move = bot.select_move(game)
-        utils.print_move(game.next_player, move)
-        game = game.apply_move(move)
+    players = {gotypes.Player.black: HumanAgent(), gotypes.Player.white: agent.random_bot.RandomBot()}
+    run_game(players, board_size, [ConsoleRenderer()])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,67 @@
+"""
+This file is based on code from the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+Original code repository: https://github.com/maxpumperla/deep_learning_and_the_game_of_go
+
+The code may have been modified and adapted for educational purposes.
+"""
+
+import argparse
+import json
+import sys
+
+from dlgo.agent.specs import AGENT_SPECS, agent_factory
+from dlgo.match import play_match
+from dlgo.profiling import profile_to
+
+
+def report_progress(games_done, num_games, result):
+    print(f"\rPlayed {games_done}/{num_games} games, {result.wins(0)}-{result.wins(1)}", end="", file=sys.stderr, flush=True)
+    if games_done == num_games:
+        print(file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Play a match between two agents and report win rate, Elo and move times",
+        epilog="Agents:\n" + AGENT_SPECS,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("agent_a")
+    parser.add_argument("agent_b")
+    parser.add_argument("--num-games", "-n", type=int, default=100)
+    parser.add_argument("--board-size", "-b", type=int, default=9)
+    parser.add_argument("--max-moves", "-m", type=int, default=None, help="Score games after this many moves")
+    parser.add_argument("--workers", "-w", type=int, default=1, help="Number of processes playing games in parallel")
+    parser.add_argument("--seed", "-s", type=int, default=None, help="Base random seed, game i uses seed + i")
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+    parser.add_argument("--profile", metavar="PATH", help="Profile the games and write collapsed stacks (for flame graphs) to PATH")
+    parser.add_argument("--profile-top", type=int, default=20, help="Number of functions in the profile summary")
+
+    args = parser.parse_args()
+    try:
+        factories = agent_factory(args.agent_a), agent_factory(args.agent_b)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.profile and args.workers > 1:
+        parser.error("--profile profiles games played in this process, use --workers 1")
+
+    with profile_to(args.profile, args.profile_top):
+        result = play_match(
+            *factories,
+            args.num_games,
+            args.board_size,
+            args.max_moves,
+            args.workers,
+            args.seed,
+            names=(args.agent_a, args.agent_b),
+            progress=report_progress,
+        )
+    print(result.summary())
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(result.to_dict(), f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
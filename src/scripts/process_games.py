@@ -0,0 +1,50 @@
+"""
+This file is based on code from the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+Original code repository: https://github.com/maxpumperla/deep_learning_and_the_game_of_go
+
+The code may have been modified and adapted for educational purposes.
+"""
+
+import argparse
+import sys
+
+from dlgo.data.processor import process_games
+
+
+def report_progress(files_done, num_files, num_positions):
+    print(f"\rProcessed {files_done}/{num_files} files, {num_positions} positions", end="", file=sys.stderr, flush=True)
+    if files_done == num_files:
+        print(file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Encode SGF game records into a sharded training dataset")
+    parser.add_argument("inputs", nargs="+", help="SGF files, collections, directories or zip/tar archives")
+    parser.add_argument("--out-dir", "-o", required=True)
+    parser.add_argument("--encoder", "-e", default="oneplane")
+    parser.add_argument("--board-size", "-b", type=int, default=19, help="Games on other board sizes are skipped")
+    parser.add_argument("--workers", "-w", type=int, default=1, help="Number of processes encoding chunks of games in parallel")
+    parser.add_argument("--shard-size", type=int, default=4096, help="Positions per shard")
+    parser.add_argument("--cache-dir", help="Keep the encoded output of every file here and reuse it for unchanged files")
+
+    args = parser.parse_args()
+
+    stats = process_games(
+        args.inputs,
+        args.out_dir,
+        args.encoder,
+        args.board_size,
+        args.workers,
+        args.shard_size,
+        args.cache_dir,
+        progress=report_progress,
+    )
+    print(
+        f"{stats['games']} games ({stats['skipped_games']} skipped), {stats['positions']} positions, "
+        f"{stats['cached_files']}/{stats['files']} files from cache"
+    )
+
+
+if __name__ == "__main__":
+    main()
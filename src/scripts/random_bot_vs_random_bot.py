@@ -6,26 +6,24 @@ Original code repository: https://github.com/maxpumperla/deep_learning_and_the_g
 The code may have been modified and adapted for educational purposes.
 """
 
-import time
+import argparse
 
-from dlgo import agent, gotypes, utils
-from dlgo.gamestate import GameState
+from dlgo import agent, gotypes
+from dlgo.driver import ConsoleRenderer, run_game
 
 
 def main():
-    board_size = 9
-    game = GameState.new_game(board_size)
+    parser = argparse.ArgumentParser(description="Watch two random bots play each other")
+    parser.add_argument("--board-size", "-b", type=int, default=9)
+    parser.add_argument("--delay", type=float, default=0.3, help="Seconds to pause before every move")
+    parser.add_argument("--headless", action="store_true", help="Only print the result, without delay")
+    args = parser.parse_args()
 
     bots = {gotypes.Player.black: agent.random_bot.RandomBot(), gotypes.Player.white: agent.random_bot.RandomBot()}
-
-    while not game.is_over():
-        time.sleep(0.3)
-
-        print(chr(27) + "[2J")
-        utils.print_board(game.board)
-        bot_move = bots[game.next_player].select_move(game)
-        utils.print_move(game.next_player, bot_move)
-        game = game.apply_move(bot_move)
+    observers = [] if args.headless else [ConsoleRenderer(delay=args.delay)]
+    outcome = run_game(bots, args.board_size, observers)
+    if args.headless:
+        print(f"{outcome.result} after {outcome.num_moves} moves")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,74 @@
+"""
+This file is based on code from the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+Original code repository: https://github.com/maxpumperla/deep_learning_and_the_game_of_go
+
+The code may have been modified and adapted for educational purposes.
+"""
+
+import argparse
+import os
+import sys
+
+from dlgo.agent.predict import DeepLearningAgent, load_prediction_agent
+from dlgo.encoders.base import get_encoder_by_name
+from dlgo.nn.models import PolicyNet
+from dlgo.rl.policy_gradient import train_policy_gradient
+from dlgo.rl.self_play import generate_experience
+
+
+def report_progress(games_done, num_games, num_positions):
+    print(f"\rPlayed {games_done}/{num_games} games, {num_positions} positions", end="", file=sys.stderr, flush=True)
+    if games_done == num_games:
+        print(file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Improve a policy agent by playing against itself")
+    parser.add_argument("agent", help="Saved DeepLearningAgent to start from; created with a new PolicyNet if missing")
+    parser.add_argument("--out", "-o", required=True, help="Where to save the improved agent")
+    parser.add_argument("--experience-dir", "-x", required=True, help="Experience buffers go to iteration-<i> subdirectories")
+    parser.add_argument("--board-size", "-b", type=int, default=9, help="Board size of a new agent")
+    parser.add_argument("--iterations", "-i", type=int, default=1, help="Rounds of self-play followed by training")
+    parser.add_argument("--num-games", "-n", type=int, default=100, help="Self-play games per iteration")
+    parser.add_argument("--workers", "-w", type=int, default=1, help="Number of processes playing games in parallel")
+    parser.add_argument("--temperature", "-t", type=float, default=1.0, help="Sampling temperature during self-play")
+    parser.add_argument("--max-moves", "-m", type=int, default=None, help="Score games after this many moves")
+    parser.add_argument("--learning-rate", "--lr", type=float, default=1e-4)
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--epochs", type=int, default=1, help="Training passes over each iteration's experience")
+    parser.add_argument(
+        "--seed", "-s", type=int, default=None, help="Base random seed, game i of iteration k uses seed + k * num_games + i"
+    )
+    parser.add_argument("--shard-size", type=int, default=4096, help="Positions per experience shard")
+
+    args = parser.parse_args()
+
+    if not os.path.exists(args.agent):
+        encoder = get_encoder_by_name("oneplane", args.board_size)
+        DeepLearningAgent(PolicyNet(encoder.num_planes), encoder).serialize(args.agent)
+
+    agent_path = args.agent
+    for iteration in range(args.iterations):
+        experience_dir = os.path.join(args.experience_dir, f"iteration-{iteration}")
+        seed = None if args.seed is None else args.seed + iteration * args.num_games
+        num_positions = generate_experience(
+            agent_path,
+            experience_dir,
+            args.num_games,
+            args.temperature,
+            args.max_moves,
+            args.workers,
+            seed,
+            args.shard_size,
+            progress=report_progress,
+        )
+        agent = load_prediction_agent(agent_path)
+        losses = train_policy_gradient(agent, experience_dir, args.learning_rate, args.batch_size, args.epochs)
+        agent.serialize(args.out)
+        agent_path = args.out
+        print(f"Iteration {iteration}: {num_positions} positions, loss {losses[-1]:.4f}")
+
+
+if __name__ == "__main__":
+    main()
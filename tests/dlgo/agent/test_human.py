@@ -0,0 +1,35 @@
+"""
+This file was initially generated using an AI language model (Claude 3.5 Sonnet),
+as part of an educational project based on the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+
+The generated code has been reviewed, potentially modified, and adapted to fit the
+project's requirements and to ensure correctness and adherence to the book's concepts.
+"""
+
+from dlgo.agent.human import HumanAgent, parse_move
+from dlgo.board import Board
+from dlgo.gamestate import GameState
+from dlgo.gotypes import Point
+from dlgo.move import Move
+
+
+def test_parse_move():
+    board = Board(9, 9)
+    assert parse_move("D4", board) == Move.play(Point(4, 4))
+    assert parse_move(" j9 ", board) == Move.play(Point(9, 9))
+    assert parse_move("pass", board) == Move.pass_turn()
+    assert parse_move("Resign", board) == Move.resign()
+    assert parse_move("K1", board) is None
+    assert parse_move("A10", board) is None
+    assert parse_move("I5", board) is None
+    assert parse_move("", board) is None
+
+
+def test_asks_again_for_illegal_moves():
+    game = GameState.new_game(9).apply_move(Move.play(Point(3, 3)))
+    answers = iter(["xyz", "C3", "c4"])
+    messages = []
+    agent = HumanAgent(input_fn=lambda prompt: next(answers), output_fn=messages.append)
+    assert agent.select_move(game) == Move.play(Point(4, 3))
+    assert len(messages) == 2
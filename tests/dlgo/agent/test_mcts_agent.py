@@ -244,3 +244,42 @@ def test_select_move_empty_board():
         selected_move = agent.select_move(game_state)
 
     assert selected_move == Move.play(Point(2, 2))
+
+
+def test_search_returns_visited_root():
+    game_state = GameState.new_game(3)
+    agent = MCTSAgent(num_rounds=12, temperature=1.0)
+
+    root = agent.search(game_state)
+
+    assert root.game_state is game_state
+    assert root.num_rollouts == 12
+    assert sum(child.num_rollouts for child in root.children) == 12
+
+
+def test_search_reuses_the_subtree_of_the_game_continuation():
+    agent = MCTSAgent(num_rounds=100, temperature=1.0, reuse_tree=True)
+    game = GameState.new_game(3)
+    root = agent.search(game)
+    child = max(root.children, key=lambda node: node.num_rollouts)
+    grandchild = max(child.children, key=lambda node: node.num_rollouts)
+    rollouts = grandchild.num_rollouts
+
+    game = game.apply_move(child.move).apply_move(grandchild.move)
+    new_root = agent.search(game)
+    assert new_root is grandchild
+    assert new_root.parent is None
+    assert new_root.num_rollouts == rollouts + 100
+
+
+def test_search_without_reuse_starts_over():
+    agent = MCTSAgent(num_rounds=10, temperature=1.0)
+    game = GameState.new_game(5)
+    assert agent.search(game) is not agent.search(game)
+
+
+def test_time_budget_limits_rounds():
+    agent = MCTSAgent(num_rounds=100000, temperature=1.0)
+    agent.set_time_budget(0.05)
+    root = agent.search(GameState.new_game(5))
+    assert 0 < root.num_rollouts < 100000
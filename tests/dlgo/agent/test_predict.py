@@ -0,0 +1,140 @@
+"""
+This file was initially generated using an AI language model (Claude 3.5 Sonnet),
+as part of an educational project based on the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+
+The generated code has been reviewed, potentially modified, and adapted to fit the
+project's requirements and to ensure correctness and adherence to the book's concepts.
+"""
+
+import numpy as np
+import torch
+import torch.nn as nn
+
+from dlgo.agent.predict import DeepLearningAgent, candidate_mask, load_prediction_agent
+from dlgo.encoders.base import get_encoder_by_name
+from dlgo.gamestate import GameState
+from dlgo.gotypes import Player, Point
+from dlgo.move import Move
+from dlgo.nn.models import PolicyNet, PolicyValueNet
+from misc.board_utils import create_board_from_ascii
+
+
+class FixedScores(nn.Module):
+    """Scores every position the same way and counts forward passes."""
+
+    def __init__(self, scores):
+        super().__init__()
+        self.scores = torch.tensor(scores, dtype=torch.float32)
+        self.calls = 0
+
+    def forward(self, x):
+        self.calls += 1
+        return self.scores.repeat(len(x), 1)
+
+
+def test_plays_best_legal_move():
+    board = create_board_from_ascii(
+        """
+      A B C
+    1 B . .
+    2 . . .
+    3 . . .
+    """
+    )
+    game = GameState(board, Player.white, None, None)
+    encoder = get_encoder_by_name("oneplane", 3)
+    scores = np.zeros(9)
+    scores[encoder.encode_point(Point(1, 1))] = 10  # Occupied
+    scores[encoder.encode_point(Point(3, 3))] = 5
+    agent = DeepLearningAgent(FixedScores(scores), encoder)
+    assert agent.select_move(game) == Move.play(Point(3, 3))
+
+
+def test_candidate_mask_excludes_own_eyes():
+    board = create_board_from_ascii(
+        """
+      A B C
+    1 . B .
+    2 B B B
+    3 . . .
+    """
+    )
+    mask = candidate_mask(GameState(board, Player.black, None, None))
+    assert not mask[0]  # Eye at (1, 1)
+    assert mask[6]
+
+
+def test_passes_without_candidates():
+    board = create_board_from_ascii(
+        """
+      A B C
+    1 . B .
+    2 B B B
+    3 B . B
+    """
+    )
+    agent = DeepLearningAgent(FixedScores(np.zeros(9)), get_encoder_by_name("oneplane", 3))
+    assert agent.select_move(GameState(board, Player.black, None, None)).is_pass
+
+
+def test_select_moves_uses_one_forward_pass():
+    torch.manual_seed(0)
+    encoder = get_encoder_by_name("sevenplane", 5)
+    model = PolicyNet(encoder.num_planes, num_filters=8, num_layers=2)
+    agent = DeepLearningAgent(model, encoder)
+    games = [GameState.new_game(5)]
+    for point in [Point(1, 1), Point(3, 3), Point(2, 4)]:
+        games.append(games[-1].apply_move(Move.play(point)))
+
+    calls = []
+    model.register_forward_hook(lambda module, inputs, output: calls.append(len(inputs[0])))
+    moves = agent.select_moves(games)
+
+    assert calls == [4]
+    assert moves == [agent.select_move(game) for game in games]
+
+
+def test_sampling_with_temperature():
+    np.random.seed(3)
+    scores = np.zeros(9)
+    scores[4] = 1
+    agent = DeepLearningAgent(FixedScores(scores), get_encoder_by_name("oneplane", 3), temperature=1.0)
+    moves = {agent.select_move(GameState.new_game(3)) for _ in range(50)}
+    assert len(moves) > 1
+
+
+def test_serialize_round_trip(tmp_path):
+    torch.manual_seed(0)
+    encoder = get_encoder_by_name("oneplane", 5)
+    agent = DeepLearningAgent(PolicyNet(1, num_filters=4, num_layers=1), encoder)
+    path = str(tmp_path / "agent.pt")
+    agent.serialize(path)
+
+    restored = load_prediction_agent(path)
+    assert restored.encoder.name() == "oneplane"
+    assert restored.encoder.shape() == encoder.shape()
+    game = GameState.new_game(5).apply_move(Move.play(Point(2, 2)))
+    assert np.allclose(restored.predict([game]), agent.predict([game]))
+
+
+def test_serialize_keeps_encoder_options(tmp_path):
+    encoder = get_encoder_by_name("alphago", 5, use_player_plane=True)
+    agent = DeepLearningAgent(PolicyNet(49, num_filters=4, num_layers=1), encoder)
+    path = str(tmp_path / "agent.pt")
+    agent.serialize(path)
+
+    restored = load_prediction_agent(path)
+    assert restored.encoder.shape() == (49, 5, 5)
+    game = GameState.new_game(5).apply_move(Move.play(Point(2, 2)))
+    assert np.allclose(restored.predict([game]), agent.predict([game]))
+
+
+def test_plays_from_the_policy_of_policy_value_models():
+    torch.manual_seed(0)
+    agent = DeepLearningAgent(PolicyValueNet(1, num_filters=4, num_layers=1), get_encoder_by_name("oneplane", 5))
+    games = [GameState.new_game(5), GameState.new_game(5).apply_move(Move.play(Point(3, 3)))]
+    assert agent.predict(games).shape == (2, 25)
+    moves = agent.select_moves(games)
+    assert all(move.is_play for move in moves)
+    assert moves[1].point != Point(3, 3)
@@ -0,0 +1,152 @@
+"""
+This file was initially generated using an AI language model (Claude 3.5 Sonnet),
+as part of an educational project based on the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+
+The generated code has been reviewed, potentially modified, and adapted to fit the
+project's requirements and to ensure correctness and adherence to the book's concepts.
+"""
+
+import math
+
+import numpy as np
+import torch
+
+from dlgo.agent.puct_agent import PUCTAgent, load_puct_agent, puct_score
+from dlgo.encoders.base import get_encoder_by_name
+from dlgo.gamestate import GameState
+from dlgo.gotypes import Player, Point
+from dlgo.move import Move
+from dlgo.nn.batching import InferenceQueue
+from dlgo.nn.models import PolicyValueNet
+from misc.board_utils import create_board_from_ascii
+
+
+class StoneCounter:
+    """Uniform policy; values positions by the stone balance of the player to move and counts network calls."""
+
+    def __init__(self):
+        self.calls = 0
+        self.positions = 0
+
+    def __call__(self, features):
+        self.calls += 1
+        self.positions += len(features)
+        policy = np.zeros((len(features), features[0, 0].size + 1), dtype=np.float32)
+        return policy, np.tanh(features.sum(axis=(1, 2, 3)) / 4)
+
+
+def make_agent(board_size=5, **kwargs):
+    encoder = get_encoder_by_name("oneplane", board_size)
+    evaluate = kwargs.pop("evaluate", None) or StoneCounter()
+    return PUCTAgent(None, encoder, evaluate=evaluate, **kwargs)
+
+
+def test_puct_score():
+    assert puct_score(16, 3, 0.5, 0.2, 2.0) == 0.5 + 2.0 * 0.2 * 4 / 4
+    assert math.isclose(puct_score(1, 0, 0.0, 0.5, 1.0), 0.5)
+
+
+def test_search_evaluates_leaves_in_batches():
+    evaluate = StoneCounter()
+    agent = make_agent(num_rounds=50, batch_size=8, evaluate=evaluate)
+    root = agent.search(GameState.new_game(5))
+    assert root.total_visit_count == 1 + 50
+    assert sum(root.visit_count(move) for move in root.moves()) == 50
+    # One call for the root, then one per batch of leaves.
+    assert evaluate.calls == 1 + math.ceil(50 / 8)
+    assert agent.visit_counts(root).sum() == 50
+
+
+def test_virtual_loss_spreads_a_batch():
+    agent = make_agent(num_rounds=16, batch_size=16)
+    root = agent.search(GameState.new_game(5))
+    # With uniform priors and one batch, every descent picks a different first move.
+    assert sum(1 for move in root.moves() if root.visit_count(move) > 0) == 16
+
+
+def test_finds_capture():
+    board = create_board_from_ascii(
+        """
+      A B C D E
+    1 . . . . .
+    2 . B W B .
+    3 . . B . .
+    4 . . . . .
+    5 . . . . .
+    """
+    )
+    game = GameState(board, Player.black, None, None)
+    agent = make_agent(num_rounds=100, batch_size=4)
+    assert agent.select_move(game) == Move.play(Point(1, 3))
+
+
+def test_pass_wins_on_komi():
+    game = GameState.new_game(5).apply_move(Move.pass_turn())
+    agent = make_agent(num_rounds=200, batch_size=4)
+    root = agent.search(game)
+    assert root.get_child(Move.pass_turn()).is_terminal()
+    assert agent.pick_move(root) == Move.pass_turn()
+
+
+def test_passes_when_the_game_is_over():
+    game = GameState.new_game(5).apply_move(Move.pass_turn()).apply_move(Move.pass_turn())
+    agent = make_agent(num_rounds=20, batch_size=4)
+    assert agent.select_move(game) == Move.pass_turn()
+    assert agent.last_stats.rounds == 0
+
+
+def test_skips_own_eyes():
+    board = create_board_from_ascii(
+        """
+      A B C
+    1 . B .
+    2 B B B
+    3 . B .
+    """
+    )
+    game = GameState(board, Player.black, None, None)
+    root = make_agent(3, num_rounds=4).search(game)
+    assert root.moves() == [Move.pass_turn()]
+
+
+def test_shares_an_inference_queue_and_serializes(tmp_path):
+    torch.manual_seed(0)
+    encoder = get_encoder_by_name("oneplane", 5)
+    model = PolicyValueNet(encoder.num_planes, num_filters=4, num_layers=1)
+    agent = PUCTAgent(model, encoder, num_rounds=20, batch_size=5)
+    with InferenceQueue(agent.evaluate) as inference:
+        queued = PUCTAgent(model, encoder, num_rounds=20, batch_size=5, evaluate=inference)
+        assert (
+            agent.visit_counts(agent.search(GameState.new_game(5))).tolist()
+            == queued.visit_counts(queued.search(GameState.new_game(5))).tolist()
+        )
+
+    path = str(tmp_path / "puct.pt")
+    agent.serialize(path)
+    restored = load_puct_agent(path, num_rounds=20, batch_size=5)
+    assert restored.num_rounds == 20
+    game = GameState.new_game(5)
+    assert agent.visit_counts(agent.search(game)).tolist() == restored.visit_counts(restored.search(game)).tolist()
+
+
+def test_reuses_the_subtree_of_the_game_continuation():
+    agent = make_agent(num_rounds=40, batch_size=4, reuse_tree=True)
+    game = GameState.new_game(5)
+    root = agent.search(game)
+    move = agent.pick_move(root)
+    child = root.get_child(move)
+    reply, grandchild = next(iter(child.children.items()))
+    visits = grandchild.total_visit_count
+
+    new_root = agent.search(game.apply_move(move).apply_move(reply))
+    assert new_root is grandchild
+    assert new_root.parent is None
+    assert new_root.total_visit_count == visits + 40
+
+
+def test_time_budget_limits_rounds():
+    agent = make_agent(num_rounds=100000, batch_size=4)
+    agent.set_time_budget(0.05)
+    root = agent.search(GameState.new_game(5))
+    assert 4 <= root.total_visit_count - 1 < 100000
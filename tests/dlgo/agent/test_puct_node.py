@@ -0,0 +1,60 @@
+"""
+This file was initially generated using an AI language model (Claude 3.5 Sonnet),
+as part of an educational project based on the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+
+The generated code has been reviewed, potentially modified, and adapted to fit the
+project's requirements and to ensure correctness and adherence to the book's concepts.
+"""
+
+from dlgo.agent.puct_node import PUCTNode
+from dlgo.gamestate import GameState
+from dlgo.gotypes import Point
+from dlgo.move import Move
+
+
+def make_node():
+    priors = {Move.play(Point(1, 1)): 0.75, Move.pass_turn(): 0.25}
+    return PUCTNode(GameState.new_game(3), 0.1, priors)
+
+
+def test_new_node():
+    node = make_node()
+    assert node.total_visit_count == 1
+    assert node.moves() == [Move.play(Point(1, 1)), Move.pass_turn()]
+    assert node.prior(Move.pass_turn()) == 0.25
+    assert node.expected_value(Move.pass_turn()) == 0.0
+    assert node.visit_count(Move.play(Point(2, 2))) == 0
+    assert not node.is_terminal()
+
+
+def test_record_visit():
+    node = make_node()
+    move = Move.play(Point(1, 1))
+    node.record_visit(move, 1.0)
+    node.record_visit(move, -0.5)
+    assert node.total_visit_count == 3
+    assert node.visit_count(move) == 2
+    assert node.expected_value(move) == 0.25
+
+
+def test_virtual_loss():
+    node = make_node()
+    move = Move.pass_turn()
+    node.record_visit(move, 0.5)
+    node.add_virtual_loss(move, 1)
+    assert node.visit_count(move) == 2
+    assert node.expected_value(move) == -0.25
+    node.revert_virtual_loss(move, 1)
+    assert node.visit_count(move) == 1
+    assert node.expected_value(move) == 0.5
+
+
+def test_children():
+    node = make_node()
+    move = Move.pass_turn()
+    child = PUCTNode(node.game_state.apply_move(move), 0.0, {}, node, move)
+    node.add_child(move, child)
+    assert node.has_child(move)
+    assert node.get_child(move) is child
+    assert not node.has_child(Move.play(Point(1, 1)))
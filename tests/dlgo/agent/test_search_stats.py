@@ -0,0 +1,123 @@
+"""
+This file was initially generated using an AI language model (Claude 3.5 Sonnet),
+as part of an educational project based on the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+
+The generated code has been reviewed, potentially modified, and adapted to fit the
+project's requirements and to ensure correctness and adherence to the book's concepts.
+"""
+
+import io
+import json
+
+import numpy as np
+
+from dlgo.agent.mcts_agent import MCTSAgent
+from dlgo.agent.puct_agent import PUCTAgent
+from dlgo.agent.search_stats import SearchLog, SearchMetrics, SearchStats, count_nodes
+from dlgo.encoders.base import get_encoder_by_name
+from dlgo.gamestate import GameState
+
+
+def uniform_evaluate(features):
+    return np.zeros((len(features), features[0, 0].size + 1), dtype=np.float32), np.zeros(len(features), dtype=np.float32)
+
+
+def make_stats(agent="MCTSAgent", rounds=10, seconds=0.5):
+    stats = SearchStats(agent, ("select", "rollout"))
+    for depth in range(rounds):
+        stats.add_round(depth)
+    stats.evaluations = rounds
+    stats.nodes_added = rounds
+    stats.seconds = seconds
+    stats.phase_seconds["select"] = seconds / 4
+    stats.phase_seconds["rollout"] = 3 * seconds / 4
+    return stats
+
+
+def test_stats_properties():
+    stats = make_stats(rounds=10, seconds=0.5)
+    assert stats.max_depth == 9
+    assert stats.mean_depth == 4.5
+    assert stats.rounds_per_second == 20
+    assert stats.tree_size == 11
+    assert json.loads(json.dumps(stats.to_dict()))["phase_seconds"] == {"select": 0.125, "rollout": 0.375}
+    assert "10 rounds" in stats.summary()
+    assert SearchStats("MCTSAgent", ()).rounds_per_second == 0
+
+
+def test_mcts_search_stats():
+    agent = MCTSAgent(num_rounds=20, temperature=1.4)
+    metrics = SearchMetrics()
+    agent.add_stats_listener(metrics)
+    root = agent.search(GameState.new_game(3))
+    stats = agent.last_stats
+    assert stats.rounds == 20
+    assert stats.evaluations == 20
+    assert stats.tree_size == count_nodes(root, lambda node: node.children)
+    assert stats.max_depth >= 1
+    assert set(stats.phase_seconds) == {"select", "expand", "rollout", "backup"}
+    assert sum(stats.phase_seconds.values()) <= stats.seconds
+    assert stats.phase_seconds["rollout"] > 0
+    assert metrics.totals("MCTSAgent")["rounds"] == 20
+
+
+def test_mcts_stats_count_reused_nodes():
+    agent = MCTSAgent(num_rounds=30, temperature=1.4, reuse_tree=True)
+    game = GameState.new_game(3)
+    agent.search(game)
+    first = agent.last_stats
+    assert first.reused_nodes == 0
+    agent.search(game)
+    assert agent.last_stats.reused_nodes == first.tree_size
+    assert agent.last_stats.tree_size == first.tree_size + agent.last_stats.nodes_added
+
+
+def test_puct_search_stats():
+    agent = PUCTAgent(None, get_encoder_by_name("oneplane", 5), num_rounds=32, batch_size=8, evaluate=uniform_evaluate)
+    root = agent.search(GameState.new_game(5))
+    stats = agent.last_stats
+    assert stats.rounds == 32
+    assert stats.tree_size == count_nodes(root, lambda node: node.children.values())
+    # The root and every new leaf of an unfinished game are evaluated.
+    assert stats.evaluations == stats.tree_size
+    assert stats.max_depth >= 1
+    assert set(stats.phase_seconds) == {"select", "expand", "backup"}
+    assert sum(stats.phase_seconds.values()) <= stats.seconds
+
+
+def test_metrics_prometheus_export(tmp_path):
+    metrics = SearchMetrics()
+    metrics.record(make_stats("MCTSAgent", rounds=10))
+    metrics.record(make_stats("MCTSAgent", rounds=30))
+    metrics.record(make_stats("PUCTAgent", rounds=5))
+    assert metrics.totals("MCTSAgent")["searches"] == 2
+    assert metrics.totals("other")["rounds"] == 0
+
+    text = metrics.to_prometheus()
+    assert "# TYPE dlgo_search_rounds_total counter" in text
+    assert 'dlgo_search_rounds_total{agent="MCTSAgent"} 40' in text
+    assert 'dlgo_search_rounds_total{agent="PUCTAgent"} 5' in text
+    assert 'dlgo_search_phase_seconds_total{agent="MCTSAgent",phase="rollout"} 0.75' in text
+    assert 'dlgo_search_last_tree_size{agent="MCTSAgent"} 31' in text
+    assert text.endswith("\n")
+
+    path = tmp_path / "dlgo.prom"
+    metrics.write_prometheus(path)
+    assert path.read_text() == text
+
+
+def test_search_log_writes_json_lines(tmp_path):
+    buffer = io.StringIO()
+    log = SearchLog(buffer)
+    log.record(make_stats(rounds=3))
+    log.record(make_stats(rounds=4))
+    lines = [json.loads(line) for line in buffer.getvalue().splitlines()]
+    assert [line["rounds"] for line in lines] == [3, 4]
+
+    path = tmp_path / "search.jsonl"
+    agent = MCTSAgent(num_rounds=5)
+    with SearchLog(path) as log:
+        agent.add_stats_listener(log)
+        agent.select_move(GameState.new_game(3))
+    assert json.loads(path.read_text())["rounds"] == 5
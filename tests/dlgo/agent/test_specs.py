@@ -0,0 +1,45 @@
+"""
+This file was initially generated using an AI language model (Claude 3.5 Sonnet),
+as part of an educational project based on the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+
+The generated code has been reviewed, potentially modified, and adapted to fit the
+project's requirements and to ensure correctness and adherence to the book's concepts.
+"""
+
+import pytest
+
+from dlgo.agent.mcts_agent import MCTSAgent
+from dlgo.agent.predict import DeepLearningAgent
+from dlgo.agent.puct_agent import PUCTAgent
+from dlgo.agent.random_bot import RandomBot
+from dlgo.agent.specs import agent_factory
+from dlgo.encoders.base import get_encoder_by_name
+from dlgo.nn.models import PolicyNet, PolicyValueNet
+
+
+def test_builtin_agents():
+    assert isinstance(agent_factory("random")(), RandomBot)
+    agent = agent_factory("mcts:50:1.5")()
+    assert isinstance(agent, MCTSAgent)
+    assert (agent.num_rounds, agent.temperature) == (50, 1.5)
+    assert agent_factory("mcts")().num_rounds == 1000
+
+
+def test_saved_agents(tmp_path):
+    encoder = get_encoder_by_name("oneplane", 5)
+    policy_path = str(tmp_path / "policy.pt")
+    DeepLearningAgent(PolicyNet(1, num_filters=2, num_layers=1), encoder).serialize(policy_path)
+    puct_path = str(tmp_path / "puct.pt")
+    PUCTAgent(PolicyValueNet(1, num_filters=2, num_layers=1), encoder).serialize(puct_path)
+
+    assert isinstance(agent_factory(policy_path)(), DeepLearningAgent)
+    assert agent_factory(f"policy:{policy_path}:0.5")().temperature == 0.5
+    agent = agent_factory(f"puct:{puct_path}:20")()
+    assert isinstance(agent, PUCTAgent) and agent.num_rounds == 20
+
+
+@pytest.mark.parametrize("spec", ["random:1", "mcts:many", "policy", "puct:a:b:c"])
+def test_invalid_specs(spec):
+    with pytest.raises(ValueError):
+        agent_factory(spec)
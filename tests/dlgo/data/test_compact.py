@@ -0,0 +1,105 @@
+"""
+This file was initially generated using an AI language model (Claude 3.5 Sonnet),
+as part of an educational project based on the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+
+The generated code has been reviewed, potentially modified, and adapted to fit the
+project's requirements and to ensure correctness and adherence to the book's concepts.
+"""
+
+import numpy as np
+
+from dlgo.data.compact import (
+    NO_KO,
+    compact_position,
+    decode_oneplane,
+    ko_point,
+    pack_stones,
+    stack_positions,
+    stones_from_arrays,
+    to_game_state,
+    unpack_stones,
+)
+from dlgo.encoders.oneplane import OnePlaneEncoder
+from dlgo.gamestate import GameState
+from dlgo.gotypes import Player, Point
+from dlgo.move import Move
+from misc.board_utils import create_board_from_ascii
+
+
+def ko_game():
+    board = create_board_from_ascii(
+        """
+      A B C D
+    1 . B W .
+    2 B . B W
+    3 . B W .
+    4 . . . .
+    """
+    )
+    return GameState(board, Player.white, None, None)
+
+
+def test_ko_point_after_ko_capture():
+    game = ko_game()
+    assert ko_point(game) is None
+    game = game.apply_move(Move.play(Point(2, 2)))
+    assert ko_point(game) == Point(2, 3)
+
+
+def test_compact_position():
+    game = ko_game().apply_move(Move.play(Point(2, 2)))
+    position = compact_position(game, 7)
+    assert position["stones"].dtype == np.int8
+    assert np.array_equal(position["stones"], game.board.stone_array())
+    assert position["next_player"] == 1
+    assert position["ko_point"] == 1 * 4 + 2
+    assert position["move_number"] == 7
+
+    position = compact_position(GameState.new_game(4), 0)
+    assert position["next_player"] == 1
+    assert position["ko_point"] == NO_KO
+
+
+def test_decode_oneplane_matches_encoder():
+    game = GameState.new_game(5)
+    positions = []
+    for i, point in enumerate([Point(1, 1), Point(3, 3), Point(2, 4)]):
+        positions.append(compact_position(game, i))
+        game = game.apply_move(Move.play(point))
+    positions.append(compact_position(game, 3))
+    arrays = stack_positions(positions, (5, 5))
+
+    decoded = decode_oneplane(arrays["stones"], arrays["next_player"])
+
+    assert decoded.dtype == np.float32
+    assert decoded.shape == (4, 1, 5, 5)
+    encoder = OnePlaneEncoder((5, 5))
+    assert np.array_equal(decoded[-1], encoder.encode(game))
+
+
+def test_pack_stones_round_trip():
+    rng = np.random.default_rng(0)
+    stones = rng.integers(-1, 2, size=(6, 9, 9)).astype(np.int8)
+    packed = pack_stones(stones)
+    assert packed.dtype == np.uint8
+    assert packed.shape == (6, 21)
+    assert np.array_equal(unpack_stones(packed, (9, 9)), stones)
+    assert np.array_equal(stones_from_arrays({"packed_stones": packed}, (9, 9)), stones)
+
+
+def test_game_without_positions():
+    arrays = stack_positions([], (9, 9))
+    assert arrays["stones"].shape == (0, 9, 9) and arrays["stones"].dtype == np.int8
+    assert arrays["next_player"].shape == arrays["ko_point"].shape == arrays["move_number"].shape == (0,)
+    packed = pack_stones(arrays["stones"])
+    assert packed.shape == (0, 21) and packed.dtype == np.uint8
+    assert unpack_stones(packed, (9, 9)).shape == (0, 9, 9)
+
+
+def test_to_game_state():
+    game = ko_game()
+    restored = to_game_state(game.board.stone_array(), -1)
+    assert restored.next_player == Player.white
+    assert restored.board.zobrist_hash() == game.board.zobrist_hash()
+    assert restored.board.get_go_string(Point(2, 3)).num_liberties == 1
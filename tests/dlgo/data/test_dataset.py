@@ -0,0 +1,101 @@
+"""
+This file was initially generated using an AI language model (Claude 3.5 Sonnet),
+as part of an educational project based on the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+
+The generated code has been reviewed, potentially modified, and adapted to fit the
+project's requirements and to ensure correctness and adherence to the book's concepts.
+"""
+
+import numpy as np
+import pytest
+import torch
+from torch.utils.data import DataLoader
+
+from dlgo.data.compact import pack_stones
+from dlgo.data.dataset import ShardedDataset, ShardedIterableDataset, split_shards
+from dlgo.data.shards import ShardWriter
+
+
+def write_dataset(directory, game_lengths, compact=False, shard_size=4):
+    """Write games whose labels number the positions 0, 1, 2, ... and whose boards hold the label as well."""
+    first = 0
+    with ShardWriter(str(directory), shard_size, metadata={"board_size": 3}) as writer:
+        for length in game_lengths:
+            labels = np.arange(first, first + length, dtype=np.int16)
+            first += length
+            if compact:
+                stones = np.zeros((length, 3, 3), dtype=np.int8)
+                stones[:, 0, 0] = 1
+                writer.write_game(packed_stones=pack_stones(stones), next_player=np.full(length, -1, dtype=np.int8), labels=labels)
+            else:
+                features = np.zeros((length, 1, 3, 3))
+                features[:, 0, 0, 0] = labels
+                writer.write_game(features=features, labels=labels)
+    return first
+
+
+def test_map_style_dataset(tmp_path):
+    num_positions = write_dataset(tmp_path, [3, 2, 4, 1])
+    dataset = ShardedDataset(str(tmp_path))
+    assert len(dataset) == num_positions
+    for i in range(num_positions):
+        features, label = dataset[i]
+        assert features.dtype == torch.float32
+        assert features.shape == (1, 3, 3)
+        assert label.item() == i
+        assert features[0, 0, 0].item() == i
+    with pytest.raises(IndexError):
+        dataset[num_positions]
+
+
+def test_iterable_dataset_visits_every_position_once(tmp_path):
+    num_positions = write_dataset(tmp_path, [3, 2, 4, 1, 5, 2])
+    dataset = ShardedIterableDataset(str(tmp_path), batch_size=4, seed=1)
+
+    batches = list(dataset)
+
+    assert [len(labels) for _, labels in batches] == [4, 4, 4, 4, 1]
+    assert len(dataset) == len(batches)
+    labels = torch.cat([labels for _, labels in batches])
+    assert sorted(labels.tolist()) == list(range(num_positions))
+    features = torch.cat([features for features, _ in batches])
+    assert torch.equal(features[:, 0, 0, 0].long(), labels)
+
+
+def test_iterable_dataset_shuffles_between_passes(tmp_path):
+    write_dataset(tmp_path, [4] * 10)
+    dataset = ShardedIterableDataset(str(tmp_path), batch_size=8, seed=1)
+    first = torch.cat([labels for _, labels in dataset]).tolist()
+    second = torch.cat([labels for _, labels in dataset]).tolist()
+    assert sorted(first) == sorted(second)
+    assert first != second
+
+    unshuffled = ShardedIterableDataset(str(tmp_path), batch_size=8, shuffle=False, drop_last=True)
+    assert torch.cat([labels for _, labels in unshuffled]).tolist() == list(range(40))
+
+
+def test_iterable_dataset_splits_shards_between_workers(tmp_path):
+    num_positions = write_dataset(tmp_path, [4] * 6)
+    dataset = ShardedIterableDataset(str(tmp_path), batch_size=3, seed=2)
+    loader = DataLoader(dataset, batch_size=None, num_workers=2)
+    labels = torch.cat([labels for _, labels in loader])
+    assert sorted(labels.tolist()) == list(range(num_positions))
+
+
+def test_compact_dataset_is_decoded(tmp_path):
+    write_dataset(tmp_path, [3, 3], compact=True)
+    features, labels = next(iter(ShardedIterableDataset(str(tmp_path), batch_size=6, shuffle=False)))
+    assert features.shape == (6, 1, 3, 3)
+    assert features.dtype == torch.float32
+    # Black stone, white to play.
+    assert (features[:, 0, 0, 0] == -1).all()
+    assert features.sum().item() == -6
+
+
+def test_split_shards(tmp_path):
+    write_dataset(tmp_path, [4] * 10)
+    train, test = split_shards(str(tmp_path), 0.2)
+    assert train == list(range(8))
+    assert test == [8, 9]
+    assert len(ShardedDataset(str(tmp_path), test)) == 8
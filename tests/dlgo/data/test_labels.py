@@ -0,0 +1,42 @@
+"""
+This file was initially generated using an AI language model (Claude 3.5 Sonnet),
+as part of an educational project based on the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+
+The generated code has been reviewed, potentially modified, and adapted to fit the
+project's requirements and to ensure correctness and adherence to the book's concepts.
+"""
+
+import numpy as np
+
+from dlgo.data.labels import expand_visit_distribution, one_hot, sparse_visit_distribution, visit_offsets
+
+
+def test_one_hot():
+    expanded = one_hot(np.array([0, 3, 1], dtype=np.int16), 4)
+    assert expanded.dtype == np.float32
+    assert np.array_equal(expanded, [[1, 0, 0, 0], [0, 0, 0, 1], [0, 1, 0, 0]])
+
+
+def test_sparse_visit_distribution():
+    indices, probs = sparse_visit_distribution({4: 30, 7: 10})
+    assert indices.dtype == np.int16
+    assert probs.dtype == np.float16
+    assert indices.tolist() == [4, 7]
+    assert np.allclose(probs, [0.75, 0.25])
+
+
+def test_expand_visit_distribution_round_trip():
+    distributions = [{0: 1, 2: 3}, {}, {1: 5}]
+    lengths, indices, probs = [], [], []
+    for counts in distributions:
+        position_indices, position_probs = sparse_visit_distribution(counts)
+        lengths.append(len(position_indices))
+        indices.append(position_indices)
+        probs.append(position_probs)
+
+    expanded = expand_visit_distribution(lengths, np.concatenate(indices), np.concatenate(probs), 3)
+
+    assert expanded.shape == (3, 3)
+    assert np.allclose(expanded, [[0.25, 0, 0.75], [0, 0, 0], [0, 1, 0]])
+    assert visit_offsets(lengths).tolist() == [0, 2, 2, 3]
@@ -0,0 +1,101 @@
+"""
+This file was initially generated using an AI language model (Claude 3.5 Sonnet),
+as part of an educational project based on the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+
+The generated code has been reviewed, potentially modified, and adapted to fit the
+project's requirements and to ensure correctness and adherence to the book's concepts.
+"""
+
+import os
+
+import numpy as np
+
+from dlgo.data.processor import encode_games, iter_text_chunks, process_games
+from dlgo.data.shards import load_arrays, read_manifest
+from dlgo.encoders.base import get_encoder_by_name
+from dlgo.sgf import parse_game
+
+GAMES = [
+    "(;SZ[5];B[cc];W[bb];B[];W[dd])",
+    "(;SZ[5]AB[aa];W[cc];B[bb])",
+    "(;SZ[9];B[cc])",  # Other board size
+    "(;SZ[5];B[cc];W[cc])",  # Occupied point
+    "(;SZ[5];B[zz])",  # Malformed
+]
+
+
+def write_corpus(directory):
+    os.makedirs(directory / "records")
+    (directory / "records" / "a.sgf").write_text("".join(GAMES[:3]))
+    (directory / "records" / "b.sgf").write_text("".join(GAMES[3:]) + GAMES[0])
+    (directory / "records" / "notes.txt").write_text("not a game")
+    return str(directory / "records")
+
+
+def test_iter_text_chunks(tmp_path):
+    records = write_corpus(tmp_path)
+    chunks = list(iter_text_chunks(os.path.join(records, "b.sgf"), games_per_chunk=2))
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert parse_game(chunks[1][0]).moves == parse_game(GAMES[0]).moves
+
+
+def test_encode_games(tmp_path):
+    records = write_corpus(tmp_path)
+    (texts,) = iter_text_chunks(os.path.join(records, "a.sgf"))
+    result = encode_games(texts, "oneplane", 5)
+
+    assert result["features"].dtype == np.int8
+    assert result["features"].shape == (5, 1, 5, 5)
+    assert result["labels"].dtype == np.int16
+    assert result["game_lengths"].tolist() == [3, 2]
+    assert result["skipped"] == 1
+
+    encoder = get_encoder_by_name("oneplane", 5)
+    game_state, move = list(parse_game(GAMES[1]).replay())[1]
+    assert np.array_equal(result["features"][4], encoder.encode(game_state))
+    assert result["labels"][4] == encoder.encode_point(move.point)
+
+
+def test_process_games_is_independent_of_workers(tmp_path):
+    records = write_corpus(tmp_path)
+    stats = process_games([records], str(tmp_path / "serial"), "sevenplane", 5, shard_size=2)
+    process_games([records], str(tmp_path / "parallel"), "sevenplane", 5, workers=2, shard_size=2, games_per_chunk=1)
+
+    assert stats == {"files": 2, "cached_files": 0, "games": 3, "skipped_games": 3, "positions": 8}
+    serial = load_arrays(str(tmp_path / "serial"))
+    parallel = load_arrays(str(tmp_path / "parallel"))
+    assert serial["features"].shape == (8, 7, 5, 5)
+    assert np.array_equal(serial["features"], parallel["features"])
+    assert np.array_equal(serial["labels"], parallel["labels"])
+    manifest = read_manifest(str(tmp_path / "serial"))
+    assert manifest["num_games"] == 3
+    assert manifest["metadata"]["encoder"] == "sevenplane"
+
+
+def test_encode_games_skips_illegal_plays(capsys):
+    self_capture = "(;SZ[5];B[ba];W[dd];B[ab];W[aa])"
+    result = encode_games([GAMES[3], self_capture, GAMES[0]], "oneplane", 5)
+    assert result["game_lengths"].tolist() == [3]
+    assert result["skipped"] == 2
+    assert capsys.readouterr().out == ""
+
+
+def test_cache_skips_unchanged_files(tmp_path):
+    records = write_corpus(tmp_path)
+    cache_dir = str(tmp_path / "cache")
+    first = process_games([records], str(tmp_path / "first"), "oneplane", 5, cache_dir=cache_dir)
+    second = process_games([records], str(tmp_path / "second"), "oneplane", 5, cache_dir=cache_dir)
+    assert first["cached_files"] == 0
+    assert second["cached_files"] == 2
+    assert np.array_equal(load_arrays(str(tmp_path / "first"))["features"], load_arrays(str(tmp_path / "second"))["features"])
+
+    path = os.path.join(records, "b.sgf")
+    with open(path, "a") as f:
+        f.write(GAMES[1])
+    third = process_games([records], str(tmp_path / "third"), "oneplane", 5, cache_dir=cache_dir)
+    assert third["cached_files"] == 1
+    assert third["positions"] == first["positions"] + 2
+
+    other_encoder = process_games([records], str(tmp_path / "fourth"), "sevenplane", 5, cache_dir=cache_dir)
+    assert other_encoder["cached_files"] == 0
@@ -0,0 +1,111 @@
+"""
+This file was initially generated using an AI language model (Claude 3.5 Sonnet),
+as part of an educational project based on the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+
+The generated code has been reviewed, potentially modified, and adapted to fit the
+project's requirements and to ensure correctness and adherence to the book's concepts.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from dlgo.data.shards import MANIFEST, ShardWriter, iter_shards, load_arrays, read_manifest
+
+
+def make_game(num_positions, start=0):
+    features = np.arange(start, start + num_positions, dtype=np.float32).reshape(-1, 1) * np.ones((1, 4), dtype=np.float32)
+    labels = np.arange(start, start + num_positions, dtype=np.int16)
+    return features, labels
+
+
+def test_shards_hold_whole_games(tmp_path):
+    directory = str(tmp_path / "data")
+    with ShardWriter(directory, shard_size=5) as writer:
+        start = 0
+        for num_positions in [3, 3, 2, 6, 1]:
+            features, labels = make_game(num_positions, start)
+            writer.write_game(features=features, labels=labels)
+            start += num_positions
+
+    manifest = read_manifest(directory)
+    assert [shard["num_positions"] for shard in manifest["shards"]] == [6, 8, 1]
+    assert [shard["num_games"] for shard in manifest["shards"]] == [2, 2, 1]
+    assert manifest["num_games"] == 5
+    assert manifest["num_positions"] == 15
+    assert manifest["arrays"]["labels"] == {"dtype": "<i2", "shape": []}
+
+    arrays = load_arrays(directory)
+    assert np.array_equal(arrays["labels"], np.arange(15))
+    assert np.array_equal(arrays["features"][:, 2], np.arange(15))
+
+
+def test_games_are_buffered_until_the_shard_is_full(tmp_path):
+    directory = str(tmp_path)
+    writer = ShardWriter(directory, shard_size=10)
+    writer.write_game(features=np.zeros((4, 2)), labels=np.zeros(4))
+    assert writer.num_games == 0
+    assert read_manifest(directory)["shards"] == []
+    writer.close()
+    assert writer.num_games == 1
+    assert len(list(iter_shards(directory))) == 1
+
+
+def test_resume_continues_after_last_complete_shard(tmp_path):
+    directory = str(tmp_path)
+    writer = ShardWriter(directory, shard_size=2, metadata={"seed": 3})
+    for i in range(3):
+        writer.write_game(labels=np.full(2, i, dtype=np.int16))
+    # Simulate a crash: the next shard was half written and never made it into the manifest.
+    writer.write_game(labels=np.full(1, 3, dtype=np.int16))
+    with open(os.path.join(directory, "shard-00003.labels.npy.tmp"), "wb") as f:
+        f.write(b"partial")
+
+    with pytest.raises(FileExistsError):
+        ShardWriter(directory, shard_size=2)
+
+    with ShardWriter(directory, shard_size=2, resume=True) as resumed:
+        assert resumed.num_games == 3
+        assert resumed.metadata == {"seed": 3}
+        resumed.write_game(labels=np.full(2, 3, dtype=np.int16))
+
+    assert not os.path.exists(os.path.join(directory, "shard-00003.labels.npy.tmp"))
+    assert np.array_equal(load_arrays(directory)["labels"], [0, 0, 1, 1, 2, 2, 3, 3])
+
+
+def test_empty_games_are_counted(tmp_path):
+    with ShardWriter(str(tmp_path), shard_size=10) as writer:
+        writer.write_game(features=np.zeros((0,)), labels=np.zeros((0,)))
+        writer.write_game(features=np.zeros((2, 3)), labels=np.zeros(2))
+    assert read_manifest(str(tmp_path))["num_games"] == 2
+    assert load_arrays(str(tmp_path))["features"].shape == (2, 3)
+
+
+def test_rejects_inconsistent_arrays(tmp_path):
+    writer = ShardWriter(str(tmp_path), shard_size=10)
+    with pytest.raises(ValueError, match="same number of positions"):
+        writer.write_game(features=np.zeros((2, 3)), labels=np.zeros(3))
+    writer.write_game(features=np.zeros((2, 3)), labels=np.zeros(2))
+    with pytest.raises(ValueError, match="layout"):
+        writer.write_game(features=np.zeros((2, 4)), labels=np.zeros(2))
+
+
+def test_iter_shards_can_memory_map(tmp_path):
+    with ShardWriter(str(tmp_path), shard_size=1) as writer:
+        writer.write_game(labels=np.arange(3))
+    (shard,) = iter_shards(str(tmp_path), mmap_mode="r")
+    assert isinstance(shard["labels"], np.memmap)
+    assert os.path.exists(os.path.join(str(tmp_path), MANIFEST))
+
+
+def test_ragged_arrays(tmp_path):
+    with ShardWriter(str(tmp_path), shard_size=100) as writer:
+        writer.write_game(labels=np.arange(2), ragged={"entries": np.arange(5)})
+        writer.write_game(labels=np.arange(1), ragged={"entries": np.arange(3)})
+    manifest = read_manifest(str(tmp_path))
+    assert manifest["arrays"]["entries"]["ragged"]
+    assert manifest["num_positions"] == 3
+    arrays = load_arrays(str(tmp_path))
+    assert np.array_equal(arrays["entries"], [0, 1, 2, 3, 4, 0, 1, 2])
@@ -0,0 +1,94 @@
+"""
+This file was initially generated using an AI language model (Claude 3.5 Sonnet),
+as part of an educational project based on the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+
+The generated code has been reviewed, potentially modified, and adapted to fit the
+project's requirements and to ensure correctness and adherence to the book's concepts.
+"""
+
+import numpy as np
+import pytest
+
+from dlgo.encoders.alphago import AlphaGoEncoder, offset
+from dlgo.encoders.base import get_encoder_by_name
+from dlgo.gamestate import GameState
+from dlgo.gotypes import Player, Point
+from dlgo.move import Move
+from misc.board_utils import create_board_from_ascii
+
+
+@pytest.fixture
+def encoder():
+    return AlphaGoEncoder((5, 5))
+
+
+def test_encoder_name_and_shape(encoder):
+    assert encoder.name() == "alphago"
+    assert encoder.shape() == (48, 5, 5)
+    assert AlphaGoEncoder((5, 5), use_player_plane=True).shape() == (49, 5, 5)
+
+
+def test_get_encoder_by_name_passes_options():
+    encoder = get_encoder_by_name("alphago", 9, use_player_plane=True)
+    assert isinstance(encoder, AlphaGoEncoder)
+    assert encoder.shape() == (49, 9, 9)
+
+
+def test_empty_board(encoder):
+    encoded = encoder.encode(GameState.new_game(5))
+    assert np.all(encoded[offset("stone_color") + 2] == 1)
+    assert np.all(encoded[offset("ones")] == 1)
+    assert not encoded[offset("zeros")].any()
+    assert np.all(encoded[offset("sensibleness")] == 1)
+    assert not encoded[offset("turns_since") : offset("turns_since") + 8].any()
+    # Every move is legal and captures nothing.
+    assert np.all(encoded[offset("capture_size")] == 1)
+    # Corners leave 2 liberties, edges 3 and the centre 4.
+    liberties_after = encoded[offset("liberties_after") : offset("liberties_after") + 8]
+    assert liberties_after[1, 0, 0] == 1
+    assert liberties_after[2, 0, 2] == 1
+    assert liberties_after[3, 2, 2] == 1
+
+
+def test_turns_since_and_captures(encoder):
+    game = GameState.new_game(5)
+    for point in [Point(1, 1), Point(1, 2), Point(5, 5)]:
+        game = game.apply_move(Move.play(point))
+    # White to play, the black stone at (1, 1) can be captured at (2, 1).
+    encoded = encoder.encode(game)
+    turns_since = encoded[offset("turns_since") : offset("turns_since") + 8]
+    assert turns_since[2, 0, 0] == 1
+    assert turns_since[1, 0, 1] == 1
+    assert turns_since[0, 4, 4] == 1
+    assert encoded[offset("stone_color"), 0, 1] == 1  # White stone belongs to the player to move
+    assert encoded[offset("stone_color") + 1, 0, 0] == 1
+    assert encoded[offset("capture_size") + 1, 1, 0] == 1
+    assert encoded[offset("liberties"), 0, 0] == 1
+
+
+def test_self_atari_and_sensibleness(encoder):
+    board = create_board_from_ascii(
+        """
+      A B C D E
+    1 . B . . .
+    2 B B . . .
+    3 . . . . W
+    4 . . . W .
+    5 . . . . .
+    """
+    )
+    encoded = encoder.encode(GameState(board, Player.black, None, None))
+    assert encoded[offset("sensibleness"), 0, 0] == 0  # Filling its own eye
+    assert encoded[offset("self_atari_size"), 3, 4] == 1  # A single black stone in atari
+    assert encoded[offset("liberties_after"), 3, 4] == 1
+
+    encoded = encoder.encode(GameState(board, Player.white, None, None))
+    assert encoded[offset("sensibleness"), 0, 0] == 0  # Suicide for white
+    assert encoded[offset("self_atari_size"), 3, 4] == 0
+
+
+def test_player_plane():
+    encoder = AlphaGoEncoder((5, 5), use_player_plane=True)
+    assert np.all(encoder.encode(GameState.new_game(5))[offset("current_player_color")] == 1)
+    assert not encoder.encode(GameState.new_game(5).apply_move(Move.pass_turn()))[offset("current_player_color")].any()
@@ -7,6 +7,7 @@ The generated code has been reviewed, potentially modified, and adapted to fit t
 project's requirements and to ensure correctness and adherence to the book's concepts.
 """
 
+import numpy as np
 import pytest
 
 from dlgo.board import Board
@@ -37,3 +38,19 @@ def test_encoder_methods():
 
     with pytest.raises(NotImplementedError):
         encoder.shape()
+
+
+def test_default_encode_batch_uses_encode():
+    class ConstantEncoder(Encoder):
+        def encode(self, game_state):
+            return np.ones(self.shape())
+
+        def shape(self):
+            return 2, 3, 3
+
+    game = GameState.new_game(3)
+    batch = ConstantEncoder().encode_batch([game, game])
+
+    assert batch.shape == (2, 2, 3, 3)
+    assert batch.dtype == np.float32
+    assert np.all(batch == 1)
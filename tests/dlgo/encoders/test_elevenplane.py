@@ -0,0 +1,53 @@
+"""
+This file was initially generated using an AI language model (Claude 3.5 Sonnet),
+as part of an educational project based on the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+
+The generated code has been reviewed, potentially modified, and adapted to fit the
+project's requirements and to ensure correctness and adherence to the book's concepts.
+"""
+
+import numpy as np
+import pytest
+
+from dlgo.encoders.base import get_encoder_by_name
+from dlgo.encoders.elevenplane import ElevenPlaneEncoder
+from dlgo.gamestate import GameState
+from dlgo.gotypes import Player
+from misc.board_utils import create_board_from_ascii
+
+
+@pytest.fixture
+def encoder():
+    return ElevenPlaneEncoder((5, 5))
+
+
+def test_encoder_name_and_shape(encoder):
+    assert encoder.name() == "elevenplane"
+    assert encoder.shape() == (11, 5, 5)
+
+
+def test_get_encoder_by_name():
+    assert isinstance(get_encoder_by_name("elevenplane", 9), ElevenPlaneEncoder)
+
+
+def test_planes_use_absolute_colors(encoder):
+    board = create_board_from_ascii(
+        """
+      A B C D E
+    1 B W . . .
+    2 . . . . .
+    3 . . B . .
+    4 . . . . .
+    5 . . . . .
+    """
+    )
+    for next_player in (Player.black, Player.white):
+        encoded = encoder.encode(GameState(board, next_player, None, None))
+        assert encoded[0, 0, 0] == 1  # Black stone with one liberty
+        assert encoded[3, 2, 2] == 1  # Black stone with four liberties
+        assert encoded[5, 0, 1] == 1  # White stone with two liberties
+        assert encoded[:8].sum() == 3
+        assert np.all(encoded[8] == (next_player == Player.black))
+        assert np.all(encoded[9] == (next_player == Player.white))
+        assert not encoded[10].any()
@@ -0,0 +1,126 @@
+"""
+This file was initially generated using an AI language model (Claude 3.5 Sonnet),
+as part of an educational project based on the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+
+The generated code has been reviewed, potentially modified, and adapted to fit the
+project's requirements and to ensure correctness and adherence to the book's concepts.
+"""
+
+import copy
+import random
+
+import numpy as np
+import pytest
+
+from dlgo.agent.random_bot import RandomBot
+from dlgo.encoders.features import BoardFeatures, one_hot_planes
+from dlgo.gamestate import GameState
+from dlgo.gotypes import Player, Point
+from dlgo.move import Move
+from misc.board_utils import create_board_from_ascii
+
+
+@pytest.fixture
+def random_positions():
+    random.seed(42)
+    bot = RandomBot()
+    game = GameState.new_game(7)
+    positions = []
+    while not game.is_over() and len(positions) < 80:
+        positions.append(game)
+        game = game.apply_move(bot.select_move(game))
+    return positions
+
+
+def test_stones_are_relative_to_next_player():
+    board = create_board_from_ascii(
+        """
+      A B C
+    1 B . .
+    2 . W .
+    3 . . .
+    """
+    )
+    features = BoardFeatures(GameState(board, Player.white, None, None))
+    assert features.stones[0, 0] == -1
+    assert features.stones[1, 1] == 1
+    assert np.sum(features.stones == 0) == 7
+
+
+def test_liberties():
+    board = create_board_from_ascii(
+        """
+      A B C D
+    1 B B W .
+    2 . . W .
+    3 . . . .
+    4 . . . .
+    """
+    )
+    features = BoardFeatures(GameState(board, Player.black, None, None))
+    assert features.liberties[0, 0] == 2
+    assert features.liberties[0, 1] == 2
+    assert features.liberties[0, 2] == 4
+    assert features.liberties[1, 0] == 0
+
+
+def test_candidates_match_playing_the_move(random_positions):
+    for game_state in random_positions:
+        candidates = BoardFeatures(game_state).candidates
+        for row in range(1, 8):
+            for col in range(1, 8):
+                point = Point(row, col)
+                legal = game_state.is_valid_move(Move.play(point))
+                assert candidates.legal[row - 1, col - 1] == legal
+                if not legal:
+                    assert candidates.capture_size[row - 1, col - 1] == -1
+                    continue
+                stones_before = np.count_nonzero(game_state.board.stone_array())
+                board = copy.deepcopy(game_state.board)
+                board.place_stone(game_state.next_player, point)
+                new_string = board.get_go_string(point)
+                captured = stones_before + 1 - np.count_nonzero(board.stone_array())
+                assert candidates.liberties_after[row - 1, col - 1] == new_string.num_liberties
+                assert candidates.capture_size[row - 1, col - 1] == captured
+                expected_atari = len(new_string.stones) if new_string.num_liberties == 1 else 0
+                assert candidates.self_atari_size[row - 1, col - 1] == expected_atari
+
+
+def test_ko_points():
+    board = create_board_from_ascii(
+        """
+      A B C D
+    1 . B W .
+    2 B . B W
+    3 . B W .
+    4 . . . .
+    """
+    )
+    game = GameState(board, Player.white, None, None)
+    assert not BoardFeatures(game).ko.any()
+
+    game = game.apply_move(Move.play(Point(2, 2)))  # White takes the ko
+    features = BoardFeatures(game)
+    assert features.ko[1, 2]
+    assert features.ko.sum() == 1
+    assert not features.candidates.legal[1, 2]
+
+
+def test_move_ages_survive_apply_move():
+    game = GameState.new_game(5)
+    game = game.apply_move(Move.play(Point(1, 1)))
+    game = game.apply_move(Move.play(Point(3, 3)))
+    ages = BoardFeatures(game).move_ages
+    assert ages[0, 0] == 1
+    assert ages[2, 2] == 0
+    assert ages[4, 4] == -1
+
+
+def test_one_hot_planes_clips_last_plane():
+    values = np.array([[0, 1, 2], [3, 9, -1]])
+    out = np.zeros((3, 2, 3), dtype=np.float32)
+    one_hot_planes(values, out, first_value=1)
+    assert np.array_equal(out[0], [[0, 1, 0], [0, 0, 0]])
+    assert np.array_equal(out[1], [[0, 0, 1], [0, 0, 0]])
+    assert np.array_equal(out[2], [[0, 0, 0], [1, 1, 0]])
@@ -7,15 +7,19 @@ The generated code has been reviewed, potentially modified, and adapted to fit t
 project's requirements and to ensure correctness and adherence to the book's concepts.
 """
 
+import random
+
 import numpy as np
 import pytest
 from utils.test_board_utils import create_board_from_ascii
 
+from dlgo.agent.random_bot import RandomBot
 from dlgo.board import Board
 from dlgo.encoders.base import get_encoder_by_name
-from dlgo.encoders.oneplane import OnePlaneEncoder
+from dlgo.encoders.oneplane import IncrementalOnePlaneEncoder, OnePlaneEncoder
 from dlgo.gamestate import GameState
 from dlgo.gotypes import Player, Point
+from dlgo.move import Move
 
 
 @pytest.fixture
@@ -158,3 +162,90 @@ def test_get_encoder_by_name():
     # Test with invalid encoder name
     with pytest.raises(ImportError):
         get_encoder_by_name("invalid_encoder", 19)
+
+
+def test_encode_non_square_board():
+    encoder = OnePlaneEncoder((5, 3))
+    board = Board(3, 5)
+    board.place_stone(Player.black, Point(3, 5))
+    board.place_stone(Player.white, Point(1, 2))
+    game = GameState(board, Player.white, None, None)
+
+    encoded_board = encoder.encode(game)
+
+    assert encoded_board.shape == (1, 3, 5)
+    assert encoded_board[0, 2, 4] == -1
+    assert encoded_board[0, 0, 1] == 1
+    assert np.sum(encoded_board != 0) == 2
+
+
+def test_encode_batch_matches_encode(small_encoder):
+    game = GameState.new_game(5)
+    states = [game]
+    for point in [Point(1, 1), Point(2, 2), Point(3, 3), Point(1, 2)]:
+        game = game.apply_move(Move.play(point))
+        states.append(game)
+
+    batch = small_encoder.encode_batch(states)
+
+    assert batch.shape == (len(states), 1, 5, 5)
+    assert batch.dtype == np.float32
+    for i, state in enumerate(states):
+        assert np.array_equal(batch[i], small_encoder.encode(state))
+
+
+def test_encode_batch_into_int8_buffer(small_encoder):
+    game = GameState.new_game(5).apply_move(Move.play(Point(3, 3)))
+    out = np.full((2, 1, 5, 5), 7, dtype=np.int8)
+
+    result = small_encoder.encode_batch([game, game.apply_move(Move.play(Point(2, 2)))], out=out)
+
+    assert result is out
+    assert out[0, 0, 2, 2] == -1  # White to play, black stone belongs to the opponent
+    assert out[1, 0, 2, 2] == 1
+    assert out[1, 0, 1, 1] == -1
+    assert np.sum(out != 0) == 3
+
+
+def test_encode_batch_rejects_bad_buffers(small_encoder):
+    game = GameState.new_game(5)
+
+    with pytest.raises(ValueError, match="shape"):
+        small_encoder.encode_batch([game], out=np.zeros((2, 1, 5, 5), dtype=np.float32))
+
+    non_contiguous = np.zeros((1, 1, 5, 10), dtype=np.float32)[..., ::2]
+    with pytest.raises(ValueError, match="C-contiguous"):
+        small_encoder.encode_batch([game], out=non_contiguous)
+
+
+def test_incremental_encoder_matches_full_encoding():
+    random.seed(7)
+    bot = RandomBot()
+    full_encoder = OnePlaneEncoder((7, 7))
+    encoder = get_encoder_by_name("oneplane", 7, incremental=True)
+    assert isinstance(encoder, IncrementalOnePlaneEncoder)
+
+    game = GameState.new_game(7)
+    captures = 0
+    while not game.is_over():
+        assert np.array_equal(encoder.encode(game), full_encoder.encode(game))
+        previous_stones = np.count_nonzero(game.board.stone_array())
+        game = game.apply_move(bot.select_move(game))
+        captures += np.count_nonzero(game.board.stone_array()) < previous_stones
+    assert captures > 0
+    # One game was encoded sequentially, so a single cache entry was carried along.
+    assert len(encoder._cache) == 1
+
+
+def test_incremental_encoder_handles_several_games():
+    encoder = IncrementalOnePlaneEncoder((5, 5), max_games=2)
+    full_encoder = OnePlaneEncoder((5, 5))
+    games = [GameState.new_game(5) for _ in range(3)]
+    for point in [Point(1, 1), Point(2, 2), Point(3, 3)]:
+        for i, game in enumerate(games):
+            games[i] = game.apply_move(Move.play(point))
+            assert np.array_equal(encoder.encode(games[i]), full_encoder.encode(games[i]))
+    assert len(encoder._cache) == 2
+
+    batch = encoder.encode_batch(games)
+    assert np.array_equal(batch, full_encoder.encode_batch(games))
@@ -0,0 +1,84 @@
+"""
+This file was initially generated using an AI language model (Claude 3.5 Sonnet),
+as part of an educational project based on the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+
+The generated code has been reviewed, potentially modified, and adapted to fit the
+project's requirements and to ensure correctness and adherence to the book's concepts.
+"""
+
+import numpy as np
+import pytest
+
+from dlgo.encoders.base import get_encoder_by_name
+from dlgo.encoders.sevenplane import SevenPlaneEncoder
+from dlgo.gamestate import GameState
+from dlgo.gotypes import Player, Point
+from dlgo.move import Move
+from misc.board_utils import create_board_from_ascii
+
+
+@pytest.fixture
+def encoder():
+    return SevenPlaneEncoder((5, 5))
+
+
+def test_encoder_name_and_shape(encoder):
+    assert encoder.name() == "sevenplane"
+    assert encoder.shape() == (7, 5, 5)
+    assert encoder.num_points() == 25
+
+
+def test_get_encoder_by_name():
+    assert isinstance(get_encoder_by_name("sevenplane", 9), SevenPlaneEncoder)
+
+
+def test_liberty_planes(encoder):
+    board = create_board_from_ascii(
+        """
+      A B C D E
+    1 B W . . .
+    2 . . . . .
+    3 . . B B .
+    4 . . . . .
+    5 . . . . W
+    """
+    )
+    encoded = encoder.encode(GameState(board, Player.white, None, None))
+
+    # White is to play, so white stones go to planes 0 - 2.
+    assert encoded[1, 0, 1] == 1  # Two liberties
+    assert encoded[1, 4, 4] == 1
+    assert encoded[3, 0, 0] == 1  # Black stone in atari
+    assert encoded[5, 2, 2] == 1 and encoded[5, 2, 3] == 1  # Three or more liberties
+    assert encoded[:6].sum() == 5
+    assert not encoded[6].any()
+
+
+def test_ko_plane(encoder):
+    board = create_board_from_ascii(
+        """
+      A B C D E
+    1 . B W . .
+    2 B . B W .
+    3 . B W . .
+    4 . . . . .
+    5 . . . . .
+    """
+    )
+    game = GameState(board, Player.white, None, None).apply_move(Move.play(Point(2, 2)))
+    encoded = encoder.encode(game)
+    assert encoded[6, 1, 2] == 1
+    assert encoded[6].sum() == 1
+
+
+def test_encode_batch_matches_encode(encoder):
+    game = GameState.new_game(5)
+    states = [game]
+    for point in [Point(1, 1), Point(1, 2), Point(2, 1), Point(3, 3)]:
+        game = game.apply_move(Move.play(point))
+        states.append(game)
+    out = np.full((len(states),) + encoder.shape(), 5, dtype=np.int8)
+    encoder.encode_batch(states, out=out)
+    for i, state in enumerate(states):
+        assert np.array_equal(out[i], encoder.encode(state))
@@ -0,0 +1,106 @@
+"""
+This file was initially generated using an AI language model (Claude 3.5 Sonnet),
+as part of an educational project based on the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+
+The generated code has been reviewed, potentially modified, and adapted to fit the
+project's requirements and to ensure correctness and adherence to the book's concepts.
+"""
+
+import functools
+import threading
+
+import numpy as np
+import pytest
+import torch
+
+from dlgo.agent.predict import DeepLearningAgent, load_evaluator
+from dlgo.encoders.base import get_encoder_by_name
+from dlgo.gamestate import GameState
+from dlgo.gotypes import Point
+from dlgo.move import Move
+from dlgo.nn.batching import InferenceQueue, InferenceServer, model_evaluator
+from dlgo.nn.models import PolicyNet
+
+
+def double(features):
+    return features * 2
+
+
+def make_double():
+    return double
+
+
+def test_queue_batches_concurrent_requests():
+    calls = []
+
+    def evaluate(features):
+        calls.append(len(features))
+        return features.sum(axis=1), -features[:, 0]
+
+    results = {}
+    with InferenceQueue(evaluate, max_batch_size=16, timeout=0.5) as inference:
+
+        def request(i):
+            results[i] = inference(np.full((2, 3), i, dtype=np.float32))
+
+        threads = [threading.Thread(target=request, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    for i in range(8):
+        sums, negated = results[i]
+        assert sums.tolist() == [3 * i, 3 * i]
+        assert negated.tolist() == [-i, -i]
+    # The batch fills up with 16 positions long before the timeout.
+    assert calls == [16]
+    assert inference.num_batches == 1
+    assert inference.num_positions == 16
+
+
+def test_queue_flushes_on_timeout():
+    with InferenceQueue(double, max_batch_size=64, timeout=0.001) as inference:
+        assert inference(np.ones((1, 2))).tolist() == [[2, 2]]
+        assert inference(np.ones((3, 2))).shape == (3, 2)
+    assert inference.num_batches == 2
+
+
+def test_queue_reports_errors():
+    def fail(features):
+        raise RuntimeError("model failed")
+
+    with InferenceQueue(fail) as inference:
+        with pytest.raises(RuntimeError):
+            inference(np.ones((1, 2)))
+
+
+def test_agents_share_a_queue():
+    torch.manual_seed(0)
+    encoder = get_encoder_by_name("oneplane", 5)
+    model = PolicyNet(1, num_filters=4, num_layers=1)
+    direct = DeepLearningAgent(model, encoder)
+    game = GameState.new_game(5).apply_move(Move.play(Point(3, 3)))
+    with InferenceQueue(model_evaluator(model)) as inference:
+        queued = DeepLearningAgent(model, encoder, evaluate=inference)
+        assert np.allclose(queued.predict([game]), direct.predict([game]))
+
+
+def test_server_serves_clients():
+    with InferenceServer(make_double, num_clients=2, timeout=0.001) as server:
+        first, second = server.client(0), server.client(1)
+        assert first(np.ones((2, 2))).tolist() == [[2, 2], [2, 2]]
+        assert second(np.full((1, 3), 4)).tolist() == [[8, 8, 8]]
+
+
+def test_server_loads_saved_model(tmp_path):
+    torch.manual_seed(0)
+    encoder = get_encoder_by_name("oneplane", 5)
+    agent = DeepLearningAgent(PolicyNet(1, num_filters=4, num_layers=1), encoder)
+    path = str(tmp_path / "agent.pt")
+    agent.serialize(path)
+    game = GameState.new_game(5)
+    with InferenceServer(functools.partial(load_evaluator, path), num_clients=1) as server:
+        remote = DeepLearningAgent(agent.model, encoder, evaluate=server.client(0))
+        assert np.allclose(remote.predict([game]), agent.predict([game]), atol=1e-6)
@@ -0,0 +1,145 @@
+"""
+This file was initially generated using an AI language model (Claude 3.5 Sonnet),
+as part of an educational project based on the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+
+The generated code has been reviewed, potentially modified, and adapted to fit the
+project's requirements and to ensure correctness and adherence to the book's concepts.
+"""
+
+import numpy as np
+
+from dlgo.agent.puct_agent import PUCTAgent
+from dlgo.encoders.base import get_encoder_by_name
+from dlgo.gamestate import GameState
+from dlgo.gotypes import Player, Point
+from dlgo.move import Move
+from dlgo.nn.cache import EvaluationCache, evaluate_with_cache, position_key
+from misc.board_utils import create_board_from_ascii
+
+
+class Stones:
+    """Policy mirrors the board (so it turns with it), value is the stone balance; counts evaluated positions."""
+
+    def __init__(self):
+        self.positions = 0
+
+    def __call__(self, features):
+        self.positions += len(features)
+        policy = np.concatenate([features.reshape(len(features), -1), np.full((len(features), 1), 0.5)], axis=1)
+        return policy, features.sum(axis=(1, 2, 3)) / 10
+
+
+def play(moves, board_size=5):
+    game = GameState.new_game(board_size)
+    for row, col in moves:
+        game = game.apply_move(Move.play(Point(row, col)))
+    return game
+
+
+def test_transpositions_share_a_key():
+    first = play([(1, 1), (3, 3), (2, 2)])
+    second = play([(2, 2), (3, 3), (1, 1)])
+    assert position_key(first, "oneplane") == position_key(second, "oneplane")
+    assert position_key(first, "oneplane") != position_key(first, "sevenplane")
+    assert position_key(first, "oneplane") != position_key(play([(1, 1), (3, 3)]), "oneplane")
+
+
+def test_move_ages_are_part_of_the_key_for_encoders_that_use_them():
+    encoder = get_encoder_by_name("alphago", 5)
+    first = play([(1, 1), (3, 3), (2, 2)])
+    second = play([(2, 2), (3, 3), (1, 1)])
+    assert position_key(first, "alphago", move_age_levels=8) != position_key(second, "alphago", move_age_levels=8)
+    assert position_key(first, "alphago", canonicalize=True, move_age_levels=8) != position_key(
+        second, "alphago", canonicalize=True, move_age_levels=8
+    )
+
+    evaluate = Stones()
+    cache = EvaluationCache()
+    evaluate_with_cache(cache, encoder, evaluate, [first])
+    policy, _ = evaluate_with_cache(cache, encoder, evaluate, [second])
+    assert evaluate.positions == 2
+    assert np.array_equal(policy, Stones()(encoder.encode_batch([second]))[0])
+
+
+def test_ko_is_part_of_the_key():
+    board = create_board_from_ascii(
+        """
+      A B C D
+    1 . B W .
+    2 B . . W
+    3 . B W .
+    4 . . . .
+    """
+    )
+    game = GameState(board, Player.white, None, None)
+    # White plays into the ko at B2 and black captures it at C2.
+    after_capture = game.apply_move(Move.play(Point(2, 2))).apply_move(Move.play(Point(2, 3)))
+    # Once both players pass, the same stones no longer forbid the retake.
+    after_passes = after_capture.apply_move(Move.pass_turn()).apply_move(Move.pass_turn())
+    assert after_capture.board.zobrist_hash() == after_passes.board.zobrist_hash()
+    assert after_capture.next_player == after_passes.next_player
+    assert position_key(after_capture, "oneplane") != position_key(after_passes, "oneplane")
+
+
+def test_canonical_keys_and_policies():
+    encoder = get_encoder_by_name("oneplane", 5)
+    game = play([(1, 2), (4, 4)])
+    # The same position reflected and rotated.
+    mirrored = play([(2, 5), (4, 2)])
+    assert position_key(game, "oneplane")[0] != position_key(mirrored, "oneplane")[0]
+    assert position_key(game, "oneplane", canonicalize=True)[0] == position_key(mirrored, "oneplane", canonicalize=True)[0]
+
+    evaluate = Stones()
+    cache = EvaluationCache(canonicalize=True)
+    evaluate_with_cache(cache, encoder, evaluate, [game])
+    policy, values = evaluate_with_cache(cache, encoder, evaluate, [mirrored])
+    assert evaluate.positions == 1
+    assert cache.hits == 1
+    expected_policy, expected_values = Stones()(encoder.encode_batch([mirrored]))
+    assert np.array_equal(policy, expected_policy)
+    assert np.allclose(values, expected_values)
+
+
+def test_evaluates_only_misses():
+    encoder = get_encoder_by_name("oneplane", 5)
+    evaluate = Stones()
+    cache = EvaluationCache()
+    games = [play([(1, 1)]), play([(2, 2)])]
+    evaluate_with_cache(cache, encoder, evaluate, games)
+    policy, values = evaluate_with_cache(cache, encoder, evaluate, games + [play([(3, 3)])])
+    assert evaluate.positions == 3
+    assert policy.shape == (3, 26)
+    assert cache.stats()["entries"] == 3
+    assert cache.hit_rate == 2 / 5
+
+
+def test_lru_eviction_by_bytes():
+    cache = EvaluationCache(max_bytes=3 * (26 * 8 + 256))
+    games = [play([(1, col)]) for col in range(1, 5)]
+    for game in games[:3]:
+        key, transform = cache.key(game, "oneplane")
+        cache.put(key, transform, (5, 5), np.zeros(26), 0.0)
+    # Using the oldest entry keeps it when the fourth position pushes one out.
+    assert cache.get(*cache.key(games[0], "oneplane"), (5, 5)) is not None
+    key, transform = cache.key(games[3], "oneplane")
+    cache.put(key, transform, (5, 5), np.zeros(26), 0.0)
+    assert len(cache) == 3
+    assert cache.evictions == 1
+    assert cache.nbytes <= cache.max_bytes
+    assert cache.get(*cache.key(games[1], "oneplane"), (5, 5)) is None
+    assert cache.get(*cache.key(games[0], "oneplane"), (5, 5)) is not None
+    cache.clear()
+    assert len(cache) == 0 and cache.nbytes == 0
+
+
+def test_agent_reuses_evaluations():
+    encoder = get_encoder_by_name("oneplane", 5)
+    evaluate = Stones()
+    agent = PUCTAgent(None, encoder, num_rounds=40, batch_size=8, evaluate=evaluate, cache=EvaluationCache())
+    game = GameState.new_game(5)
+    first = agent.visit_counts(agent.search(game))
+    positions = evaluate.positions
+    second = agent.visit_counts(agent.search(game))
+    assert np.array_equal(first, second)
+    assert evaluate.positions == positions
@@ -0,0 +1,36 @@
+"""
+This file was initially generated using an AI language model (Claude 3.5 Sonnet),
+as part of an educational project based on the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+
+The generated code has been reviewed, potentially modified, and adapted to fit the
+project's requirements and to ensure correctness and adherence to the book's concepts.
+"""
+
+import pytest
+import torch
+
+from dlgo.nn.models import PolicyNet, PolicyValueNet, create_model
+
+
+def test_policy_net_shape():
+    model = PolicyNet(7, num_filters=8, num_layers=2)
+    assert model(torch.zeros(3, 7, 9, 9)).shape == (3, 81)
+    assert model(torch.zeros(1, 7, 5, 5)).shape == (1, 25)
+
+
+def test_create_model():
+    model = create_model("PolicyNet", num_planes=1, num_filters=4, num_layers=1)
+    assert model.config == {"num_planes": 1, "num_filters": 4, "num_layers": 1}
+    with pytest.raises(ValueError):
+        create_model("NoSuchNet")
+
+
+def test_policy_value_net_shape():
+    model = PolicyValueNet(7, num_filters=8, num_layers=2)
+    policy, value = model(torch.zeros(3, 7, 9, 9))
+    assert policy.shape == (3, 82)
+    assert value.shape == (3,)
+    assert (value.abs() <= 1).all()
+    policy, value = model(torch.zeros(1, 7, 5, 5))
+    assert policy.shape == (1, 26)
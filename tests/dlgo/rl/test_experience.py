@@ -0,0 +1,94 @@
+"""
+This file was initially generated using an AI language model (Claude 3.5 Sonnet),
+as part of an educational project based on the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+
+The generated code has been reviewed, potentially modified, and adapted to fit the
+project's requirements and to ensure correctness and adherence to the book's concepts.
+"""
+
+import numpy as np
+
+from dlgo.data.shards import ShardWriter, load_arrays
+from dlgo.encoders.base import get_encoder_by_name
+from dlgo.gamestate import GameState
+from dlgo.gotypes import Player, Point
+from dlgo.move import Move
+from dlgo.rl.experience import ExperienceCollector, decode_positions, experience_metadata, iter_experience_batches
+from misc.board_utils import create_board_from_ascii
+
+
+def record_game(collector, points, reward):
+    collector.begin_episode()
+    game = GameState.new_game(5)
+    for point in points:
+        collector.record_decision(game, 5 * (point.row - 1) + point.col - 1)
+        game = game.apply_move(Move.play(point))
+    collector.complete_episode(reward)
+
+
+def test_collector_episodes():
+    collector = ExperienceCollector()
+    record_game(collector, [Point(1, 1), Point(2, 2), Point(3, 3)], 1)
+    record_game(collector, [Point(5, 5)], -1)
+    first, second = collector.episodes
+    assert first["actions"].tolist() == [0, 6, 12]
+    assert first["rewards"].tolist() == [1, 1, 1]
+    assert first["move_number"].tolist() == [0, 1, 2]
+    assert first["next_player"].tolist() == [1, -1, 1]
+    assert first["stones"][2, 0, 0] == 1 and first["stones"][2, 1, 1] == -1
+    assert second["rewards"].tolist() == [-1]
+
+    # A game that ends before the agent's first move leaves no episode.
+    record_game(collector, [], 1)
+    assert len(collector.episodes) == 2
+
+
+def test_write_and_read_batches(tmp_path):
+    encoder = get_encoder_by_name("oneplane", 5)
+    collector = ExperienceCollector()
+    for i in range(4):
+        record_game(collector, [Point(1, i + 1), Point(2, i + 1)], 1 if i % 2 == 0 else -1)
+    directory = str(tmp_path / "experience")
+    with ShardWriter(directory, shard_size=3, metadata=experience_metadata(encoder)) as writer:
+        collector.write_to(writer)
+    assert collector.episodes == []
+
+    batches = list(iter_experience_batches(directory, encoder, batch_size=3, rng=np.random.default_rng(0)))
+    features = np.concatenate([batch[0] for batch in batches])
+    actions = np.concatenate([batch[1] for batch in batches])
+    rewards = np.concatenate([batch[2] for batch in batches])
+    assert features.shape == (8, 1, 5, 5) and features.dtype == np.float32
+    assert sorted(actions.tolist()) == [0, 1, 2, 3, 5, 6, 7, 8]
+    assert sorted(rewards.tolist()) == [-1] * 4 + [1] * 4
+    # The player to move sees their own stones as 1.
+    stored = load_arrays(directory)
+    assert np.array_equal(decode_positions(stored, encoder)[1, 0], -stored["stones"][1])
+
+
+def test_decode_with_other_encoders():
+    collector = ExperienceCollector()
+    record_game(collector, [Point(1, 1), Point(2, 2)], 1)
+    features = decode_positions(collector.episodes[0], get_encoder_by_name("sevenplane", 5))
+    assert features.shape == (2, 7, 5, 5)
+
+
+def test_decode_keeps_the_ko_point():
+    board = create_board_from_ascii(
+        """
+      A B C D
+    1 . B W .
+    2 B . B W
+    3 . B W .
+    4 . . . .
+    """
+    )
+    # White captures at B2, so black may not retake at C2 right away.
+    game = GameState(board, Player.white, None, None).apply_move(Move.play(Point(2, 2)))
+    collector = ExperienceCollector()
+    collector.record_decision(game, 0)
+    collector.complete_episode(1)
+    encoder = get_encoder_by_name("sevenplane", 4)
+    features = decode_positions(collector.episodes[0], encoder)
+    assert features[0, 6, 1, 2] == 1
+    assert np.array_equal(features[0], encoder.encode(game))
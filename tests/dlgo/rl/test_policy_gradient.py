@@ -0,0 +1,57 @@
+"""
+This file was initially generated using an AI language model (Claude 3.5 Sonnet),
+as part of an educational project based on the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+
+The generated code has been reviewed, potentially modified, and adapted to fit the
+project's requirements and to ensure correctness and adherence to the book's concepts.
+"""
+
+import numpy as np
+import torch
+
+from dlgo.agent.predict import DeepLearningAgent
+from dlgo.data.shards import load_arrays
+from dlgo.encoders.base import get_encoder_by_name
+from dlgo.nn.models import PolicyNet
+from dlgo.rl.policy_gradient import policy_gradient_loss, train_policy_gradient
+from dlgo.rl.self_play import generate_experience
+
+
+def make_agent(temperature=1.0):
+    torch.manual_seed(0)
+    encoder = get_encoder_by_name("oneplane", 5)
+    return DeepLearningAgent(PolicyNet(1, num_filters=4, num_layers=1), encoder, temperature=temperature)
+
+
+def test_policy_gradient_loss():
+    logits = torch.zeros(2, 4, requires_grad=True)
+    loss = policy_gradient_loss(logits, torch.tensor([1, 2]), torch.tensor([1.0, -1.0]))
+    assert torch.isclose(loss, torch.tensor(0.0))
+    loss.backward()
+    # The winning move's logit goes up, the losing move's down.
+    assert logits.grad[0, 1] < 0 and logits.grad[1, 2] > 0
+
+
+def test_training_follows_rewards(tmp_path):
+    agent = make_agent()
+    path = str(tmp_path / "agent.pt")
+    agent.serialize(path)
+    directory = str(tmp_path / "experience")
+    generate_experience(path, directory, 4, max_moves=20, seed=0)
+
+    arrays = load_arrays(directory)
+    winning = arrays["rewards"] > 0
+    features = torch.from_numpy(np.asarray(arrays["stones"][:, None] * arrays["next_player"][:, None, None, None], dtype=np.float32))
+    actions = torch.from_numpy(arrays["actions"].astype(np.int64))
+
+    def win_log_prob():
+        with torch.no_grad():
+            log_probs = torch.log_softmax(agent.model(features), dim=1)
+        return log_probs[torch.arange(len(actions)), actions][torch.from_numpy(winning)].mean()
+
+    before = win_log_prob()
+    losses = train_policy_gradient(agent, directory, learning_rate=0.05, batch_size=32, epochs=3)
+    assert len(losses) == 3
+    assert win_log_prob() > before
+    assert not agent.model.training
@@ -0,0 +1,51 @@
+"""
+This file was initially generated using an AI language model (Claude 3.5 Sonnet),
+as part of an educational project based on the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+
+The generated code has been reviewed, potentially modified, and adapted to fit the
+project's requirements and to ensure correctness and adherence to the book's concepts.
+"""
+
+import numpy as np
+import torch
+
+from dlgo.agent.predict import DeepLearningAgent
+from dlgo.agent.random_bot import RandomBot
+from dlgo.data.shards import load_arrays, read_manifest
+from dlgo.encoders.base import get_encoder_by_name
+from dlgo.gotypes import Player
+from dlgo.nn.models import PolicyNet
+from dlgo.rl.self_play import generate_experience, play_game, self_play_episodes
+
+
+def make_agent(temperature=1.0):
+    torch.manual_seed(0)
+    encoder = get_encoder_by_name("oneplane", 5)
+    return DeepLearningAgent(PolicyNet(1, num_filters=4, num_layers=1), encoder, temperature=temperature)
+
+
+def test_play_game_with_move_limit():
+    winner = play_game({Player.black: RandomBot(), Player.white: RandomBot()}, 5, max_moves=10)
+    assert winner in (Player.black, Player.white)
+
+
+def test_self_play_rewards_both_sides():
+    np.random.seed(0)
+    black, white = self_play_episodes(make_agent(), 5, max_moves=30)
+    assert {black["rewards"][0], white["rewards"][0]} == {1, -1}
+    assert (black["next_player"] == 1).all() and (white["next_player"] == -1).all()
+
+
+def test_generate_experience_is_independent_of_workers(tmp_path):
+    path = str(tmp_path / "agent.pt")
+    make_agent().serialize(path)
+    single = str(tmp_path / "single")
+    pooled = str(tmp_path / "pooled")
+    num_positions = generate_experience(path, single, 4, max_moves=20, seed=3, shard_size=16)
+    assert generate_experience(path, pooled, 4, max_moves=20, workers=2, seed=3, shard_size=16) == num_positions
+    assert read_manifest(single)["num_games"] == 8
+    assert read_manifest(single)["metadata"]["labels"] == "action"
+    first, second = load_arrays(single), load_arrays(pooled)
+    for name in ("stones", "actions", "rewards"):
+        assert np.array_equal(first[name], second[name])
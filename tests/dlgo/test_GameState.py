@@ -7,6 +7,9 @@ The generated code has been reviewed, potentially modified, and adapted to fit t
 project's requirements and to ensure correctness and adherence to the book's concepts.
 """
 
+import gc
+import weakref
+
 import pytest
 
 from dlgo.board import Board
@@ -393,3 +396,83 @@ def test_move_types():
     assert play_moves == 25  # 5x5 board
     assert pass_moves == 1
     assert resign_moves == 1
+
+
+def play(game, moves):
+    for move in moves:
+        game = game.apply_move(move)
+    return game
+
+
+def test_bounded_history_keeps_only_recent_states():
+    moves = [Move.play(Point(1, 1)), Move.play(Point(2, 2)), Move.play(Point(3, 3)), Move.play(Point(4, 4))]
+    game = play(GameState.new_game(5, max_history=2), moves)
+    assert game.max_history == 2
+    assert game.previous_state.previous_state is not None
+    assert game.previous_state.previous_state.previous_state is None
+    assert game.history_truncated
+    assert not play(GameState.new_game(5), moves).history_truncated
+
+
+def history_length(game):
+    length = 0
+    while game.previous_state is not None:
+        game = game.previous_state
+        length += 1
+    return length
+
+
+def test_bounded_history_leaves_existing_states_alone():
+    moves = [Move.play(Point(1, 1)), Move.play(Point(2, 2)), Move.play(Point(3, 3))]
+    game = play(GameState.new_game(5, max_history=2), moves)
+    parent = game.previous_state
+    children = [game.apply_move(Move.play(Point(4, col))) for col in range(1, 4)]
+    assert history_length(game) == 2
+    assert game.previous_state is parent
+    assert all(history_length(child) == 2 and child.previous_state.board is game.board for child in children)
+
+    first = GameState.new_game(5, max_history=0).apply_move(Move.play(Point(1, 1)))
+    first.apply_move(Move.play(Point(2, 2)))
+    assert first.previous_state is None and first.move_history() == [Move.play(Point(1, 1))]
+
+
+def test_bounded_history_releases_old_boards():
+    first = GameState.new_game(5, max_history=0).apply_move(Move.play(Point(1, 1)))
+    first_board = weakref.ref(first.board)
+    game = play(first, [Move.play(Point(2, 2)), Move.play(Point(3, 3))])
+    del first
+    gc.collect()
+    assert game.previous_state is None
+    assert first_board() is None
+
+
+def test_bounded_history_still_ends_game_and_detects_ko():
+    game = play(GameState.new_game(5, max_history=0), [Move.play(Point(3, 3)), Move.pass_turn()])
+    assert not game.is_over()
+    assert game.apply_move(Move.pass_turn()).is_over()
+
+    board = create_board_from_ascii(
+        """
+      A B C D
+    1 . B W .
+    2 B . B W
+    3 . B W .
+    4 . . . .
+    """
+    )
+    game = GameState(board, Player.white, None, None, max_history=0).apply_move(Move.play(Point(2, 2)))
+    assert game.previous_state is None
+    assert not game.is_valid_move(Move.play(Point(2, 3)))
+
+
+def test_move_history_and_replay_with_bounded_history():
+    moves = [Move.play(Point(1, 1)), Move.pass_turn(), Move.play(Point(2, 2)), Move.play(Point(3, 3))]
+    game = play(GameState.new_game(5, max_history=0), moves)
+    assert game.move_history() == moves
+
+    states = list(game.replay())
+    assert len(states) == len(moves) + 1
+    assert states[0].board == GameState.new_game(5).board
+    assert states[-1].board == game.board
+    assert states[-1].next_player == game.next_player
+    assert states[-1].previous_state is states[-2]
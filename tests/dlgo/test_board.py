@@ -7,6 +7,8 @@ The generated code has been reviewed, potentially modified, and adapted to fit t
 project's requirements and to ensure correctness and adherence to the book's concepts.
 """
 
+import copy
+
 import pytest
 
 from dlgo.board import Board
@@ -286,3 +288,36 @@ def test_fail_to_self_capture_in_bottom_right_corner():
     print(f"board: {type(board)}")
     # print(board_after_capture.__hash__())
     assert board == board_after_capture, "Boards should be equal after the same capture occurs"
+
+
+def test_stone_array_tracks_placements_and_captures():
+    ascii_board = """
+      A B C D E
+    1 . W W . .
+    2 W B B W .
+    3 . W W . .
+    4 . . . . .
+    5 . . . . B
+    """
+    board = create_board_from_ascii(ascii_board)
+    stones = board.stone_array()
+
+    assert stones.shape == (5, 5)
+    assert stones[1, 1] == 0 and stones[1, 2] == 0  # Captured black stones
+    assert stones[0, 1] == -1 and stones[1, 0] == -1
+    assert stones[4, 4] == 1
+    assert int((stones == -1).sum()) == 6
+    assert int((stones == 1).sum()) == 1
+
+
+def test_stone_array_is_read_only_and_copied():
+    board = Board(5, 5)
+    board.place_stone(Player.black, Point(3, 3))
+    copied = copy.deepcopy(board)
+    copied.place_stone(Player.white, Point(1, 1))
+
+    with pytest.raises(ValueError):
+        board.stone_array()[0, 0] = 1
+    assert board.stone_array()[0, 0] == 0
+    assert copied.stone_array()[0, 0] == -1
+    assert copied.stone_array()[2, 2] == 1
@@ -0,0 +1,112 @@
+"""
+This file was initially generated using an AI language model (Claude 3.5 Sonnet),
+as part of an educational project based on the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+
+The generated code has been reviewed, potentially modified, and adapted to fit the
+project's requirements and to ensure correctness and adherence to the book's concepts.
+"""
+
+from dlgo.agent.base import Agent
+from dlgo.agent.human import HumanAgent
+from dlgo.agent.random_bot import RandomBot
+from dlgo.driver import ConsoleRenderer, GameObserver, GameRecorder, MoveTimer, run_game
+from dlgo.gotypes import Player, Point
+from dlgo.move import Move
+from dlgo.sgf import parse_game
+
+
+class Scripted(Agent):
+    def __init__(self, moves):
+        Agent.__init__(self)
+        self.moves = list(moves)
+
+    def select_move(self, game_state):
+        return self.moves.pop(0)
+
+
+class EventLog(GameObserver):
+    def __init__(self):
+        self.events = []
+
+    def on_game_start(self, game_state):
+        self.events.append("start")
+
+    def on_move(self, game_state, move, seconds):
+        self.events.append((game_state.next_player, str(move)))
+
+    def on_game_end(self, outcome):
+        self.events.append(("end", outcome.result))
+
+
+def scripted_players():
+    black = Scripted([Move.play(Point(1, 1)), Move.pass_turn()])
+    white = Scripted([Move.play(Point(2, 2)), Move.pass_turn()])
+    return {Player.black: black, Player.white: white}
+
+
+def test_observers_see_every_move():
+    log = EventLog()
+    outcome = run_game(scripted_players(), 3, [log])
+    assert outcome.num_moves == 4
+    assert outcome.winner == Player.white
+    assert outcome.result == "W+7.5"
+    assert outcome.margin == 7.5
+    assert log.events == [
+        "start",
+        (Player.black, "(r 1, c 1)"),
+        (Player.white, "(r 2, c 2)"),
+        (Player.black, "pass"),
+        (Player.white, "pass"),
+        ("end", "W+7.5"),
+    ]
+
+
+def test_resignation_and_move_limit():
+    players = {Player.black: Scripted([Move.resign()]), Player.white: RandomBot()}
+    outcome = run_game(players, 5)
+    assert (outcome.winner, outcome.result, outcome.margin) == (Player.white, "W+R", None)
+
+    outcome = run_game({Player.black: RandomBot(), Player.white: RandomBot()}, 5, max_moves=7)
+    assert outcome.num_moves == 7
+    # Headless games keep no earlier states by default.
+    assert outcome.game_state.previous_state is None
+
+
+def test_recorder_writes_sgf():
+    recorder = GameRecorder()
+    run_game(scripted_players(), 3, [recorder])
+    game = parse_game(recorder.to_sgf_game().to_sgf())
+    assert game.board_size == 3
+    assert game.result == "W+7.5"
+    assert [move for _, move in game.moves] == [Move.play(Point(1, 1)), Move.play(Point(2, 2)), Move.pass_turn(), Move.pass_turn()]
+
+
+def test_move_timer():
+    timer = MoveTimer()
+    run_game(scripted_players(), 3, [timer])
+    assert len(timer.move_times[Player.black]) == 2
+    assert all(seconds >= 0 for seconds in timer.move_times[Player.white])
+
+
+def test_console_renderer(capsys):
+    run_game(scripted_players(), 3, [ConsoleRenderer(clear_screen=False)])
+    output = capsys.readouterr().out
+    assert "Player.black A1" in output
+    assert "Game over after 4 moves: W+7.5" in output
+
+
+def test_console_renderer_shows_the_reply_before_asking_the_human(capsys):
+    screens = []
+
+    def answer(prompt):
+        screens.append(capsys.readouterr().out)
+        return ["A1", "pass"][len(screens) - 1]
+
+    players = {Player.black: HumanAgent(input_fn=answer), Player.white: Scripted([Move.play(Point(3, 3)), Move.pass_turn()])}
+    run_game(players, 5, [ConsoleRenderer(clear_screen=False)])
+    # Before the second prompt, the bot's reply C3 is printed, then the board holding it next to the human's A1.
+    rows = screens[1].split("Player.white C3")[1].splitlines()
+    board = [row for row in rows if row[:2].strip().isdigit()]
+    assert board[2] == " 3  .  .  W  .  . "
+    assert board[4] == " 1  B  .  .  .  . "
@@ -0,0 +1,118 @@
+"""
+This file was initially generated using an AI language model (Claude 3.5 Sonnet),
+as part of an educational project based on the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+
+The generated code has been reviewed, potentially modified, and adapted to fit the
+project's requirements and to ensure correctness and adherence to the book's concepts.
+"""
+
+import io
+
+import pytest
+
+from dlgo.agent.base import Agent
+from dlgo.agent.mcts_agent import MCTSAgent
+from dlgo.gotypes import Player, Point
+from dlgo.gtp import GTPEngine, format_vertex, parse_vertex
+from dlgo.move import Move
+
+
+class Scripted(Agent):
+    """Plays the given moves and remembers its time budgets."""
+
+    def __init__(self, moves):
+        Agent.__init__(self)
+        self.moves = list(moves)
+        self.budgets = []
+
+    def set_time_budget(self, seconds):
+        self.budgets.append(seconds)
+
+    def select_move(self, game_state):
+        return self.moves.pop(0)
+
+
+def test_vertices():
+    assert parse_vertex("j9", 9) == Move.play(Point(9, 9))
+    assert parse_vertex("PASS", 9) == Move.pass_turn()
+    assert format_vertex(Move.play(Point(3, 8))) == "H3"
+    assert format_vertex(Move.resign()) == "resign"
+    for text in ("I3", "A10", "3A", "K"):
+        with pytest.raises(Exception):
+            parse_vertex(text, 9)
+
+
+def test_protocol():
+    engine = GTPEngine(Scripted([]), 9)
+    assert engine.handle("protocol_version") == "= 2\n\n"
+    assert engine.handle("7 name") == "=7 dlgo\n\n"
+    assert engine.handle("known_command genmove") == "= true\n\n"
+    assert engine.handle("known_command kgs-chat") == "= false\n\n"
+    assert engine.handle("# just a comment") is None
+    assert engine.handle("3 frobnicate") == "?3 unknown command\n\n"
+    assert engine.handle("boardsize") == "? wrong number of arguments\n\n"
+    assert engine.handle("boardsize 42") == "? unacceptable size\n\n"
+    assert "genmove" in engine.handle("list_commands").split()
+
+
+def test_play_genmove_and_undo():
+    agent = Scripted([Move.play(Point(4, 4))])
+    engine = GTPEngine(agent, 19)
+    assert engine.handle("boardsize 5") == "=\n\n"
+    assert engine.handle("play black c3") == "=\n\n"
+    assert engine.handle("play white c3") == "? illegal move\n\n"
+    assert engine.handle("genmove w") == "= D4\n\n"
+    assert engine.game_state.board.get_go_string_color(Point(3, 3)) == Player.black
+    assert engine.handle("undo") == "=\n\n"
+    assert engine.handle("undo") == "=\n\n"
+    assert engine.handle("undo") == "? cannot undo\n\n"
+
+
+def test_consecutive_moves_of_one_color():
+    engine = GTPEngine(Scripted([]), 5)
+    engine.handle("play b a1")
+    engine.handle("play b b2")
+    assert engine.game_state.board.get_go_string_color(Point(2, 2)) == Player.black
+    assert engine.game_state.next_player == Player.white
+    # Undoing the second move keeps white's inserted pass, so black is to play again.
+    engine.handle("undo")
+    assert engine.game_state.next_player == Player.black
+
+
+def test_time_budgets():
+    agent = Scripted([Move.pass_turn()] * 4)
+    engine = GTPEngine(agent, 5)
+    engine.handle("genmove b")
+    engine.handle("time_settings 300 30 5")
+    engine.handle("genmove w")
+    engine.handle("time_left b 100 0")
+    engine.handle("genmove b")
+    engine.handle("time_left w 20 4")
+    engine.handle("genmove w")
+    assert agent.budgets == pytest.approx([None, 15.0, 5.0, 4.0])
+    # Early in the game, a move may use its part of a byo-yomi period if that is more than its part of main time.
+    engine.handle("time_left b 60 0")
+    assert engine.time_budget(Player.black) == pytest.approx(4.8)
+    engine.handle("time_settings 0 1 0")
+    assert engine.time_budget(Player.black) is None
+
+
+def test_final_score_uses_komi():
+    engine = GTPEngine(Scripted([]), 5)
+    engine.handle("play b c3")
+    assert engine.handle("final_score") == "= B+17.5\n\n"
+    engine.handle("komi 25.5")
+    assert engine.handle("final_score") == "= W+0.5\n\n"
+
+
+def test_run_keeps_the_search_tree():
+    agent = MCTSAgent(20, 1.0)
+    engine = GTPEngine(agent, 5)
+    assert agent.reuse_tree
+    out = io.StringIO()
+    engine.run(io.StringIO("genmove b\nplay w a1\ngenmove b\nquit\nname\n"), out)
+    responses = out.getvalue().split("\n\n")
+    assert len(responses) == 5
+    assert responses[-1] == ""
+    assert responses[-2] == "="
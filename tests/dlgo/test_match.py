@@ -0,0 +1,84 @@
+"""
+This file was initially generated using an AI language model (Claude 3.5 Sonnet),
+as part of an educational project based on the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+
+The generated code has been reviewed, potentially modified, and adapted to fit the
+project's requirements and to ensure correctness and adherence to the book's concepts.
+"""
+
+import functools
+import json
+import math
+
+from dlgo.agent.base import Agent
+from dlgo.agent.mcts_agent import MCTSAgent
+from dlgo.agent.random_bot import RandomBot
+from dlgo.gotypes import Player
+from dlgo.match import MatchGame, MatchResult, elo_difference, play_match, play_timed_game, wilson_interval
+from dlgo.move import Move
+
+
+class Resigner(Agent):
+    def select_move(self, game_state):
+        return Move.resign()
+
+
+def test_wilson_interval():
+    low, high = wilson_interval(50, 100)
+    assert math.isclose(low, 0.4038, abs_tol=1e-4)
+    assert math.isclose(high, 0.5962, abs_tol=1e-4)
+    assert wilson_interval(0, 10)[0] == 0.0
+    assert wilson_interval(10, 10)[1] == 1.0
+    assert wilson_interval(0, 0) == (0.0, 1.0)
+
+
+def test_elo_difference():
+    assert elo_difference(0.5) == 0
+    assert math.isclose(elo_difference(10 / 11), 400)
+    assert math.isclose(elo_difference(1 / 11), -400)
+    assert elo_difference(1.0) == math.inf
+    assert elo_difference(0.0) == -math.inf
+
+
+def test_play_timed_game():
+    agents = {Player.black: RandomBot(), Player.white: Resigner()}
+    winner, num_moves, margin, move_times = play_timed_game(agents, 5)
+    assert winner == Player.black
+    assert num_moves == 2
+    assert margin is None
+    assert len(move_times[Player.black]) == 1 and len(move_times[Player.white]) == 1
+
+    winner, num_moves, margin, _ = play_timed_game({Player.black: RandomBot(), Player.white: RandomBot()}, 5, max_moves=6)
+    assert num_moves == 6
+    assert margin is not None
+
+
+def test_match_alternates_colors():
+    result = play_match(RandomBot, Resigner, 6, board_size=5, seed=0, names=("random", "resigner"))
+    assert [game.black for game in result.games] == [0, 1, 0, 1, 0, 1]
+    assert result.wins(0) == 6
+    assert result.wins_as_black(0) == 3
+    assert result.win_rate() == 1.0
+    assert result.elo()[0] == math.inf
+    data = result.to_dict()
+    assert data["elo"] is None
+    json.dumps(data, allow_nan=False)
+    assert "random vs resigner: 6-0 in 6 games" in result.summary()
+
+
+def test_match_is_independent_of_workers():
+    strong = functools.partial(MCTSAgent, 10, 0.8)
+    single = play_match(RandomBot, strong, 4, board_size=5, max_moves=30, seed=7)
+    pooled = play_match(RandomBot, strong, 4, board_size=5, max_moves=30, workers=2, seed=7)
+    assert [(game.winner, game.num_moves, game.margin) for game in single.games] == [
+        (game.winner, game.num_moves, game.margin) for game in pooled.games
+    ]
+    stats = pooled.move_time_stats(1)
+    assert stats["moves"] == sum(len(game.move_times[1]) for game in pooled.games)
+    assert 0 < stats["median"] <= stats["p95"] <= stats["max"]
+
+
+def test_move_time_stats_without_moves():
+    result = MatchResult([MatchGame(0, 0, 0, 0, None, ([], []))])
+    assert result.move_time_stats(1) == {"moves": 0}
@@ -0,0 +1,77 @@
+"""
+This file was initially generated using an AI language model (Claude 3.5 Sonnet),
+as part of an educational project based on the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+
+The generated code has been reviewed, potentially modified, and adapted to fit the
+project's requirements and to ensure correctness and adherence to the book's concepts.
+"""
+
+import io
+import random
+import time
+
+from dlgo import board, encoders
+from dlgo.agent import mcts_agent
+from dlgo.gamestate import GameState
+from dlgo.profiling import OUTSIDE_DLGO, SamplingProfiler, frame_label, module_name, profile_to
+
+
+def busy(seconds):
+    game = GameState.new_game(9)
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        game.legal_moves()
+
+
+def test_module_name():
+    assert module_name(board.__file__) == "dlgo.board"
+    assert module_name(mcts_agent.__file__) == "dlgo.agent.mcts_agent"
+    assert module_name(encoders.__file__) == "dlgo.encoders"
+    assert module_name(random.__file__) is None
+    assert module_name(__file__) is None
+
+
+def test_frame_label():
+    assert frame_label(GameState.legal_moves.__code__) == "dlgo.gamestate:GameState.legal_moves"
+    assert frame_label(busy.__code__) == "test_profiling.py:busy"
+
+
+def test_sampling_profiler_attributes_time_to_modules():
+    with SamplingProfiler(interval=0.001) as profiler:
+        busy(0.3)
+    assert profiler.num_samples > 10
+    assert profiler.seconds >= 0.3
+
+    modules = profiler.module_samples()
+    assert sum(modules.values()) == profiler.num_samples
+    assert set(modules) <= {"dlgo.gamestate", "dlgo.board", "dlgo.move", "dlgo.gotypes", "dlgo.gostring", "dlgo.profiling", OUTSIDE_DLGO}
+    assert modules["dlgo.gamestate"] + modules["dlgo.board"] > 0
+
+    own, total = profiler.function_samples()
+    assert sum(own.values()) == profiler.num_samples
+    # Besides the odd sample of new_game or of the profiler starting, the dlgo code only runs within legal_moves.
+    assert total["dlgo.gamestate:GameState.legal_moves"] == max(count for label, count in total.items() if label.startswith("dlgo."))
+
+    lines = profiler.collapsed()
+    assert sum(int(line.rsplit(" ", 1)[1]) for line in lines) == profiler.num_samples
+    assert all("test_profiling.py:busy;dlgo.gamestate:GameState.legal_moves" in line for line in lines if "legal_moves" in line)
+
+    summary = profiler.summary(top=5)
+    assert "dlgo.gamestate" in summary
+    assert f"{profiler.num_samples} samples" in summary
+
+
+def test_profile_to(tmp_path):
+    path = tmp_path / "profile.collapsed"
+    report = io.StringIO()
+    with profile_to(str(path), top=3, file=report) as profiler:
+        busy(0.1)
+    assert profiler.num_samples > 0
+    assert len(path.read_text().splitlines()) == len(profiler.collapsed())
+    assert "module" in report.getvalue()
+
+    with profile_to(None) as profiler:
+        pass
+    assert profiler is None
+    assert SamplingProfiler().summary() == "No samples recorded."
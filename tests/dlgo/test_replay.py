@@ -0,0 +1,63 @@
+"""
+This file was initially generated using an AI language model (Claude 3.5 Sonnet),
+as part of an educational project based on the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+
+The generated code has been reviewed, potentially modified, and adapted to fit the
+project's requirements and to ensure correctness and adherence to the book's concepts.
+"""
+
+import random
+
+from dlgo.agent.random_bot import RandomBot
+from dlgo.encoders.base import get_encoder_by_name
+from dlgo.gamestate import GameState
+from dlgo.gotypes import Player, Point
+from dlgo.move import Move
+from dlgo.replay import alternate, replay_moves
+from misc.board_utils import create_board_from_ascii
+
+
+def test_replay_matches_apply_move():
+    random.seed(7)
+    bot = RandomBot()
+    game = GameState.new_game(7)
+    states, moves = [], []
+    while not game.is_over() and len(moves) < 80:
+        move = bot.select_move(game)
+        states.append(game)
+        moves.append(move)
+        game = game.apply_move(move)
+
+    encoder = get_encoder_by_name("sevenplane", 7)
+    board = None
+    for i, (fast_state, move) in enumerate(replay_moves(alternate(moves), 7)):
+        assert fast_state.next_player == states[i].next_player
+        assert fast_state.board == states[i].board
+        assert fast_state.previous_state is None
+        assert fast_state.move_number == states[i].move_number == i
+        assert (encoder.encode(fast_state) == encoder.encode(states[i])).all()
+        assert move == moves[i]
+        # All positions share one board.
+        assert board is None or fast_state.board is board
+        board = fast_state.board
+    assert board == game.board
+
+
+def test_replay_detects_simple_ko():
+    board = create_board_from_ascii(
+        """
+      A B C D
+    1 . B W .
+    2 B . B W
+    3 . B W .
+    4 . . . .
+    """
+    )
+    moves = [(Player.white, Move.play(Point(2, 2))), (Player.black, Move.play(Point(4, 4)))]
+    replay = replay_moves(moves, board=board)
+    next(replay)
+    after_capture, _ = next(replay)
+    assert after_capture.next_player == Player.black
+    assert after_capture.does_move_violate_ko(Player.black, Move.play(Point(2, 3)))
+    assert not after_capture.does_move_violate_ko(Player.black, Move.play(Point(4, 4)))
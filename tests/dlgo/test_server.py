@@ -0,0 +1,231 @@
+"""
+This file was initially generated using an AI language model (Claude 3.5 Sonnet),
+as part of an educational project based on the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+
+The generated code has been reviewed, potentially modified, and adapted to fit the
+project's requirements and to ensure correctness and adherence to the book's concepts.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from dlgo.agent.base import Agent
+from dlgo.move import Move
+from dlgo.server import GameClient, GameServer, HTTPError
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+async def start_server(**kwargs):
+    server = GameServer(**kwargs)
+    await server.start("127.0.0.1", 0)
+    return server, GameClient("127.0.0.1", server.port)
+
+
+class BlockingAgent(Agent):
+    """Passes once released, to check the event loop keeps serving while an agent thinks."""
+
+    def __init__(self):
+        Agent.__init__(self)
+        self.release = threading.Event()
+
+    def select_move(self, game_state):
+        self.release.wait(5)
+        return Move.pass_turn()
+
+
+def test_human_move_gets_a_reply():
+    async def scenario():
+        server, client = await start_server()
+        try:
+            game = await client.create_game(board_size=5, agent="random", human="black")
+            assert game["next_player"] == "black"
+            assert game["board"] == ["....."] * 5
+            await client.play(game["id"], "C3")
+            states = client.events(game["id"])
+            async for state in states:
+                if state["next_player"] == "black":
+                    break
+            await states.aclose()
+            assert state["board"][2][2] == "X"
+            assert state["moves"] == 2
+        finally:
+            await server.close()
+
+    run(scenario())
+
+
+def test_bot_game_streams_every_move_until_the_end():
+    async def scenario():
+        server, client = await start_server()
+        try:
+            game = await client.create_game(board_size=3, human=None)
+            states = [state async for state in client.events(game["id"])]
+            assert states[-1]["over"]
+            assert states[-1]["result"] is not None
+            moves = [state["moves"] for state in states]
+            assert moves == sorted(moves)
+            assert moves[-1] == (await client.state(game["id"]))["moves"]
+        finally:
+            await server.close()
+
+    run(scenario())
+
+
+def test_many_concurrent_sessions():
+    async def scenario():
+        server, client = await start_server(workers=4)
+        try:
+            games = await asyncio.gather(*(client.create_game(board_size=3, human=None) for _ in range(8)))
+            assert len({game["id"] for game in games}) == 8
+
+            async def final_state(game_id):
+                async for state in client.events(game_id):
+                    pass
+                return state
+
+            finals = await asyncio.gather(*(final_state(game["id"]) for game in games))
+            assert all(state["over"] for state in finals)
+            status, listing = await client.request("GET", "/games")
+            assert status == 200
+            assert sorted(listing["games"]) == sorted(game["id"] for game in games)
+        finally:
+            await server.close()
+
+    run(scenario())
+
+
+def test_event_loop_is_not_blocked_by_a_search(monkeypatch):
+    agent = BlockingAgent()
+    monkeypatch.setattr("dlgo.server.agent_factory", lambda spec: lambda: agent)
+
+    async def scenario():
+        server, client = await start_server(agents={"slow": "slow"})
+        try:
+            game = await client.create_game(board_size=5, agent="slow", human="white")
+            # The agent is still thinking about black's first move, yet requests are answered.
+            state = await asyncio.wait_for(client.state(game["id"]), timeout=2)
+            assert state["thinking"]
+            assert state["moves"] == 0
+            with pytest.raises(HTTPError) as error:
+                await client.play(game["id"], "C3")
+            assert error.value.status == 409
+            agent.release.set()
+            async for state in client.events(game["id"]):
+                if state["next_player"] == "white":
+                    break
+            assert state["last_move"] == "pass"
+        finally:
+            agent.release.set()
+            await server.close()
+
+    run(scenario())
+
+
+def test_errors():
+    async def scenario():
+        server, client = await start_server()
+        try:
+            assert (await client.request("GET", "/games/42"))[0] == 404
+            assert (await client.request("GET", "/nowhere"))[0] == 404
+            assert (await client.request("PUT", "/games"))[0] == 405
+            assert (await client.request("POST", "/games", {"agent": "alphago"}))[0] == 400
+            assert (await client.request("POST", "/games", {"board_size": 1}))[0] == 400
+            assert (await client.request("POST", "/games", [1, 2]))[0] == 400
+            game = await client.create_game(board_size=5)
+            status, body = await client.request("POST", f"/games/{game['id']}/moves", {"move": "Z9"})
+            assert status == 400
+            assert "Z9" in body["error"]
+        finally:
+            await server.close()
+
+    run(scenario())
+
+
+def test_resign_and_delete():
+    async def scenario():
+        server, client = await start_server()
+        try:
+            game = await client.create_game(board_size=5, human="black")
+            state = await client.play(game["id"], "resign")
+            assert state["over"]
+            assert state["result"] == "W+R"
+            with pytest.raises(HTTPError) as error:
+                await client.play(game["id"], "pass")
+            assert error.value.status == 409
+            assert (await client.delete(game["id"]))["deleted"]
+            assert (await client.request("GET", f"/games/{game['id']}"))[0] == 404
+        finally:
+            await server.close()
+
+    run(scenario())
+
+
+def test_max_sessions():
+    async def scenario():
+        server, client = await start_server(max_sessions=1)
+        try:
+            await client.create_game(board_size=5)
+            assert (await client.request("POST", "/games", {"board_size": 5}))[0] == 503
+        finally:
+            await server.close()
+
+    run(scenario())
+
+
+def test_finished_and_idle_games_free_their_slots():
+    async def scenario():
+        server, client = await start_server(max_sessions=2, finished_ttl=0)
+        try:
+            finished = await client.create_game(board_size=5)
+            await client.play(finished["id"], "resign")
+            idle = await client.create_game(board_size=5)
+            # The finished game makes room for a new one.
+            replacement = await client.create_game(board_size=5)
+            games = (await client.request("GET", "/games"))[1]["games"]
+            assert games == [idle["id"], replacement["id"]]
+            assert (await client.request("POST", "/games", {"board_size": 5}))[0] == 503
+
+            # Between the idle timeouts of the two games.
+            last_active = (server.sessions[idle["id"]].last_active + server.sessions[replacement["id"]].last_active) / 2
+            assert server.expire_sessions(now=last_active + server.idle_timeout) == [idle["id"]]
+            assert list(server.sessions) == [replacement["id"]]
+        finally:
+            await server.close()
+
+    run(scenario())
+
+
+def test_agents_in_worker_processes():
+    async def scenario():
+        server, client = await start_server(workers=1, use_processes=True)
+        try:
+            game = await client.create_game(board_size=3, human=None)
+            async for state in client.events(game["id"]):
+                pass
+            assert state["over"]
+            assert state["error"] is None
+        finally:
+            await server.close()
+
+    run(scenario())
+
+
+def test_metrics_endpoint():
+    async def scenario():
+        server, client = await start_server(agents={"mcts": "mcts:10"})
+        try:
+            game = await client.create_game(board_size=3, agent="mcts", human=None)
+            async for state in client.events(game["id"]):
+                pass
+            body = await client.metrics()
+        finally:
+            await server.close()
+        assert f'dlgo_search_searches_total{{agent="MCTSAgent"}} {state["moves"]}' in body
+
+    run(scenario())
@@ -0,0 +1,139 @@
+"""
+This file was initially generated using an AI language model (Claude 3.5 Sonnet),
+as part of an educational project based on the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+
+The generated code has been reviewed, potentially modified, and adapted to fit the
+project's requirements and to ensure correctness and adherence to the book's concepts.
+"""
+
+import io
+import tarfile
+import zipfile
+
+import pytest
+
+from dlgo.gamestate import GameState
+from dlgo.gotypes import Player, Point
+from dlgo.move import Move
+from dlgo.sgf import SgfError, SgfGame, iter_game_texts, iter_games, parse_game, write_sgf
+
+GAME = r"""(;FF[4]GM[1]SZ[9]KM[6.5]PB[Black \\ player]PW[White]RE[W+2.5]C[A comment with (parentheses) and \] bracket]
+;B[ee];W[cc]
+;B[dg]C[Variations follow](;W[];B[tt])(;W[gc]))"""
+
+
+def test_parse_game():
+    game = parse_game(GAME)
+    assert game.board_size == 9
+    assert game.komi == 6.5
+    assert game.handicap == 0
+    assert game.result == "W+2.5"
+    assert game.winner == Player.white
+    assert game.properties["PB"] == "Black \\ player"
+    assert game.properties["C"] == "A comment with (parentheses) and ] bracket"
+    # Only the main line is read; SGF rows count from the top.
+    assert game.moves == [
+        (Player.black, Move.play(Point(5, 5))),
+        (Player.white, Move.play(Point(7, 3))),
+        (Player.black, Move.play(Point(3, 4))),
+        (Player.white, Move.pass_turn()),
+        (Player.black, Move.pass_turn()),
+    ]
+
+
+def test_parse_handicap_setup():
+    game = parse_game("(;SZ[9]HA[2]AB[cc][gg]AW[aa:ab];W[ee])")
+    assert game.handicap == 2
+    assert sorted(game.setup, key=lambda stone: (stone[0].value, stone[1])) == [
+        (Player.black, Point(3, 7)),
+        (Player.black, Point(7, 3)),
+        (Player.white, Point(8, 1)),
+        (Player.white, Point(9, 1)),
+    ]
+    state = game.initial_state()
+    assert state.next_player == Player.white
+    assert state.board.get_go_string_color(Point(7, 3)) == Player.black
+
+
+@pytest.mark.parametrize("text", ["(;SZ[9];B[zz])", "(;GM[2];B[aa])", "(;SZ[abc])", "no game here"])
+def test_parse_errors(text):
+    with pytest.raises(SgfError):
+        parse_game(text)
+
+
+def test_replay_matches_applying_moves():
+    game = parse_game(GAME)
+    state = GameState.new_game(9)
+    for replayed, move in game.replay():
+        assert replayed.next_player == state.next_player
+        assert replayed.board == state.board
+        state = state.apply_move(move)
+    assert game.final_state().board == state.board
+    assert game.final_state().is_over()
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_replay_rejects_occupied_point(trusted, capsys):
+    game = parse_game("(;SZ[9];B[ee];W[ee])")
+    with pytest.raises(SgfError):
+        list(game.replay(trusted=trusted))
+    assert capsys.readouterr().out == ""
+
+
+def test_trusted_replay_rejects_self_capture():
+    game = parse_game("(;SZ[5];B[ba];W[dd];B[ab];W[aa])")
+    with pytest.raises(SgfError, match="own stones"):
+        list(game.replay(trusted=True))
+
+
+def test_collection_split_across_chunks():
+    text = "header text\n" + GAME + "\n" + "(;SZ[9]C[long \\] value (with parens)];B[aa])" * 3
+    texts = list(iter_game_texts(io.StringIO(text), chunk_size=7))
+    assert len(texts) == 4
+    assert texts[0] == GAME
+    assert [parse_game(t).moves[0][1] for t in texts[1:]] == [Move.play(Point(9, 1))] * 3
+
+
+def test_truncated_collection():
+    with pytest.raises(SgfError):
+        list(iter_game_texts(io.StringIO("(;SZ[9];B[aa]")))
+
+
+def test_write_and_read_self_play_game(tmp_path):
+    state = GameState.new_game(9)
+    for move in [Move.play(Point(3, 3)), Move.play(Point(5, 5)), Move.pass_turn(), Move.resign()]:
+        state = state.apply_move(move)
+    record = SgfGame.from_game_state(state, komi=7.5, properties={"PB": "mcts"})
+    assert record.result == "B+R"
+
+    path = str(tmp_path / "games.sgf")
+    write_sgf(path, [record, record])
+    games = list(iter_games(path))
+    assert len(games) == 2
+    name, game = games[0]
+    assert name == path
+    assert game.moves == record.moves
+    assert game.komi == 7.5
+    assert game.result == "B+R"
+    assert game.properties["PB"] == "mcts"
+
+
+def test_iter_games_from_archives(tmp_path):
+    data = (GAME + "\n").encode("utf-8")
+    tar_path = tmp_path / "games.tar.gz"
+    with tarfile.open(tar_path, "w:gz") as archive:
+        for name in ["a.sgf", "b.sgf", "readme.txt"]:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    zip_path = tmp_path / "games.zip"
+    with zipfile.ZipFile(zip_path, "w") as archive:
+        archive.writestr("c.sgf", data + b"(;SZ[9];B[zz])")
+
+    names = [name for name, _ in iter_games(str(tar_path))]
+    assert names == [f"{tar_path}/a.sgf", f"{tar_path}/b.sgf"]
+    with pytest.raises(SgfError):
+        list(iter_games(str(zip_path)))
+    assert len(list(iter_games(str(zip_path), skip_errors=True))) == 1
+    assert len(list(iter_games(str(tmp_path), skip_errors=True))) == 3
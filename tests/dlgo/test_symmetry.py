@@ -0,0 +1,133 @@
+"""
+This file was initially generated using an AI language model (Claude 3.5 Sonnet),
+as part of an educational project based on the book "Deep Learning and the Game of Go"
+by Max Pumperla and Kevin Ferguson (Manning Publications, 2019).
+
+The generated code has been reviewed, potentially modified, and adapted to fit the
+project's requirements and to ensure correctness and adherence to the book's concepts.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from dlgo.agent.random_bot import RandomBot
+from dlgo.board import Board
+from dlgo.encoders.oneplane import OnePlaneEncoder
+from dlgo.gamestate import GameState
+from dlgo.gotypes import Point
+from dlgo.symmetry import (
+    NUM_SYMMETRIES,
+    augment_batch,
+    canonical_hash,
+    deduplicate,
+    inverse_symmetry,
+    transform_labels,
+    transform_planes,
+    transform_point,
+)
+
+
+@pytest.fixture
+def encoder():
+    return OnePlaneEncoder((5, 5))
+
+
+def test_symmetries_are_distinct():
+    plane = np.arange(25).reshape(5, 5)
+    transformed = {transform_planes(plane, s).tobytes() for s in range(NUM_SYMMETRIES)}
+    assert len(transformed) == NUM_SYMMETRIES
+    assert np.array_equal(transform_planes(plane, 0), plane)
+
+
+def test_inverse_symmetry():
+    plane = np.arange(25).reshape(5, 5)
+    for symmetry in range(NUM_SYMMETRIES):
+        restored = transform_planes(transform_planes(plane, symmetry), inverse_symmetry(symmetry))
+        assert np.array_equal(restored, plane)
+
+
+def test_labels_follow_planes(encoder):
+    for symmetry in range(NUM_SYMMETRIES):
+        for index in range(25):
+            plane = np.zeros((1, 5, 5))
+            point = encoder.decode_point_index(index)
+            plane[0, point.row - 1, point.col - 1] = 1
+            new_plane = transform_planes(plane, symmetry)
+            new_index = transform_labels(np.array([index]), (5, 5), symmetry)[0]
+            new_point = encoder.decode_point_index(new_index)
+            assert new_plane[0, new_point.row - 1, new_point.col - 1] == 1
+            assert transform_point(point, 5, symmetry) == new_point
+
+
+def test_labels_off_the_board_are_kept():
+    labels = np.array([-1, 3, 25], dtype=np.int16)
+    transformed = transform_labels(labels, 5, 1)
+    assert transformed.dtype == np.int16
+    assert transformed[0] == -1 and transformed[2] == 25
+
+
+def test_non_square_boards_only_allow_some_symmetries():
+    plane = np.zeros((3, 5))
+    assert transform_planes(plane, 2).shape == (3, 5)
+    with pytest.raises(ValueError):
+        transform_planes(plane, 1)
+
+
+def test_augment_batch():
+    rng = np.random.default_rng(0)
+    features = rng.integers(-1, 2, size=(32, 2, 5, 5)).astype(np.float32)
+    labels = rng.integers(0, 25, size=32)
+    dense = np.eye(25, dtype=np.float32)[labels]
+
+    new_features, new_labels, symmetries = augment_batch(features, labels, rng=rng)
+    _, new_dense, _ = augment_batch(features, dense, symmetries=symmetries)
+
+    assert len(set(symmetries.tolist())) > 1
+    assert np.array_equal(new_dense.argmax(axis=1), new_labels)
+    for i, symmetry in enumerate(symmetries):
+        assert np.array_equal(new_features[i], transform_planes(features[i], int(symmetry)))
+
+
+def test_canonical_hash_is_the_smallest_board_hash():
+    random.seed(3)
+    bot = RandomBot()
+    game = GameState.new_game(9)
+    for _ in range(20):
+        game = game.apply_move(bot.select_move(game))
+    stones = game.board.stone_array()
+
+    board_hashes = []
+    for symmetry in range(NUM_SYMMETRIES):
+        board = Board(9, 9)
+        for row in range(1, 10):
+            for col in range(1, 10):
+                color = game.board.get_go_string_color(Point(row, col))
+                if color is not None:
+                    board.place_stone(color, transform_point(Point(row, col), 9, symmetry))
+        board_hashes.append(board.zobrist_hash())
+
+    code, symmetry = canonical_hash(stones)
+    assert code == min(board_hashes)
+    assert code == board_hashes[symmetry]
+    for symmetry in range(NUM_SYMMETRIES):
+        assert canonical_hash(np.ascontiguousarray(transform_planes(stones, symmetry)))[0] == code
+
+
+def test_canonical_hash_of_empty_board():
+    assert canonical_hash(np.zeros((9, 9), dtype=np.int8)) == (Board(9, 9).zobrist_hash(), 0)
+    assert canonical_hash(np.zeros((9, 8), dtype=np.int8))[0] == Board(9, 8).zobrist_hash()
+
+
+def test_deduplicate():
+    stones = np.zeros((4, 5, 5), dtype=np.int8)
+    stones[0, 0, 0] = 1
+    stones[1, 4, 4] = 1  # Same as the first position, rotated
+    stones[2, 0, 1] = 1
+    stones[3, 0, 0] = 1
+    labels = np.array([6, 18, 6, 0])
+
+    assert deduplicate(stones).tolist() == [0, 2]
+    # The second position replies symmetrically to the first, the last one plays elsewhere.
+    assert deduplicate(stones, labels).tolist() == [0, 2, 3]